@@ -1,6 +1,7 @@
 import importlib
 import os
 from pathlib import Path
+from time import perf_counter
 import pandas as pd
 
 
@@ -8,8 +9,18 @@ import click
 import pytest
 
 from lac_validator import lac_validator
-from lac_validator.ingress import read_from_text
+from lac_validator.datastore import get_la_df, get_postcodes
+from lac_validator.cache import ProviderInfoCache, ResultCache
+from lac_validator.ingress import (
+    read_csv,
+    read_csv_with_converters,
+    read_from_text,
+    read_xml_from_text,
+    read_xml_from_tree,
+)
+from lac_validator.postcode_index import POSTCODE_INDEX_VARIABLE, PostcodeIndex
 from lac_validator.report import Report
+from lac_validator.rules.ruleset_utils import RULES_DIR, get_ruleset, write_manifest
 from lac_validator.utils import process_uploaded_files
 from lac_validator.config import column_names
 
@@ -33,8 +44,7 @@ def list_cmd(ruleset):
 
     :return cli output: list of rules in validation year.
     """
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
     for _, rule in ruleset_registry.items():
         click.echo(f"{rule.code}\t{rule.message}")
 
@@ -54,8 +64,7 @@ def rule_info_cmd(ruleset):
     :return cli output: tables of rules to be run in a year with message, affected fields,
                         affected tables, and CSV download of info.
     """
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
     rules_list = []
     for _, rule in ruleset_registry.items():
         rules_list.append(
@@ -76,6 +85,50 @@ def rule_info_cmd(ruleset):
     rule_info.to_csv(f"output_data/903_{ruleset[3:]}_rule_info.csv", index=False)
 
 
+# MANIFEST
+@cli.command(name="manifest")
+@click.option(
+    "--ruleset",
+    "-r",
+    default=None,
+    help="validation year e.g lac2025_26, all years if not given",
+)
+def manifest_cmd(ruleset):
+    """
+    Writes the manifest listing the rules of each ruleset, which lets rules be listed without
+    importing them. Run this after adding, changing or deleting rules.
+
+    :param str ruleset: validation year whose manifest should be written.
+    """
+    rulesets = (
+        [ruleset]
+        if ruleset
+        else sorted(path.parent.name for path in RULES_DIR.glob("lac*/__init__.py"))
+    )
+    for name in rulesets:
+        click.echo(f"Wrote {write_manifest(name)}")
+
+
+# POSTCODE INDEX
+@cli.command(name="postcode-index")
+@click.argument("directory", type=click.Path(file_okay=False), required=False)
+def postcode_index_cmd(directory):
+    """
+    Builds the index that postcodes and upper tier local authorities are looked up in, from the
+    postcode and local authority reference data. Validations use it once LAC_VALIDATOR_POSTCODE_INDEX
+    is set to its directory. Run this again after updating the reference data.
+
+    :param str directory: directory to build the index in, LAC_VALIDATOR_POSTCODE_INDEX if not given.
+    """
+    directory = directory or os.getenv(POSTCODE_INDEX_VARIABLE)
+    if not directory:
+        raise click.UsageError(
+            f"Give a directory to build the index in, or set {POSTCODE_INDEX_VARIABLE}"
+        )
+    index = PostcodeIndex.build(directory, get_postcodes(), get_la_df())
+    click.echo(f"Indexed {len(index)} postcodes in {directory}")
+
+
 # TEST
 @cli.command(name="test")
 @click.option(
@@ -133,7 +186,33 @@ def test_one_rule(code, ruleset):
     help="validation year e.g lac2025_26",
 )
 @click.option("--select", "-s", default=None)
-def run_all(p4a_path, ad1_path, ruleset, select):
+@click.option(
+    "--workers",
+    "-w",
+    default=None,
+    type=int,
+    help="number of processes to run rules across",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="report the time and memory taken by each step and the slowest rules",
+)
+@click.option(
+    "--partitions",
+    "-p",
+    default=None,
+    type=int,
+    help="number of partitions to split children into, to validate large files in less memory",
+)
+@click.option(
+    "--categorical-codes",
+    is_flag=True,
+    help="hold coded fields as categorical columns, to validate large files in less memory",
+)
+def run_all(
+    p4a_path, ad1_path, ruleset, select, workers, profile, partitions, categorical_codes
+):
     """
     created with code from offlinedebug.py
 
@@ -142,6 +221,10 @@ def run_all(p4a_path, ad1_path, ruleset, select):
 
     :param str ruleset: validation year.
     :param str select: code of specific rule that should be run.
+    :param int workers: number of processes to run rules across.
+    :param bool profile: whether to report the time and memory taken by the validation.
+    :param int partitions: number of partitions to split children into and run rules on in turn.
+    :param bool categorical_codes: whether to hold coded fields as categorical columns.
     """
     # p4a_path = "tests\\fake_data\placed_for_adoption_errors.csv"
     # ad1_path = "tests\\fake_data\\ad1.csv"
@@ -152,27 +235,34 @@ def run_all(p4a_path, ad1_path, ruleset, select):
 
     # the rest of the metadata is added in read_from_text() when instantiating Validator
     metadata = {"collectionYear": "2022", "localAuthority": "E09000027"}
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
 
     v = lac_validator.LacValidator(
         metadata=metadata,
         files=files_list,
         registry=ruleset_registry,
         selected_rules=None,
+        workers=workers,
+        trace_memory=profile,
+        cache=ResultCache.from_env(),
+        provider_info_cache=ProviderInfoCache.from_env(),
+        partitions=partitions,
+        categorical_codes=categorical_codes,
     )
     results = v.ds_results
 
     click.echo(v.ds_results)
     click.echo(f"skipped {v.skips}")
     click.echo(f"done: {v.dones}")
+    if profile:
+        click.echo(v.profile.summary().to_string(index=False))
 
     r = Report(results, ruleset_registry)
     # click.echo(f"*****************Error report******************")
     # click.echo(r.error_report)
     # click.echo(f"****************Error summary******************")
     # click.echo(r.error_summary)
-    # full_issue_df = lac_validator.create_issue_df(r.report, r.error_report)
+    # full_issue_df = lac_validator.create_issue_df(r.error_flags, r.error_report)
     # click.echo(f"*****************full issue df******************")
     # click.echo(full_issue_df)
 
@@ -187,7 +277,33 @@ def run_all(p4a_path, ad1_path, ruleset, select):
     help="validation year e.g lac2025_26",
 )
 @click.option("--select", "-s", default=None)
-def run_all(filename: str, ruleset, select):
+@click.option(
+    "--workers",
+    "-w",
+    default=None,
+    type=int,
+    help="number of processes to run rules across",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="report the time and memory taken by each step and the slowest rules",
+)
+@click.option(
+    "--partitions",
+    "-p",
+    default=None,
+    type=int,
+    help="number of partitions to split children into, to validate large files in less memory",
+)
+@click.option(
+    "--categorical-codes",
+    is_flag=True,
+    help="hold coded fields as categorical columns, to validate large files in less memory",
+)
+def run_all(
+    filename: str, ruleset, select, workers, profile, partitions, categorical_codes
+):
     """
     CLI command to run the validator offline, primarily to test ingress
 
@@ -196,6 +312,10 @@ def run_all(filename: str, ruleset, select):
 
     :param str ruleset: validation year.
     :param str select: code of specific rule that should be run.
+    :param int workers: number of processes to run rules across.
+    :param bool profile: whether to report the time and memory taken by the validation.
+    :param int partitions: number of partitions to split children into and run rules on in turn.
+    :param bool categorical_codes: whether to hold coded fields as categorical columns.
     """
     ad1 = f"{filename}/ad1.csv"
     episodes = f"{filename}/episodes.csv"
@@ -228,14 +348,19 @@ def run_all(filename: str, ruleset, select):
 
     # the rest of the metadata is added in read_from_text() when instantiating Validator
     metadata = {"collectionYear": "2023", "localAuthority": "E09000027"}
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
 
     v = lac_validator.LacValidator(
         metadata=metadata,
         files=files_list,
         registry=ruleset_registry,
         selected_rules=None,
+        workers=workers,
+        trace_memory=profile,
+        cache=ResultCache.from_env(),
+        provider_info_cache=ProviderInfoCache.from_env(),
+        partitions=partitions,
+        categorical_codes=categorical_codes,
     )
 
     click.echo(v.dfs)
@@ -243,8 +368,10 @@ def run_all(filename: str, ruleset, select):
     results = v.ds_results
 
     r = Report(results, ruleset_registry)
-    full_issue_df = lac_validator.create_issue_df(r.report, r.error_report)
+    full_issue_df = lac_validator.create_issue_df(r.error_flags, r.error_report)
     click.echo(full_issue_df)
+    if profile:
+        click.echo(v.profile.summary().to_string(index=False))
 
 
 # XML to tables
@@ -261,5 +388,53 @@ def xmltocsv(p4a_path):
     click.echo(data_files)
 
 
+# Ingress benchmark
+@cli.command(name="benchmark-ingress")
+@click.argument("paths", type=click.Path(exists=True, dir_okay=False), nargs=-1)
+@click.option(
+    "--repeat",
+    "-n",
+    default=3,
+    type=int,
+    help="number of times to read each file, the fastest is reported",
+)
+def benchmark_ingress(paths, repeat):
+    """
+    Compares how fast CSV and XML files are read by read_csv and read_xml_from_text and by the
+    readers they replaced, and checks that both give the same tables.
+
+    CLI command:
+    python -m lac_validator benchmark-ingress <filepath_> ...
+
+    :param list paths: CSV or XML files to read.
+    :param int repeat: number of times to read each file.
+    """
+    for path in paths:
+        content = Path(path).read_bytes()
+        size_mb = len(content) / 1024 / 1024
+        if path.lower().endswith(".xml"):
+            old_reader, new_reader = read_xml_from_tree, read_xml_from_text
+        else:
+            old_reader, new_reader = read_csv_with_converters, read_csv
+        tables = {}
+        for reader in (old_reader, new_reader):
+            times = []
+            for _ in range(repeat):
+                start = perf_counter()
+                tables[reader] = reader(content)
+                times.append(perf_counter() - start)
+            click.echo(
+                f"{path} {reader.__name__}: {min(times):.3f}s, {size_mb / min(times):.1f} MB/s"
+            )
+        old_tables, new_tables = tables[old_reader], tables[new_reader]
+        if isinstance(old_tables, dict):
+            same = list(old_tables) == list(new_tables) and all(
+                df.equals(new_tables[name]) for name, df in old_tables.items()
+            )
+        else:
+            same = old_tables.equals(new_tables)
+        click.echo(f"{path} same tables: {same}")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,320 @@
+import hashlib
+import importlib.metadata
+import importlib.util
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Union
+
+from pandas import DataFrame
+
+from lac_validator.datastore import DataStore
+from lac_validator.executor import RuleRun
+from lac_validator.rule_engine import RuleDefinition, table_names
+from lac_validator.types import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+# Set to a directory to keep rule results between validations, see ResultCache.from_env.
+CACHE_DIR_VARIABLE = "LAC_VALIDATOR_CACHE_DIR"
+CACHE_SIZE_VARIABLE = "LAC_VALIDATOR_CACHE_MB"
+
+DEFAULT_MAX_SIZE_MB = 256
+
+# Subdirectory of the cache directory that ProviderInfoCache keeps its tables in.
+PROVIDER_INFO_DIR = "provider_info"
+
+# Packages of the reference data used to infer the local authority of each provider.
+REFERENCE_DATA_PACKAGES = [
+    "quality-lac-data-ref-postcodes",
+    "quality-lac-data-ref-authorities",
+]
+
+
+@lru_cache(maxsize=None)
+def _source_hash(module_name: str) -> str:
+    # rules read from a manifest may not have been imported yet.
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    source_file = spec.origin if spec is not None else None
+    if source_file is None or not Path(source_file).is_file():
+        return module_name
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _reference_data_version() -> str:
+    versions = []
+    for package in REFERENCE_DATA_PACKAGES:
+        try:
+            versions.append(importlib.metadata.version(package))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(package)
+    return ",".join(versions)
+
+
+@lru_cache(maxsize=None)
+def _code_hash() -> str:
+    """
+    Identifies a version of the code that rules run on: every module of the package other than
+    the rules themselves, which are hashed one by one, and the versions of pandas and numpy. Any of
+    them can change what rules return, e.g. through the dates and derived tables of the datastore.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        relative = path.relative_to(package_dir)
+        # the rules of each year, e.g. rules/lac2023_24/rule_101.py, are hashed one by one.
+        year_rule = len(relative.parts) == 3 and relative.name.startswith("rule_")
+        if relative.parts[0] == "rules" and year_rule:
+            continue
+        digest.update(relative.as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for package in ["pandas", "numpy"]:
+        digest.update(f"{package}=={importlib.metadata.version(package)}".encode())
+    return digest.hexdigest()
+
+
+def _evict(directory: Path, max_size: int):
+    """
+    Removes the least recently used files from directory until they fit in max_size bytes.
+    """
+    entries = []
+    for path in directory.glob("*.pickle"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(entry_size for _, entry_size, _ in entries)
+    for _, entry_size, path in sorted(entries):
+        if size <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        size -= entry_size
+
+
+def _write(path: Path, entry):
+    # write to a temporary file first so that other processes never read a partly written entry.
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        pickle.dump(entry, file)
+    os.replace(file.name, path)
+
+
+def _rule_hash(rule: RuleDefinition) -> str:
+    """
+    Identifies a version of a rule. Results are no longer used once the source of the rule, or any
+    other code it runs on, is changed, see _code_hash.
+    """
+    return "".join(
+        [
+            rule.code,
+            rule.func.__module__,
+            rule.func.__qualname__,
+            _source_hash(rule.func.__module__),
+            _code_hash(),
+        ]
+    )
+
+
+class ResultCache:
+    """
+    Rule results kept on disk between validations, so that a rule is not run again on data it has
+    already been run on.
+
+    Results are looked up by the rule, the code it runs on, the metadata, the tables uploaded and the
+    content of the tables the rule declares. As some rules also read tables they do not declare, each
+    result records the content of every table the rule read, and is only used if all of them are unchanged.
+
+    Once the files in the cache take up more than max_size bytes, the least recently used ones are removed.
+
+    Entries are pickled, and loading a pickle can run any code it holds, so the directory must only be
+    writable by the processes using the cache. It is created accessible to its owner only.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @classmethod
+    def from_env(cls) -> Optional["ResultCache"]:
+        """
+        :return: a cache in the directory set in LAC_VALIDATOR_CACHE_DIR, holding up to LAC_VALIDATOR_CACHE_MB
+            megabytes, or None if no directory is set.
+        :rtype: ResultCache
+        """
+        directory = os.getenv(CACHE_DIR_VARIABLE)
+        if not directory:
+            return None
+        max_size_mb = int(os.getenv(CACHE_SIZE_VARIABLE, DEFAULT_MAX_SIZE_MB))
+        return cls(directory, max_size=max_size_mb * 1024 * 1024)
+
+    def _key(self, rule: RuleDefinition, data_store: DataStore) -> str:
+        digest = hashlib.sha256(_rule_hash(rule).encode())
+        digest.update(data_store.content_hash("metadata").encode())
+        # rules can behave differently depending on which tables were uploaded at all.
+        digest.update(repr(sorted(data_store)).encode())
+        for table in sorted(table_names(rule) & set(data_store)):
+            digest.update(table.encode())
+            digest.update(data_store.content_hash(table).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, rule: RuleDefinition, data_store: DataStore) -> Optional[RuleRun]:
+        """
+        :param RuleDefinition rule: the rule to be run.
+        :param DataStore data_store: datastore as returned by create_datastore.
+
+        :return: the result of the rule on this data and the tables it used, or None if it is not in the cache.
+        :rtype: RuleRun
+        """
+        path = self._path(self._key(rule, data_store))
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Could not read cached result of {rule.code} from {path}")
+            return None
+
+        if "checked" not in entry or any(
+            table not in data_store or data_store.content_hash(table) != content_hash
+            for table, content_hash in entry["tables"].items()
+        ):
+            return None
+
+        # mark the result as recently used.
+        os.utime(path)
+        return RuleRun(
+            entry["result"],
+            tables_used=set(entry["tables"]) | {"metadata"},
+            tables_checked=set(entry["checked"]),
+        )
+
+    def put(self, rule: RuleDefinition, data_store: DataStore, run: RuleRun):
+        """
+        :param RuleDefinition rule: the rule that was run.
+        :param DataStore data_store: datastore as returned by create_datastore, that the rule was run on.
+        :param RuleRun run: the result of the rule and the tables it used.
+        """
+        entry = {
+            "tables": {
+                table: data_store.content_hash(table)
+                for table in sorted(run.tables_used)
+                if table != "metadata"
+            },
+            "checked": sorted(run.tables_checked),
+            "result": run.result,
+        }
+        _write(self._path(self._key(rule, data_store)), entry)
+
+    def evict(self):
+        """
+        Removes the least recently used results until the cache fits in max_size.
+        """
+        _evict(self.directory, self.max_size)
+
+
+class ProviderInfoCache:
+    """
+    Provider info tables made from the Ofsted Childrens Homes and Social Care Providers lists, kept on
+    disk between validations. The lists are the same for every local authority in a given month, so
+    once a table is made from them, later uploads of the same lists load it instead of reading them.
+
+    Tables are looked up by the content of the uploaded lists and the box each was uploaded to. They
+    are no longer used once the code of the package, or the postcode and local authority reference
+    data used to infer the local authority of each provider, changes.
+
+    Once the files in the cache take up more than max_size bytes, the least recently used ones are removed.
+
+    Entries are pickled, and loading a pickle can run any code it holds, so the directory must only be
+    writable by the processes using the cache. It is created accessible to its owner only.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @classmethod
+    def from_env(cls) -> Optional["ProviderInfoCache"]:
+        """
+        :return: a cache in the provider_info subdirectory of the directory set in LAC_VALIDATOR_CACHE_DIR,
+            holding up to LAC_VALIDATOR_CACHE_MB megabytes, or None if no directory is set.
+        :rtype: ProviderInfoCache
+        """
+        directory = os.getenv(CACHE_DIR_VARIABLE)
+        if not directory:
+            return None
+        max_size_mb = int(os.getenv(CACHE_SIZE_VARIABLE, DEFAULT_MAX_SIZE_MB))
+        return cls(
+            Path(directory) / PROVIDER_INFO_DIR, max_size=max_size_mb * 1024 * 1024
+        )
+
+    def _key(self, uploads: List[UploadedFile]) -> str:
+        digest = hashlib.sha256(_code_hash().encode())
+        digest.update(_reference_data_version().encode())
+        for upload in uploads:
+            content = upload["file_content"]
+            if not isinstance(content, bytes):
+                content = content.tobytes()
+            digest.update(upload["description"].encode())
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, uploads: List[UploadedFile]) -> Optional[DataFrame]:
+        """
+        :param list uploads: the uploaded Childrens Homes and Social Care Providers lists.
+
+        :return: the provider info table made from these lists, or None if it is not in the cache.
+        :rtype: DataFrame
+        """
+        path = self._path(self._key(uploads))
+        try:
+            with open(path, "rb") as file:
+                provider_info = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Could not read cached provider info from {path}")
+            return None
+
+        # mark the table as recently used.
+        os.utime(path)
+        return provider_info
+
+    def put(self, uploads: List[UploadedFile], provider_info: DataFrame):
+        """
+        :param list uploads: the uploaded Childrens Homes and Social Care Providers lists.
+        :param DataFrame provider_info: the provider info table made from them.
+        """
+        _write(self._path(self._key(uploads)), provider_info)
+
+    def evict(self):
+        """
+        Removes the least recently used tables until the cache fits in max_size.
+        """
+        _evict(self.directory, self.max_size)
@@ -0,0 +1,84 @@
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+class ChildIndex:
+    """
+    Which children are in each table of a datastore, for answering whether the children in one
+    table are in another without merging the tables.
+
+    The CHILD columns of every table, this year's and last year's, are numbered together in one
+    pass, so each table becomes an array of child numbers and a table of which numbers it holds.
+    Missing CHILD values are numbered like any other value, as merges on CHILD match them too.
+
+    Children are numbered in sorted CHILD order, so the numbers also serve as integer codes for
+    grouping or joining rows by child, see codes().
+    """
+
+    def __init__(self, data_store: Mapping[str, Any]):
+        tables = [
+            table
+            for table, df in data_store.items()
+            if table != "metadata" and "CHILD" in df
+        ]
+        children = [
+            data_store[table]["CHILD"].to_numpy(dtype=object) for table in tables
+        ]
+        values = np.concatenate(children) if children else np.array([], dtype=object)
+        try:
+            numbers, uniques = pd.factorize(values, sort=True, use_na_sentinel=False)
+        except TypeError:
+            # CHILD values of different types cannot be sorted.
+            numbers, uniques = pd.factorize(values, use_na_sentinel=False)
+        ends = np.cumsum([len(table_children) for table_children in children])
+        starts = ends - [len(table_children) for table_children in children]
+
+        # the CHILD value each number stands for.
+        self.children = uniques
+        self._numbers: dict[str, np.ndarray] = {}
+        self._present: dict[str, np.ndarray] = {}
+        # which numbers stand for a missing CHILD.
+        self._missing = pd.isna(uniques)
+        for table, start, end in zip(tables, starts, ends):
+            self._numbers[table] = numbers[start:end]
+            present = np.zeros(len(uniques), dtype=bool)
+            present[self._numbers[table]] = True
+            self._present[table] = present
+
+    def __contains__(self, table: str) -> bool:
+        return table in self._numbers
+
+    def codes(self, table: str) -> np.ndarray:
+        """
+        :param str table: name of the table.
+
+        :return: the number of the child in each row of table, or -1 for rows with no CHILD. The
+            same child has the same number in every table of the datastore.
+        :rtype: np.ndarray
+        """
+        numbers = self._numbers[table]
+        return np.where(self._missing[numbers], -1, numbers)
+
+    def not_in(self, table: str, other: str) -> np.ndarray:
+        """
+        :param str table: table whose rows are checked.
+        :param str other: table the children should be in.
+
+        :return: for each row of table, whether its child has no rows in other.
+        :rtype: np.ndarray
+        """
+        return ~self._present[other][self._numbers[table]]
+
+    def duplicated(self, table: str) -> np.ndarray:
+        """
+        :param str table: table whose rows are checked.
+
+        :return: for each row of table, whether its child has other rows in the table. Rows with
+            no CHILD are never duplicates, as groupby leaves them out.
+        :rtype: np.ndarray
+        """
+        numbers = self._numbers[table]
+        counts = np.bincount(numbers, minlength=len(self._missing))
+        return (counts[numbers] > 1) & ~self._missing[numbers]
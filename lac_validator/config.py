@@ -63,3 +63,138 @@ column_names = {
     "SWEpisodes": ["CHILD", "DOB", "SW_ID", "SW_DECOM", "SW_DEC", "SW_REASON"],
     "DoLo": ["CHILD", "DOB", "DOLO_START", "DOLO_END"],
 }
+
+"""
+Codes each coded 903 field can take, across the collection years, as listed in the rules that check them.
+
+These are used when reading coded fields into categorical columns, see ingress.codes_to_categorical.
+"""
+
+code_lists = {
+    "SEX": ["1", "2"],
+    "ETHNIC": [
+        "WBRI",
+        "WIRI",
+        "WOTH",
+        "WIRT",
+        "WROM",
+        "MWBC",
+        "MWBA",
+        "MWAS",
+        "MOTH",
+        "AIND",
+        "APKN",
+        "ABAN",
+        "AOTH",
+        "BCRB",
+        "BAFR",
+        "BOTH",
+        "CHNE",
+        "OOTH",
+        "REFU",
+        "NOBT",
+    ],
+    "RNE": ["S", "P", "L", "T", "U", "B"],
+    "LS": [
+        "C1",
+        "C2",
+        "D1",
+        "E1",
+        "V2",
+        "V3",
+        "V4",
+        "J1",
+        "J2",
+        "J3",
+        "L1",
+        "L2",
+        "L3",
+    ],
+    "CIN": ["N1", "N2", "N3", "N4", "N5", "N6", "N7", "N8"],
+    "PLACE": [
+        "A3",
+        "A4",
+        "A5",
+        "A6",
+        "H5",
+        "K1",
+        "K2",
+        "K3",
+        "P1",
+        "P2",
+        "P3",
+        "R1",
+        "R2",
+        "R3",
+        "R5",
+        "S1",
+        "T0",
+        "T1",
+        "T2",
+        "T3",
+        "T4",
+        "U1",
+        "U2",
+        "U3",
+        "U4",
+        "U5",
+        "U6",
+        "Z1",
+        "Z11",
+        "Z12",
+        "Z13",
+        "Z14",
+    ],
+    "PLACE_PROVIDER": ["PR0", "PR1", "PR2", "PR3", "PR4", "PR5"],
+    "REC": [
+        "E11",
+        "E12",
+        "E2",
+        "E3",
+        "E4A",
+        "E4B",
+        "E13",
+        "E41",
+        "E45",
+        "E46",
+        "E47",
+        "E48",
+        "E5",
+        "E6",
+        "E7",
+        "E8",
+        "E9",
+        "E14",
+        "E15",
+        "E16",
+        "E17",
+        "X1",
+    ],
+    "REASON_PLACE_CHANGE": [
+        "CARPL",
+        "CLOSE",
+        "ALLEG",
+        "STAND",
+        "APPRR",
+        "CREQB",
+        "CREQO",
+        "CHILD",
+        "LAREQ",
+        "PLACE",
+        "CUSTOD",
+        "OTHER",
+    ],
+    "REVIEW_CODE": ["PN0", "PN1", "PN2", "PN3", "PN4", "PN5", "PN6", "PN7"],
+    "SW_REASON": [
+        "MANAGE",
+        "FCONTA",
+        "LEFTRL",
+        "ORGRST",
+        "TSPROC",
+        "ABSENC",
+        "CHCHAN",
+        "PCCHAN",
+        "SWDIED",
+        "OTHERS",
+    ],
+}
@@ -1,38 +1,459 @@
+import hashlib
 import logging
 import os
 from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+)
 
 import numpy as np
 import pandas as pd
-import qlacref_authorities
 from pandas import DataFrame
-from qlacref_postcodes import Postcodes
+
+from lac_validator.child_index import ChildIndex
+from lac_validator.postcode_index import POSTCODE_INDEX_VARIABLE, PostcodeIndex
+from lac_validator.profiling import Profile
+
+if TYPE_CHECKING:
+    from qlacref_postcodes import Postcodes
 
 logger = logging.getLogger(__name__)
 
 # TODO security point. remove this line.
 os.environ["QLACREF_PC_INSECURE"] = "True"
 
-la_df = pd.DataFrame.from_records(qlacref_authorities.records)
-logger.info("Loaded authorities")
 
-# A bit of a hack, but will keep things working
-if os.getenv("QLACREF_PC_KEY") is None:
-    key_file = Path(__file__).parent.parent / ".qlacref/id_rsa.pub"
-    if key_file.is_file():
-        logger.warning(
-            "Using repository key for pickle signature. "
-            "To stay safe from tampering, set the key path in 'QLACREF_PC_KEY'"
+# The reference data is only loaded when first used, so that importing the validator stays quick
+# for callers that never create a datastore, such as listing the rules.
+def _read_la_df() -> DataFrame:
+    import qlacref_authorities
+
+    la_df = pd.DataFrame.from_records(qlacref_authorities.records)
+    logger.info("Loaded authorities")
+    return la_df
+
+
+def _new_postcodes() -> "Postcodes":
+    from qlacref_postcodes import Postcodes
+
+    # A bit of a hack, but will keep things working
+    if os.getenv("QLACREF_PC_KEY") is None:
+        key_file = Path(__file__).parent.parent / ".qlacref/id_rsa.pub"
+        if key_file.is_file():
+            logger.warning(
+                "Using repository key for pickle signature. "
+                "To stay safe from tampering, set the key path in 'QLACREF_PC_KEY'"
+            )
+            os.environ["QLACREF_PC_KEY"] = str(key_file.absolute())
+
+    postcodes = Postcodes()
+    logger.info("Initialised Postcodes")
+    return postcodes
+
+
+@lru_cache(maxsize=None)
+def get_la_df() -> DataFrame:
+    """
+    :return: the lower tier local authorities (LTLA21CD, LTLA21NM) and the upper tier local
+        authorities they are in (UTLA21CD, UTLA21NM).
+    :rtype: DataFrame
+    """
+    return _read_la_df()
+
+
+@lru_cache(maxsize=None)
+def get_postcodes() -> "Postcodes":
+    """
+    :return: the postcode reference data, which loads the postcodes of each letter as they are needed.
+    :rtype: Postcodes
+    """
+    return _new_postcodes()
+
+
+@lru_cache(maxsize=None)
+def get_postcode_index() -> Optional[PostcodeIndex]:
+    """
+    :return: if built, the index that postcodes and upper tier local authorities are looked up in
+        instead of loading the reference data, see PostcodeIndex.from_env.
+    :rtype: PostcodeIndex
+    """
+    return PostcodeIndex.from_env()
+
+
+def warm_up(postcode_letters: str = ""):
+    """
+    Loads the reference data now rather than when it is first used, for long-lived processes that
+    should not make their first validation wait for it.
+
+    If LAC_VALIDATOR_POSTCODE_INDEX is set, the index there is built first unless another process
+    already has, see PostcodeIndex.publish. Every process using it then shares one copy of the
+    reference data, and loads none of it into its own memory.
+
+    :param str postcode_letters: letters whose postcodes are loaded too, if there is no postcode index.
+        Each letter takes tens of megabytes.
+    """
+    directory = os.getenv(POSTCODE_INDEX_VARIABLE)
+    if directory and get_postcode_index() is None:
+        PostcodeIndex.publish(directory, _new_postcodes, _read_la_df)
+        get_postcode_index.cache_clear()
+    if get_postcode_index() is not None:
+        return
+
+    get_la_df()
+    postcodes = get_postcodes()
+    if postcode_letters:
+        postcodes.load_postcodes(postcode_letters)
+
+
+def upper_tier_authorities(laua: pd.Series) -> DataFrame:
+    """
+    :param pd.Series laua: lower tier local authority codes.
+
+    :return: the code (UTLA21CD) and name (UTLA21NM) of the upper tier local authority of each of
+        laua, indexed from 0. Values are missing for codes that are not found.
+    :rtype: DataFrame
+    """
+    postcode_index = get_postcode_index()
+    if postcode_index is not None:
+        return postcode_index.upper_tier(laua)
+    return (
+        laua.to_frame("laua")
+        .reset_index(drop=True)
+        .merge(get_la_df(), how="left", left_on="laua", right_on="LTLA21CD")
+        .loc[:, ["UTLA21CD", "UTLA21NM"]]
+    )
+
+
+_REFERENCE_DATA = {
+    "la_df": get_la_df,
+    "postcodes": get_postcodes,
+    "postcode_index": get_postcode_index,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # la_df, postcodes and postcode_index used to be made on import, and can still be imported by name.
+    if name in _REFERENCE_DATA:
+        return _REFERENCE_DATA[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# The format of every date in the 903 return and in the collection metadata.
+DATE_FORMAT = "%d/%m/%Y"
+
+
+class _TableCache:
+    """
+    Values worked out from the tables of one datastore, such as parsed date columns, kept so that
+    they are only worked out once. They are worked out from the tables the datastore was created
+    with, so changes that rules make to their own copies never reach the cache.
+    """
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = dict(data)
+        self._dates: Dict[tuple, Any] = {}
+        self._hashes: Dict[str, str] = {}
+        self._derived: Dict[str, DataFrame] = {}
+        self._child_index: Optional[ChildIndex] = None
+
+    def dates(self, table: str, column: str) -> pd.Series:
+        key = (table, column)
+        if key not in self._dates:
+            self._dates[key] = pd.to_datetime(
+                self._data[table][column], format=DATE_FORMAT, errors="coerce"
+            )
+        return self._dates[key]
+
+    def metadata_date(self, key: str) -> pd.Timestamp:
+        cache_key = ("metadata", key)
+        if cache_key not in self._dates:
+            self._dates[cache_key] = pd.to_datetime(
+                self._data["metadata"][key], format=DATE_FORMAT, errors="coerce"
+            )
+        return self._dates[cache_key]
+
+    def derived(self, name: str, build: Callable[[Any], DataFrame]) -> DataFrame:
+        if name not in self._derived:
+            # built from the original tables, through a datastore that shares this cache.
+            source = DataStore(self._data)
+            source._cache = self
+            self._derived[name] = build(source)
+        return self._derived[name]
+
+    def child_index(self) -> ChildIndex:
+        if self._child_index is None:
+            self._child_index = ChildIndex(self._data)
+        return self._child_index
+
+    def unchanged(self, table: str, df: DataFrame, columns: Iterable[str]) -> bool:
+        """
+        Whether the columns of df hold the same values as in the original table, so that values
+        worked out from the original table also hold for df.
+        """
+        original = self._data.get(table)
+        if original is None or not (
+            df.index is original.index or df.index.equals(original.index)
+        ):
+            return False
+        for column in columns:
+            if column not in df or column not in original:
+                return False
+            values, original_values = df[column].to_numpy(), original[column].to_numpy()
+            # columns that share the original's memory, such as those of derived tables, are
+            # quicker to check.
+            if values.__array_interface__ == original_values.__array_interface__:
+                continue
+            if not df[column].equals(original[column]):
+                return False
+        return True
+
+    def content_hash(self, key: str) -> str:
+        if key not in self._hashes:
+            digest = hashlib.sha256()
+            if key == "metadata":
+                for name, value in sorted(self._data["metadata"].items()):
+                    digest.update(name.encode())
+                    _update_hash(digest, value)
+            else:
+                _update_hash(digest, self._data[key])
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+
+def _update_hash(digest, value):
+    if isinstance(value, DataFrame):
+        digest.update(repr(list(zip(value.columns, map(str, value.dtypes)))).encode())
+        digest.update(pd.util.hash_pandas_object(value).values.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+class DataStore(dict):
+    """
+    The tables and metadata that rules are run on, as returned by create_datastore.
+
+    Date columns that rules ask for through dates() are parsed on first use and cached, as are
+    tables that rules build from other tables through derived(). Every copy made with
+    copy_datastore shares the cache, so each is only worked out once per validation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _TableCache(self)
+
+    def dates(self, table: str, column: str) -> pd.Series:
+        """
+        :param str table: table name, e.g. 'Episodes' or 'Episodes_last'.
+        :param str column: name of a column holding dd/mm/YYYY dates.
+
+        :return: the column parsed to datetimes, with unparseable values as NaT.
+        :rtype: pd.Series
+        """
+        return self._cache.dates(table, column).copy()
+
+    def metadata_date(self, key: str) -> pd.Timestamp:
+        """
+        :param str key: metadata date key, e.g. 'collection_start' or 'collection_end'.
+
+        :return: the metadata value parsed to a datetime.
+        :rtype: pd.Timestamp
+        """
+        return self._cache.metadata_date(key)
+
+    def derived(
+        self, name: str, tables: list[str], build: Callable[[Any], DataFrame]
+    ) -> DataFrame:
+        """
+        A table worked out from other tables, such as each child's first episode, that several
+        rules use. It is built once per validation and shared by every copy of the datastore.
+
+        :param str name: name the table is cached under.
+        :param list tables: the tables it is built from.
+        :param Callable build: builds the table from a datastore.
+
+        :return: a copy of the table.
+        :rtype: pd.DataFrame
+        """
+        return self._cache.derived(name, build).copy()
+
+    def child_index(self, tables: list[str]) -> ChildIndex:
+        """
+        :param list tables: the tables whose children will be looked up.
+
+        :return: which children are in each table, worked out once per validation.
+        :rtype: ChildIndex
+        """
+        return self._cache.child_index()
+
+    def content_hash(self, key: str) -> str:
+        """
+        :param str key: table name, or 'metadata'.
+
+        :return: a hash of the content of the table as it was uploaded, which changes if any
+            of its values, columns or dtypes change.
+        :rtype: str
+        """
+        return self._cache.content_hash(key)
+
+
+class DataStoreView(MutableMapping):
+    """
+    A rule's own view of a DataStore.
+
+    Each table is copied the first time the rule asks for it, so whatever the rule does to it,
+    whether adding columns or writing values in place with .loc or inplace=True, stays in its view
+    and never reaches the datastore or any other rule. Tables the rule never asks for are not
+    copied at all.
+
+    Parsed dates and derived tables come from the datastore's cache unless the rule has changed
+    the tables they are worked out from in its view.
+    """
+
+    def __init__(self, data_store: DataStore):
+        self._data_store = data_store
+        self._tables: Dict[str, Any] = {}
+        self._removed: set = set()
+        self._used: set = set()
+        self._checked: set = set()
+
+    def __getitem__(self, key):
+        self._checked.add(key)
+        if key not in self._tables:
+            if key in self._removed:
+                raise KeyError(key)
+            value = self._data_store[key]
+            self._used.add(key)
+            self._tables[key] = value if key == "metadata" else value.copy()
+        return self._tables[key]
+
+    def __setitem__(self, key, value):
+        self._tables[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._tables.pop(key, None)
+        self._removed.add(key)
+
+    def __contains__(self, key):
+        # checked without copying the table, as rules often test for tables they don't use.
+        self._checked.add(key)
+        if key in self._tables:
+            return True
+        return key not in self._removed and key in self._data_store
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._data_store:
+            if key not in self._removed:
+                yield key
+        for key in self._tables:
+            if key not in self._data_store:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    @property
+    def tables_used(self) -> set:
+        """
+        The tables of the datastore that the rule has asked for.
+        """
+        return set(self._used)
+
+    @property
+    def tables_checked(self) -> set:
+        """
+        The names the rule has looked up in the datastore, whether or not they were uploaded,
+        e.g. with `"Episodes_last" in dfs`. A rule can behave differently if any of them is
+        uploaded or removed.
+        """
+        return set(self._checked)
+
+    def dates(self, table: str, column: str) -> pd.Series:
+        df = self[table]
+        if self._data_store._cache.unchanged(table, df, [column]):
+            return self._data_store.dates(table, column)
+        # the rule has changed the column or the rows in its view.
+        return pd.to_datetime(df[column], format=DATE_FORMAT, errors="coerce")
+
+    def metadata_date(self, key: str) -> pd.Timestamp:
+        self._used.add("metadata")
+        return self._data_store.metadata_date(key)
+
+    def derived(
+        self, name: str, tables: list[str], build: Callable[[Any], DataFrame]
+    ) -> DataFrame:
+        for table in tables:
+            self._checked.add(table)
+            self._used.add(table)
+        if all(self._unchanged(table) for table in tables):
+            return self._data_store.derived(name, tables, build)
+        return build(self)
+
+    def child_index(self, tables: list[str]) -> Optional[ChildIndex]:
+        for table in tables:
+            self._checked.add(table)
+            self._used.add(table)
+        if all(self._unchanged(table, ["CHILD"]) for table in tables):
+            return self._data_store.child_index(tables)
+        # the rule has changed the children in its view.
+        return None
+
+    def _unchanged(self, table: str, columns: Optional[list[str]] = None) -> bool:
+        if table in self._removed:
+            return False
+        if table not in self._tables:
+            return True
+        df = self._tables[table]
+        return self._data_store._cache.unchanged(
+            table, df, df.columns if columns is None else columns
         )
-        os.environ["QLACREF_PC_KEY"] = str(key_file.absolute())
 
-postcodes = Postcodes()
-logger.info("Initialised Postcodes")
 
+class SharedWriteGuard:
+    """
+    Checks that rules leave the datastore as it was. Rules only ever change their own copies of
+    the tables, see DataStoreView, so this is a check that this holds rather than a protection.
+
+    After a rule has run, the tables it used are compared with a copy of the datastore taken
+    before any rule ran. As whole tables are compared after every rule, this is meant for tests
+    rather than for every validation.
+    """
+
+    def __init__(self, data_store: DataStore):
+        self._data_store = data_store
+        self._originals = copy_datastore(data_store, deep=True)
 
-def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
+    def check(self, tables) -> list:
+        """
+        :param tables: names of the tables used by a rule, see DataStoreView.tables_used.
+
+        :return: names of the tables whose data was changed.
+        :rtype: list
+        """
+        return [
+            table
+            for table in tables
+            if table != "metadata"
+            and not self._data_store[table].equals(self._originals[table])
+        ]
+
+
+def create_datastore(
+    data: Dict[str, Any], metadata: Dict[str, Any], profile: Optional[Profile] = None
+):
     """
     Returns a dictionary with keys for
     - Every table name in config.py
@@ -44,19 +465,30 @@ def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
 
     :param data: Dict of raw DataFrames by name (from config.py) together with the '_last' data.
     :param metadata:
+    :param profile: if given, the time and memory taken by each step are added to it.
     """
     logger.info(", ".join(data.keys()))
+    if profile is None:
+        profile = Profile()
     data = copy(data)
-    data["metadata"] = _process_metadata(metadata)
-    if "Episodes" in data:
-        data["Episodes"] = _add_postcode_derived_fields(
-            data["Episodes"],
-            metadata["localAuthority"],
-        )
-    if "Episodes_last" in data:
-        data["Episodes_last"] = _add_postcode_derived_fields(
-            data["Episodes_last"], metadata["localAuthority"]
-        )
+    with profile.step("datastore", "metadata"):
+        data["metadata"] = _process_metadata(metadata)
+    episode_tables = [t for t in ["Episodes", "Episodes_last"] if t in data]
+    if episode_tables:
+        # postcodes repeat across episodes and years, so each is looked up once for both tables.
+        with profile.step("datastore", "postcodes"):
+            details = _postcode_details(
+                [
+                    data[table_name][field]
+                    for table_name in episode_tables
+                    for field in ["HOME_POST", "PL_POST"]
+                ]
+            )
+    for table_name in episode_tables:
+        with profile.step("datastore", f"{table_name} postcodes"):
+            data[table_name] = _add_postcode_derived_fields(
+                data[table_name], metadata["localAuthority"], details
+            )
     # quick n dirty fix for weird postcode related columns showing up in episode tables
     for table_name in ["Episodes", "Episodes_last"]:
         if table_name in data:
@@ -66,7 +498,7 @@ def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
 
     names_and_lengths = ", ".join(f"{t}: {len(data[t])} rows" for t in data)
     logger.info(f"Datastore created -- {names_and_lengths}")
-    return data
+    return DataStore(data)
 
 
 def _process_metadata(metadata):
@@ -78,16 +510,26 @@ def _process_metadata(metadata):
 
 def merge_postcodes(df: DataFrame, postcode_field: str) -> DataFrame:
     df[postcode_field] = df[postcode_field].str.upper()
+    pc_abbr_field = f"__{postcode_field}__abbr"
+
+    postcode_index = get_postcode_index()
+    if postcode_index is not None and not os.getenv("QLAC_DISABLE_PC"):
+        logger.info(f"Looking up {postcode_field} in the postcode index")
+        abbreviations = df[postcode_field].str.replace(" ", "").reset_index(drop=True)
+        return pd.concat(
+            [abbreviations.rename(pc_abbr_field), postcode_index.lookup(abbreviations)],
+            axis=1,
+        )
 
     key_field = f"__{postcode_field}__first_letter"
     df[key_field] = df[postcode_field].str[0]
     pcs = df[key_field].dropna().unique()
 
     logger.info(f"Loading the following postcode letters: {pcs}")
+    postcodes = get_postcodes()
     postcodes.load_postcodes(pcs)
 
     logger.info(f"Adding postcode abbreviations for {postcode_field}")
-    pc_abbr_field = f"__{postcode_field}__abbr"
     df[pc_abbr_field] = df[postcode_field].str.replace(" ", "")
 
     df_merged = df[[pc_abbr_field]].merge(
@@ -99,51 +541,104 @@ def merge_postcodes(df: DataFrame, postcode_field: str) -> DataFrame:
     return df_merged
 
 
-def _add_postcode_derived_fields(episodes_df, local_authority):
-    episodes_df = episodes_df.copy()
+def _postcode_details(postcode_columns: List[pd.Series]) -> DataFrame:
+    """
+    Looks up each distinct postcode in postcode_columns once.
 
-    home_details = merge_postcodes(episodes_df, "HOME_POST")
-    pl_details = merge_postcodes(episodes_df, "PL_POST")
+    :param list postcode_columns: columns of postcodes.
 
-    # The indices remain the same post merge as the length of the dataframes doesn't change, so we can set directly.
-    pl_details = pl_details.merge(
-        la_df, how="left", left_on="laua", right_on="LTLA21CD"
-    )
-    episodes_df["PL_LA"] = pl_details["UTLA21CD"]
+    :return: the local authority (laua), coordinates and upper tier local authority (UTLA21CD) of each
+        distinct upper-cased postcode, indexed by postcode. The last row, with a missing index, holds
+        what a missing postcode is given.
+    :rtype: DataFrame
+    """
+    upper = [column.str.upper() for column in postcode_columns]
+    distinct = pd.concat(upper, ignore_index=True).dropna().unique()
+    postcodes_df = DataFrame({"POSTCODE": np.append(distinct.astype(object), np.nan)})
+    details = merge_postcodes(postcodes_df, "POSTCODE")
+    details = details[["laua", "oseast1m", "osnrth1m"]].copy()
+    details["UTLA21CD"] = upper_tier_authorities(details["laua"])["UTLA21CD"].to_numpy()
+    details.index = postcodes_df["POSTCODE"]
+    return details
 
+
+def _add_postcode_derived_fields(
+    episodes_df, local_authority, details: Optional[DataFrame] = None
+):
+    """
+    Adds the local authority of each placement (PL_LA), whether it is in or out of local_authority
+    (PL_LOCATION) and its distance in miles from the child's home (PL_DISTANCE).
+
+    :param details: postcodes already looked up by _postcode_details. The postcodes of episodes_df are
+        looked up if not given.
+    """
+    episodes_df = episodes_df.copy()
+    episodes_df["HOME_POST"] = episodes_df["HOME_POST"].str.upper()
+    episodes_df["PL_POST"] = episodes_df["PL_POST"].str.upper()
+    if details is None:
+        details = _postcode_details([episodes_df["HOME_POST"], episodes_df["PL_POST"]])
+
+    # the row of details for each episode, where -1 is the last row, for missing postcodes.
+    home_rows = details.index.get_indexer(episodes_df["HOME_POST"])
+    pl_rows = details.index.get_indexer(episodes_df["PL_POST"])
+
+    # the placement fields depend only on the placement postcode, so are worked out for each postcode.
+    laua = details["laua"]
+    pl_la = details["UTLA21CD"].to_numpy(copy=True)
     logger.info(f"Adding IN/OUT")
-    episodes_df["PL_LOCATION"] = "IN"
-    episodes_df.loc[episodes_df["PL_LA"].ne(local_authority), "PL_LOCATION"] = "OUT"
-    episodes_df.loc[pl_details["laua"].isna(), "PL_LOCATION"] = pd.NA
+    pl_location = np.full(len(details), "IN", dtype=object)
+    pl_location[details["UTLA21CD"].ne(local_authority).to_numpy()] = "OUT"
+    pl_location[laua.isna().to_numpy()] = pd.NA
 
     # Add country codes for placements outside england
     for letter, code in {"S": "SCO", "N": "NIR", "W": "WAL"}.items():
         mask = (
-            pl_details["laua"].str.upper().str.startswith(letter)
-            & episodes_df["PL_POST"].notnull()
+            laua.str.upper().str.startswith(letter).fillna(False).to_numpy(dtype=bool)
         )
-        episodes_df.loc[mask, ["PL_LA", "PL_LOCATION"]] = [code, "OUT"]
+        pl_la[mask] = code
+        pl_location[mask] = "OUT"
+
+    episodes_df["PL_LA"] = pl_la[pl_rows]
+    episodes_df["PL_LOCATION"] = pl_location[pl_rows]
 
     logger.info(f"Calculating distances")
+    # the distance depends only on the home and placement postcodes, so is worked out for each pair.
+    pairs, pair_rows = pd.factorize(
+        (home_rows % len(details)) * len(details) + pl_rows % len(details)
+    )
+    home_pairs, pl_pairs = np.divmod(pair_rows, len(details))
     # This formula is taken straight from the guidance, to get miles between two postcodes
-    episodes_df["PL_DISTANCE"] = (
+    distance = (
         np.sqrt(
-            (home_details["oseast1m"] - pl_details["oseast1m"]) ** 2
-            + (home_details["osnrth1m"] - pl_details["osnrth1m"]) ** 2
+            (
+                details["oseast1m"].to_numpy()[home_pairs]
+                - details["oseast1m"].to_numpy()[pl_pairs]
+            )
+            ** 2
+            + (
+                details["osnrth1m"].to_numpy()[home_pairs]
+                - details["osnrth1m"].to_numpy()[pl_pairs]
+            )
+            ** 2
         )
         / 1000
         / 1.6093
     )
-    episodes_df["PL_DISTANCE"] = episodes_df["PL_DISTANCE"].round(decimals=1)
+    episodes_df["PL_DISTANCE"] = np.round(distance, decimals=1)[pairs]
 
     logger.info(f"Completed postcode calculations")
     return episodes_df
 
 
-def copy_datastore(data_store):
+def copy_datastore(data_store, deep=False):
     """
-    This is used for getting a shallow copy that is passed to the validation rules.
+    This is used for getting a shallow copy of the tables, or a deep copy if deep is True.
+    Copies of a DataStore share its cache of parsed dates.
     """
-    return {
-        k: v.copy(deep=False) if k != "metadata" else v for k, v in data_store.items()
+    data_copy = {
+        k: v.copy(deep=deep) if k != "metadata" else v for k, v in data_store.items()
     }
+    if isinstance(data_store, DataStore):
+        data_copy = DataStore(data_copy)
+        data_copy._cache = data_store._cache
+    return data_copy
@@ -0,0 +1,165 @@
+import logging
+import multiprocessing
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+from lac_validator.datastore import DataStore, DataStoreView, SharedWriteGuard
+from lac_validator.profiling import Measurement, StepProfile
+from lac_validator.rule_engine import RuleDefinition, load_rule
+
+logger = logging.getLogger(__name__)
+
+# The datastores each worker process validates against, and the guards checking them, if any.
+# They are set once per worker by _init_worker so that they are not pickled again for every
+# rule that the worker runs.
+_worker_datastores: list = []
+_worker_guards: list = []
+
+
+@dataclass
+class RuleRun:
+    """
+    The outcome of running a single rule.
+
+    :param dict result: the error locations returned by the rule, or None if the rule failed to run.
+    :param list shared_writes: tables whose shared data the rule changed, if this was checked.
+    :param StepProfile profile: the time and memory taken by the rule.
+    :param set tables_used: the tables of the datastore, or 'metadata', that the rule read.
+    :param set tables_checked: the names the rule looked up in the datastore, including tables that were not uploaded.
+    """
+
+    result: Optional[dict[str, list[Any]]]
+    shared_writes: list[str] = field(default_factory=list)
+    profile: Optional[StepProfile] = None
+    tables_used: set[str] = field(default_factory=set)
+    tables_checked: set[str] = field(default_factory=set)
+
+
+def run_rule(
+    rule: RuleDefinition,
+    data_store: DataStore,
+    guard: Optional[SharedWriteGuard] = None,
+) -> RuleRun:
+    """
+    Runs a single rule on its own view of the datastore.
+
+    :param RuleDefinition rule: the rule to be run.
+    :param DataStore data_store: datastore as returned by create_datastore.
+    :param SharedWriteGuard guard: if given, checks that the rule did not change data shared with other rules.
+
+    :return: the result of the rule.
+    :rtype: RuleRun
+    """
+    logger.info(f"Validating rule {rule.code}...")
+
+    # the rule gets its own copy of each table it uses, so it cannot change the data of other rules.
+    view = DataStoreView(data_store)
+
+    with Measurement("rules", rule.code) as measurement:
+        try:
+            # get the result from when the rule is run on the data.
+            run = RuleRun(rule.func(view))
+        except Exception:
+            # document instances where the rule cannot run on the data
+            logger.exception(f"Rule code {rule.code} failed to run!")
+            run = RuleRun(None)
+    run.profile = measurement.step
+    run.tables_used = view.tables_used
+    run.tables_checked = view.tables_checked
+
+    if guard is not None:
+        run.shared_writes = guard.check(view.tables_used)
+        if run.shared_writes:
+            logger.warning(
+                f"Rule code {rule.code} changed shared data in {', '.join(run.shared_writes)}!"
+            )
+    return run
+
+
+def _rule_reference(rule: RuleDefinition) -> tuple[str, str, str]:
+    """
+    Rule functions are wrapped by rule_definition, so they cannot be pickled by reference.
+    Workers are instead sent the module, name and code of the rule and look it up themselves.
+    """
+    return rule.func.__module__, rule.func.__qualname__, rule.code
+
+
+def _init_worker(data_stores, check_shared_writes, trace_memory):
+    global _worker_datastores, _worker_guards
+    _worker_datastores = data_stores
+    _worker_guards = [
+        SharedWriteGuard(data_store) if check_shared_writes else None
+        for data_store in data_stores
+    ]
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _run_in_worker(task: tuple[int, tuple[str, str, str]]) -> RuleRun:
+    number, rule_reference = task
+    rule = load_rule(*rule_reference)
+    return run_rule(rule, _worker_datastores[number], _worker_guards[number])
+
+
+def pool_context():
+    # fork lets workers inherit the datastore from the parent process without pickling it.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def run_tasks_in_pool(
+    tasks: Iterable[tuple[RuleDefinition, int]],
+    data_stores: list[DataStore],
+    workers: int,
+    check_shared_writes: bool = False,
+    trace_memory: bool = False,
+) -> list[RuleRun]:
+    """
+    Runs rules on several datastores across a single pool of worker processes.
+
+    :param list tasks: pairs of a rule and the position in data_stores of the datastore to run it on.
+    :param list data_stores: datastores as returned by create_datastore, shared with every worker.
+    :param int workers: number of worker processes.
+    :param bool check_shared_writes: whether each worker checks that rules do not change shared data.
+    :param bool trace_memory: whether each worker traces the memory used by rules.
+
+    :return: the result of each task, in the same order as tasks.
+    :rtype: list
+    """
+    references = [(number, _rule_reference(rule)) for rule, number in tasks]
+    logger.info(f"Running {len(references)} rules across {workers} worker processes")
+    with pool_context().Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(data_stores, check_shared_writes, trace_memory),
+    ) as pool:
+        return pool.map(_run_in_worker, references, chunksize=1)
+
+
+def run_rules_in_pool(
+    rules: Iterable[RuleDefinition],
+    data_store: DataStore,
+    workers: int,
+    check_shared_writes: bool = False,
+    trace_memory: bool = False,
+) -> Iterator[RuleRun]:
+    """
+    Runs rules across a pool of worker processes.
+
+    :param list rules: rules to be run.
+    :param DataStore data_store: datastore as returned by create_datastore, shared with every worker.
+    :param int workers: number of worker processes.
+    :param bool check_shared_writes: whether each worker checks that rules do not change shared data.
+    :param bool trace_memory: whether each worker traces the memory used by rules.
+
+    :return: the result of each rule, in the same order as rules.
+    :rtype: iterator
+    """
+    tasks = [(rule, 0) for rule in rules]
+    return iter(
+        run_tasks_in_pool(
+            tasks, [data_store], workers, check_shared_writes, trace_memory
+        )
+    )
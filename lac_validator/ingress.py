@@ -1,17 +1,24 @@
 import collections.abc
 import logging
+import os
+import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from time import perf_counter as now
-from typing import Dict, Iterator, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from numpy import nan
 from pandas import DataFrame
 
-from lac_validator.config import column_names
-from lac_validator.datastore import la_df, merge_postcodes
+from lac_validator.cache import ProviderInfoCache
+from lac_validator.config import code_lists, column_names
+from lac_validator.datastore import merge_postcodes, upper_tier_authorities
+from lac_validator.executor import pool_context
+from lac_validator.profiling import Profile
 from lac_validator.types import UploadedFile, UploadError
 
 logger = logging.getLogger(__name__)
@@ -40,6 +47,9 @@ class Timer:
 
 sc = Timer()
 
+# uploads are parsed at the same time, except in pyodide where threads and processes can't be started.
+CONCURRENT = sys.platform != "emscripten"
+
 
 class _BufferedUploadedFile(collections.abc.Mapping):
     def __init__(self, file, name, description):
@@ -67,8 +77,38 @@ class _BufferedUploadedFile(collections.abc.Mapping):
         pass
 
 
+def _run_concurrently(
+    calls: List[Tuple[Callable[..., Any], tuple]], processes: bool = False
+) -> list:
+    """
+    Makes independent calls at the same time, such as parsing different uploaded files.
+
+    :param list calls: (function, arguments) pairs.
+    :param bool processes: whether to make the calls in worker processes rather than threads. Threads
+        suit parsing CSV files, which pandas mostly does without holding the GIL, while processes suit
+        reading workbooks, which openpyxl does in Python.
+
+    :return: the result of each call, in the same order as calls. If any call raises, the exception of
+        the first of them is raised.
+    :rtype: list
+    """
+    workers = min(len(calls), os.cpu_count() or 1)
+    if not CONCURRENT or workers < 2:
+        return [func(*args) for func, args in calls]
+    if processes:
+        with pool_context().Pool(processes=workers) as pool:
+            results = [pool.apply_async(func, args) for func, args in calls]
+            return [result.get() for result in results]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, *args) for func, args in calls]
+        return [future.result() for future in futures]
+
+
 def read_from_text(
     raw_files: List[UploadedFile],
+    profile: Optional[Profile] = None,
+    categorical_codes: bool = False,
+    provider_info_cache: Optional[ProviderInfoCache] = None,
 ) -> Tuple[Dict[str, DataFrame], Dict[str, Union[str, DataFrame]]]:
     """
     Reads from a raw list of files passed from javascript. These files are of
@@ -79,9 +119,20 @@ def read_from_text(
 
     This function will try to catch most basic upload errors, and dispatch other errors
     to either the csv or xml reader based on the file extension.
+
+    If a profile is given, the time and memory taken to read the provider info and the
+    903 files are added to it.
+
+    If categorical_codes is True, coded fields are read into categorical columns, see
+    codes_to_categorical.
+
+    If a provider_info_cache is given, the provider info table is taken from it when the same
+    Ofsted lists have been read before, and added to it otherwise.
     """
     logger.info(f"Reading from text. {sc.t0}")
     metadata_extras = {}
+    if profile is None:
+        profile = Profile()
 
     CH_uploaded = [f for f in raw_files if f["description"] == "CH lookup"]
     SCP_uploaded = [f for f in raw_files if f["description"] == "SCP lookup"]
@@ -94,15 +145,27 @@ def read_from_text(
             f"{num_of_CH_and_SCP[0]} (Children's Homes List) and {num_of_CH_and_SCP[1]} (Social Care Providers List) "
             f"URN lookup tables were loaded - Please only load a single file in each box."
         )
+
+    provider_lists = CH_uploaded + SCP_uploaded
+    cached_provider_info = None
+    if provider_info_cache is not None and provider_lists:
+        cached_provider_info = provider_info_cache.get(provider_lists)
+
+    if cached_provider_info is not None:
+        logger.info(f"Provider info table taken from the cache. {sc.t}")
+        metadata_extras["provider_info"] = cached_provider_info
     elif set(num_of_CH_and_SCP) == {0, 1}:
         if CH_uploaded:
-            # Checks if a single CH list has wrongly been uploaded, or if a single combined SCPCH list has been uploaded
-            combined_scpch = combined_ch_scp_check(CH_uploaded[0])
+            # Checks if a single CH list has wrongly been uploaded, or if a single combined SCPCH list has been uploaded.
+            # The check and the provider info table read the same workbook, so it is only opened once.
+            CH_workbook = Workbook(CH_uploaded[0])
+            combined_scpch = combined_ch_scp_check(CH_workbook)
             if combined_scpch:
                 logger.info(
                     f"Combined 'Childrens home' and 'Social Care Providers' lists detected. {sc.t}"
                 )
-                provider_info_df = scpch_provider_info_table(scpch=CH_uploaded[0])
+                with profile.step("ingress", "provider info"):
+                    provider_info_df = scpch_provider_info_table(scpch=CH_workbook)
                 metadata_extras["provider_info"] = provider_info_df
             else:
                 raise UploadError(
@@ -120,9 +183,10 @@ def read_from_text(
         )
         (CH_uploaded,) = CH_uploaded  # These should both be single-element lists
         (SCP_uploaded,) = SCP_uploaded
-        provider_info_df = construct_provider_info_table(
-            CH=CH_uploaded, SCP=SCP_uploaded
-        )
+        with profile.step("ingress", "provider info"):
+            provider_info_df = construct_provider_info_table(
+                CH=CH_uploaded, SCP=SCP_uploaded
+            )
         metadata_extras["provider_info"] = provider_info_df
 
         # logger.info(
@@ -138,6 +202,14 @@ def read_from_text(
             "Ofsted CH & SCP spreadsheets not loaded - checks involving URN lookup will be skipped."
         )
 
+    if (
+        provider_info_cache is not None
+        and cached_provider_info is None
+        and "provider_info" in metadata_extras
+    ):
+        provider_info_cache.put(provider_lists, metadata_extras["provider_info"])
+        provider_info_cache.evict()
+
     raw_files = [
         f for f in raw_files if f["description"] not in ("CH lookup", "SCP lookup")
     ]
@@ -153,14 +225,121 @@ def read_from_text(
     else:
         if extensions == ["csv"]:
             metadata_extras["file_format"] = "csv"
-            return read_csvs_from_text(raw_files), metadata_extras
+            with profile.step("ingress", "csv files"):
+                dfs = read_csvs_from_text(raw_files)
+                if categorical_codes:
+                    dfs = codes_to_categorical(dfs)
+            return dfs, metadata_extras
         elif extensions == ["xml"]:
             metadata_extras["file_format"] = "xml"
-            return read_xml_from_text(raw_files[0]["file_content"]), metadata_extras
+            with profile.step("ingress", "xml file"):
+                dfs = read_xml_from_text(raw_files[0]["file_content"])
+                if categorical_codes:
+                    dfs = codes_to_categorical(dfs)
+            return dfs, metadata_extras
         else:
             raise UploadError(f"Unknown file type {extensions[0]} found.")
 
 
+class Workbook:
+    """
+    An uploaded Excel workbook, such as an Ofsted provider list, opened once however many times it
+    is read. It is only opened when first read, and each sheet is only parsed once for each set of
+    columns asked for, so that detecting the kind of list and reading it share the same parse.
+
+    :param upload: the uploaded file as passed in by the frontend, its content, or a path to it.
+    """
+
+    def __init__(self, upload: Union[UploadedFile, bytes, str]):
+        self.upload = upload
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self._sheets: Dict[Tuple[Union[str, int], Optional[frozenset]], DataFrame] = {}
+
+    @classmethod
+    def of(cls, upload: Union["Workbook", UploadedFile, bytes, str]) -> "Workbook":
+        """
+        :return: upload if it is already a Workbook, otherwise a Workbook reading it.
+        """
+        return upload if isinstance(upload, Workbook) else cls(upload)
+
+    @property
+    def excel_file(self) -> pd.ExcelFile:
+        if self._excel_file is None:
+            content = self.upload
+            if not isinstance(content, (str, bytes)):
+                content = content["file_content"]
+                if not isinstance(content, bytes):
+                    content = content.tobytes()
+            self._excel_file = pd.ExcelFile(content, engine="openpyxl")
+        return self._excel_file
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return self.excel_file.sheet_names
+
+    def sheet(
+        self, sheet_name: Union[str, int], columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """
+        :param sheet_name: name or position of the sheet.
+        :param list columns: the columns to read, matched without regard to case. Columns the sheet
+            does not have are left out. All columns are read if not given.
+
+        :return: the columns of the sheet, as a copy that can be changed without changing what later
+            reads of the sheet return.
+        :rtype: DataFrame
+        """
+        wanted = None if columns is None else frozenset(c.lower() for c in columns)
+        key = (sheet_name, wanted)
+        if key not in self._sheets:
+            usecols = None
+            if wanted is not None:
+                usecols = lambda column: str(column).lower() in wanted
+            self._sheets[key] = self.excel_file.parse(sheet_name, usecols=usecols)
+            logger.debug(
+                f"Reading sheet {sheet_name} from excel done. cols:{self._sheets[key].columns} {sc.t}"
+            )
+        return self._sheets[key].copy(deep=False)
+
+
+# columns read from the Childrens Homes and Social Care Providers lists.
+CH_COLUMNS = [
+    "URN",
+    "Local Authority",
+    "Provider Code",
+    "Provider Placement Code",
+    "Closed Date",
+    "Setting Postcode",
+]
+SCP_COLUMNS = [
+    "URN",
+    "Local authority",
+    "Placement code",
+    "Placement provider code",
+    "Deregistration date",
+    "Setting postcode",
+]
+# columns read from the combined list, along with the provider type that tells it apart from a
+# Childrens Homes list.
+SCPCH_COLUMNS = [
+    "urn",
+    "local authority",
+    "placement code",
+    "placement provider code",
+    "deregistration date",
+    "setting address postcode",
+]
+SCPCH_CHECK_COLUMNS = SCPCH_COLUMNS + ["provider type"]
+# columns read from the supported accommodation sheet of the two sheet version of the combined list.
+SCPCH_SA_COLUMNS = [
+    "urn",
+    "provider local authority",
+    "closed date",
+    "placement provider code",
+    "setting address postcode",
+]
+
+
 def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     """
     inputs:
@@ -212,24 +391,49 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     ]
     logger.info(f"URN lookup bytes recieved. Reading excel files... {sc.t}")
 
-    # read childrens homes file
-    CH_sheets = pd.ExcelFile(CH_bytes, engine="openpyxl").sheet_names
-    CH_cols = [
-        "URN",
-        "Local Authority",
-        "Provider Code",
-        "Provider Placement Code",
-        "Closed Date",
-        "Setting Postcode",
-    ]
+    # the workbooks take most of the time, so they are read at the same time.
+    CH_df, SCP_df = _run_concurrently(
+        [
+            (_read_ch_list, (CH_bytes, provider_info_cols)),
+            (_read_scp_list, (SCP_bytes, provider_info_cols)),
+        ],
+        processes=True,
+    )
+    logger.info(f"CH and SCP dataframes complete. {sc.t}")
+
+    # add SCP info to provider_info_df
+    provider_info_df = pd.concat((CH_df, SCP_df), ignore_index=True)
+    del CH_df, SCP_df
+
+    # standardise postcodes
+    provider_info_df["POSTCODE"] = (
+        provider_info_df["POSTCODE"].str.replace(" ", "").str.upper()
+    )
+
+    # infer LA based on provider's postcode. this does not necessarily match what's in the file!
+    provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = upper_tier_authorities(
+        merge_postcodes(provider_info_df, "POSTCODE")["laua"]
+    )
+
+    logger.info(f"Provider info dataframe successfully created {sc.t}")
+    return provider_info_df
+
+
+def _read_ch_list(
+    CH_bytes: Union[bytes, str], provider_info_cols: List[str]
+) -> DataFrame:
+    """
+    Reads the childrens homes list for construct_provider_info_table, with its columns renamed to
+    provider_info_cols.
+    """
+    workbook = Workbook(CH_bytes)
+    CH_sheets = workbook.sheet_names
+    CH_cols = CH_COLUMNS
 
     # check whether file includes consolidated provider information sheet
     if "Provider information" in CH_sheets:
-        CH_providers = pd.read_excel(
-            CH_bytes, sheet_name="Provider information", engine="openpyxl"
-        )
-        logger.debug(
-            f"Reading CH provider info from excel done. cols:{CH_providers.columns} {sc.t}"
+        CH_providers = workbook.sheet(
+            "Provider information", CH_cols + ["Setting Address Postcode"]
         )
 
         try:
@@ -258,18 +462,10 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     # if not check whether file includes separate setting and address sheets
     elif "Settings and Inspection Info" in CH_sheets and "Address Details" in CH_sheets:
         # this sheet contains all columns except the postcode
-        CH_setting = pd.read_excel(
-            CH_bytes, sheet_name="Settings and Inspection Info", engine="openpyxl"
-        )
-        logger.debug(
-            f"Reading CH setting info from excel done. cols:{CH_setting.columns} {sc.t}"
-        )
+        CH_setting = workbook.sheet("Settings and Inspection Info", CH_cols[:-1])
         # from this sheet we need only the postcode
-        CH_address = pd.read_excel(
-            CH_bytes, sheet_name="Address Details", engine="openpyxl"
-        )
-        logger.debug(
-            f"Reading CH address info from excel done. cols:{CH_address.columns} {sc.t}"
+        CH_address = workbook.sheet(
+            "Address Details", ["URN", "Setting Postcode", "Setting Address Postcode"]
         )
 
         try:
@@ -306,32 +502,23 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     CH_df["Provider Placement Code"] = CH_df["Provider Placement Code"].str.replace(
         "/", ","
     )
-    provider_info_df = CH_df.rename(columns=dict(zip(CH_cols, provider_info_cols)))
-    del CH_df
-    logger.info(f"CH dataframe complete. Creating SCP dataframe {sc.t}")
+    return CH_df.rename(columns=dict(zip(CH_cols, provider_info_cols)))
 
-    # read social care providers file
-    SCP_current = pd.read_excel(
-        SCP_bytes, engine="openpyxl", sheet_name=0
+
+def _read_scp_list(
+    SCP_bytes: Union[bytes, str], provider_info_cols: List[str]
+) -> DataFrame:
+    """
+    Reads the social care providers list for construct_provider_info_table, with its columns renamed
+    to provider_info_cols.
+    """
+    workbook = Workbook(SCP_bytes)
+    SCP_cols = SCP_COLUMNS
+    SCP_current = workbook.sheet(
+        0, [_ for _ in SCP_cols if _ != "Deregistration date"]
     )  # current providers
-    logger.debug(
-        f"Reading SCP_current from excel done. cols: {SCP_current.columns}. {sc.t}"
-    )
-    SCP_closed = pd.read_excel(
-        SCP_bytes, engine="openpyxl", sheet_name=1
-    )  # closed providers
-    logger.debug(
-        f"Reading SCP_closed from excel done. cols: {SCP_closed.columns}. {sc.t}"
-    )
+    SCP_closed = workbook.sheet(1, SCP_cols)  # closed providers
 
-    SCP_cols = [
-        "URN",
-        "Local authority",
-        "Placement code",
-        "Placement provider code",
-        "Deregistration date",
-        "Setting postcode",
-    ]
     try:
         SCP_current = SCP_current[[_ for _ in SCP_cols if _ != "Deregistration date"]]
     except KeyError:
@@ -357,31 +544,14 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     )
     SCP_df = SCP_df[SCP_df["URN"].notnull()]
     SCP_df["source"] = "SCP List"
-
-    # add SCP info to provider_info_df
-    provider_info_df = pd.concat((provider_info_df, SCP_df), ignore_index=True)
-    del SCP_current, SCP_closed, SCP_df
-
-    # standardise postcodes
-    provider_info_df["POSTCODE"] = (
-        provider_info_df["POSTCODE"].str.replace(" ", "").str.upper()
-    )
-
-    # infer LA based on provider's postcode. this does not necessarily match what's in the file!
-    provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = (
-        merge_postcodes(provider_info_df, "POSTCODE")
-        .merge(la_df, how="left", left_on="laua", right_on="LTLA21CD")
-        .loc[:, ["UTLA21CD", "UTLA21NM"]]
-    )
-
-    logger.info(f"Provider info dataframe successfully created {sc.t}")
-    return provider_info_df
+    return SCP_df
 
 
 def scpch_provider_info_table(scpch: UploadedFile):
     """
     inputs:
-    Combined CH (childrens homes) and SCP (social care providers) lists as the files' contents as passed in by the frontend
+    Combined CH (childrens homes) and SCP (social care providers) lists as the files' contents as passed in by the frontend,
+    a path to the excel file, or a Workbook of either
 
     returns:
     provider_info_df is a dataframe
@@ -404,13 +574,7 @@ def scpch_provider_info_table(scpch: UploadedFile):
         - LA_NAME_FROM_FILE
             LA name from uploaded files.
     """
-    if not isinstance(scpch, str):
-        if not isinstance(scpch["file_content"], bytes):
-            scpch_bytes = scpch["file_content"].tobytes()
-        else:
-            scpch_bytes = scpch["file_content"]
-    else:
-        scpch_bytes = scpch
+    workbook = Workbook.of(scpch)
 
     provider_info_cols = [
         "URN",
@@ -421,26 +585,18 @@ def scpch_provider_info_table(scpch: UploadedFile):
         "POSTCODE",
     ]
 
-    scpch_cols = [
-        "urn",
-        "local authority",
-        "placement code",
-        "placement provider code",
-        "deregistration date",
-        "setting address postcode",
-    ]
+    scpch_cols = SCPCH_COLUMNS
     logger.info(f"URN lookup bytes recieved. Reading excel files... {sc.t}")
 
-    scpch_providers = pd.read_excel(scpch_bytes, sheet_name=None, engine="openpyxl")
     # Checks to see if it's the one sheet or two sheet version
-    if len(scpch_providers) == 1:
-        # next iter has a lower memory overhead than extracting the first element via a list
-        # when we don't want to hard code the sheet names
-        scpch_providers = next(iter(scpch_providers.values()))
+    sheet_count = len(workbook.sheet_names)
+    if sheet_count == 1:
+        # the same columns as combined_ch_scp_check reads, so the sheet is only parsed once.
+        scpch_providers = workbook.sheet(0, SCPCH_CHECK_COLUMNS)
         scpch_providers.columns = scpch_providers.columns.str.lower()
-    if len(scpch_providers) == 2:
-        scpch_iter = iter(scpch_providers.values())
-        scpch_1, scpch_2 = next(scpch_iter), next(scpch_iter)
+    elif sheet_count == 2:
+        scpch_1 = workbook.sheet(0, scpch_cols)
+        scpch_2 = workbook.sheet(1, SCPCH_SA_COLUMNS)
 
         scpch_2.columns = scpch_2.columns.str.lower()
         scpch_1.columns = scpch_1.columns.str.lower()
@@ -464,6 +620,11 @@ def scpch_provider_info_table(scpch: UploadedFile):
             ]
         ]
         scpch_providers = pd.concat([scpch_1, scpch_2])
+    else:
+        raise UploadError(
+            f"Expected one or two sheets in the combined Childrens Homes and Social Care Providers"
+            f" list, found {sheet_count}."
+        )
 
     logger.debug(
         f"Reading SCP/CH provider info from excel done. cols:{scpch_providers.columns} {sc.t}"
@@ -495,10 +656,8 @@ def scpch_provider_info_table(scpch: UploadedFile):
     )
 
     # infer LA based on provider's postcode. this does not necessarily match what's in the file!
-    provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = (
-        merge_postcodes(provider_info_df, "POSTCODE")
-        .merge(la_df, how="left", left_on="laua", right_on="LTLA21CD")
-        .loc[:, ["UTLA21CD", "UTLA21NM"]]
+    provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = upper_tier_authorities(
+        merge_postcodes(provider_info_df, "POSTCODE")["laua"]
     )
 
     logger.info(f"Provider info dataframe successfully created {sc.t}")
@@ -529,60 +688,160 @@ def all_cols_to_object_dtype(df) -> pd.DataFrame:
     return df
 
 
-def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
-    def _get_file_type(df) -> str:
-        for table_name, expected_columns in column_names.items():
-            if set(df.columns) == set(expected_columns):
-                logger.info(f"Loaded {table_name} from CSV. ({len(df)} rows)")
-                return table_name
-        else:
-            raise UploadError(
-                f"Failed to match provided data ({list(df.columns)}) to known column names!"
-            )
+def codes_to_categorical(dfs: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+    """
+    Stores the coded fields listed in config.code_lists as categorical columns, which take a
+    fraction of the memory of object columns and are compared as integer codes.
 
-    files = {}
-    for file_data in raw_files:
-        csv_file = BytesIO(file_data["file_content"])
-        # pd.read_csv on utf-16 files will raise a UnicodeDecodeError. This block prints a descriptive error message if that happens.
-        try:
-            max_cols = max([len(cols) for cols in column_names.values()])
-            df = pd.read_csv(
-                csv_file,
-                converters={
-                    i: lambda s: str(s) if s != "" else nan for i in range(max_cols)
-                },
-            )
+    Every coded column of every table shares one set of categories: the codes of all the fields
+    and any other values found in them, sorted. So values that are not valid codes are kept as
+    they are, columns can be compared with each other as before, and they sort as strings do.
 
-        except UnicodeDecodeError:
-            # raw_files is a list of files of type UploadedFile(TypedDict) whose instance is a dictionary containing the fields name, file_content, Description.
-            # TODO: attempt to identify files that couldnt be decoded at this point; continue; then raise the exception outside the for loop, naming the uploaded filenames
-            raise UploadError(
-                f"Failed to decode one or more files. Try opening the text "
-                f"file(s) in Notepad, then 'Saving As...' with the UTF-8 encoding"
-            )
-        # arrange column data types
-        logger.debug("+" * 50)
-        logger.debug("DF DATATYPES BEFORE CONVERSION", df.dtypes)
-        df = all_cols_to_object_dtype(df)
-        logger.debug("AFTER CONVERSION BEFORE CAPITALISING", df.dtypes)
-        # capitalize all string input
-        df = capitalise_object_dtype_cols(df)
-        logger.debug("DF DATATYPES AFTER CAPITALISING", df.dtypes)
+    :param dict dfs: tables as read from the uploaded files, by table name.
 
-        file_name = _get_file_type(df)
+    :return: the same tables, with coded fields as categorical columns.
+    :rtype: dict
+    """
+    columns = [
+        (table, column)
+        for table, df in dfs.items()
+        for column in df.columns
+        if column in code_lists
+    ]
+    values = {code for codes in code_lists.values() for code in codes}
+    # some rules fill in missing codes before comparing episodes, such as 434 and 436.
+    values.update(["", "*"])
+    for table, column in columns:
+        values.update(dfs[table][column].dropna().unique())
+    # values that are not strings, such as numbers from an XML file, can't be sorted with them.
+    try:
+        categories = sorted(values)
+    except TypeError:
+        categories = sorted(values, key=str)
+    dtype = pd.CategoricalDtype(categories)
+    for table, column in columns:
+        dfs[table][column] = dfs[table][column].astype(dtype)
+    return dfs
+
+
+def categorical_to_object(df: DataFrame) -> DataFrame:
+    """
+    :param DataFrame df: table that may have categorical columns.
+
+    :return: the table with categorical columns turned back into object columns, as read from the
+        uploaded files.
+    :rtype: DataFrame
+    """
+    categorical = [
+        column
+        for column in df.columns
+        if isinstance(df.dtypes[column], pd.CategoricalDtype)
+    ]
+    if not categorical:
+        return df
+    df = df.copy(deep=False)
+    for column in categorical:
+        df[column] = df[column].astype(object)
+    return df
+
+
+def read_csv(content: bytes) -> DataFrame:
+    """
+    Reads a 903 CSV file into a table of upper-cased strings, with empty values as NaN.
+
+    The file is upper-cased as a whole before it is parsed, and the parser reads every column as
+    strings, so no Python code is run for each value. The column names are kept as they are in the file.
+
+    :param bytes content: content of the CSV file.
+
+    :return: the table.
+    :rtype: DataFrame
+    """
+    columns = pd.read_csv(BytesIO(content), nrows=0).columns
+    # only empty values are missing, so upper-casing doesn't change which values are.
+    df = pd.read_csv(
+        BytesIO(content.decode("utf-8").upper().encode("utf-8")),
+        dtype=str,
+        keep_default_na=False,
+        na_values=[""],
+    )
+    if not isinstance(df.index, pd.RangeIndex):
+        # rows longer than the header are read with their first values as the index, which
+        # read_csv_with_converters doesn't upper-case.
+        return read_csv_with_converters(content)
+    df.columns = columns
+    return df
+
+
+def read_csv_with_converters(content: bytes) -> DataFrame:
+    """
+    Reads a 903 CSV file by passing each value through a converter, as read_csvs_from_text used to.
+    Gives the same table as read_csv, only more slowly, and is kept to test and benchmark read_csv against.
+
+    :param bytes content: content of the CSV file.
+
+    :return: the table.
+    :rtype: DataFrame
+    """
+    max_cols = max([len(cols) for cols in column_names.values()])
+    df = pd.read_csv(
+        BytesIO(content),
+        converters={i: lambda s: str(s) if s != "" else nan for i in range(max_cols)},
+    )
+    df = all_cols_to_object_dtype(df)
+    return capitalise_object_dtype_cols(df)
 
-        if "This year" in file_data["description"]:
-            name = file_name
-        elif "Prev year" in file_data["description"]:
-            name = file_name + "_last"
-        else:
-            raise UploadError(
-                f'Unrecognized file description {file_data["description"]}'
-            )
 
-        files[name] = df
-        logger.debug("DF NAME: ", name)
-        logger.debug("+" * 50)
+def _get_file_type(df) -> str:
+    for table_name, expected_columns in column_names.items():
+        if set(df.columns) == set(expected_columns):
+            logger.info(f"Loaded {table_name} from CSV. ({len(df)} rows)")
+            return table_name
+    else:
+        raise UploadError(
+            f"Failed to match provided data ({list(df.columns)}) to known column names!"
+        )
+
+
+def _read_csv_upload(file_data: UploadedFile) -> Tuple[str, DataFrame]:
+    """
+    :param UploadedFile file_data: an uploaded CSV file.
+
+    :return: the name of the table in the file, with _last added for last year's files, and the table.
+    :rtype: tuple
+    """
+    # pd.read_csv on utf-16 files will raise a UnicodeDecodeError. This block prints a descriptive error message if that happens.
+    try:
+        df = read_csv(file_data["file_content"])
+    except UnicodeDecodeError:
+        # raw_files is a list of files of type UploadedFile(TypedDict) whose instance is a dictionary containing the fields name, file_content, Description.
+        # TODO: attempt to identify files that couldnt be decoded at this point; continue; then raise the exception outside the for loop, naming the uploaded filenames
+        raise UploadError(
+            f"Failed to decode one or more files. Try opening the text "
+            f"file(s) in Notepad, then 'Saving As...' with the UTF-8 encoding"
+        )
+    logger.debug("+" * 50)
+    logger.debug("DF DATATYPES", df.dtypes)
+
+    file_name = _get_file_type(df)
+
+    if "This year" in file_data["description"]:
+        name = file_name
+    elif "Prev year" in file_data["description"]:
+        name = file_name + "_last"
+    else:
+        raise UploadError(f'Unrecognized file description {file_data["description"]}')
+
+    logger.debug("DF NAME: ", name)
+    logger.debug("+" * 50)
+    return name, df
+
+
+def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
+    # the files are parsed at the same time, then combined once they all have been.
+    files = dict(
+        _run_concurrently([(_read_csv_upload, (file_data,)) for file_data in raw_files])
+    )
 
     # Adding UASC column to Header table
     for header_name, uasc_name in (("Header", "UASC"), ("Header_last", "UASC_last")):
@@ -599,7 +858,144 @@ def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
     return files
 
 
+# XML tags that are named differently in the CSV files.
+XML_TAG_COLUMNS = {"CHILDID": "CHILD", "PL": "PLACE"}
+
+# tables read from the elements in a child's HEADER element, by tag.
+XML_HEADER_TABLES = {
+    "AREVIEW": "Reviews",
+    "AMISSING": "Missing",
+    "OC2": "OC2",
+    "PERMANENCE": "PrevPerm",
+    "AD_PLACED": "PlacedAdoption",
+}
+
+# number of characters or bytes of the XML file fed to the parser at a time.
+XML_CHUNK_SIZE = 1024 * 1024
+
+
+def _xml_values(element) -> Dict[str, Optional[str]]:
+    """
+    :return: the text of every element in element, itself included, that has no elements of its own,
+        by column name.
+    :rtype: dict
+    """
+    return {
+        XML_TAG_COLUMNS.get(node.tag, node.tag): node.text
+        for node in element.iter()
+        if len(node) == 0
+    }
+
+
+def _add_xml_row(table_columns: Dict[str, List[Any]], values: Dict[str, Optional[str]]):
+    for column, column_values in table_columns.items():
+        value = values.get(column)
+        column_values.append(nan if value is None else value.upper())
+
+
+def _add_xml_child(columns: Dict[str, Dict[str, List[Any]]], child):
+    """
+    Adds the rows of a child's element to the columns of each table.
+    """
+    child_values = _xml_values(child)
+    _add_xml_row(columns["Header"], child_values)
+    if child_values.get("UASC") is not None:
+        _add_xml_row(columns["UASC"], child_values)
+    if child_values.get("IN_TOUCH") is not None:
+        _add_xml_row(columns["OC3"], child_values)
+    if child_values.get("DATE_INT") is not None:
+        _add_xml_row(columns["AD1"], child_values)
+    for table in child:
+        if table.tag == "EPISODE":
+            _add_xml_row(columns["Episodes"], {**child_values, **_xml_values(table)})
+        elif table.tag == "HEADER":
+            for child_table in table:
+                if child_table.tag in XML_HEADER_TABLES:
+                    _add_xml_row(
+                        columns[XML_HEADER_TABLES[child_table.tag]],
+                        {**child_values, **_xml_values(child_table)},
+                    )
+
+
 def read_xml_from_text(xml_string) -> Dict[str, DataFrame]:
+    """
+    Reads the tables of a 903 XML file, with every value as an upper-cased string and missing values as NaN.
+
+    The file is parsed a chunk at a time, and each child's element is removed from the tree once its
+    values have been added to the columns of each table. So only one child's elements are held at a
+    time, rather than the tree of the whole file.
+
+    :param xml_string: content of the XML file, as a string or bytes.
+
+    :return: the tables, by table name. Tables without rows have no columns.
+    :rtype: dict
+    """
+    tables = [
+        "Header",
+        "Episodes",
+        "UASC",
+        "Reviews",
+        "OC2",
+        "OC3",
+        "AD1",
+        "PlacedAdoption",
+        "PrevPerm",
+        "Missing",
+    ]
+    columns = {
+        table: {
+            column: []
+            for column in column_names[table] + (["UASC"] if table == "Header" else [])
+        }
+        for table in tables
+    }
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+
+    def read_events():
+        nonlocal root, depth
+        for event, element in parser.read_events():
+            if event == "start":
+                root = element if root is None else root
+                depth += 1
+                continue
+            depth -= 1
+            # children are the elements directly in the root element.
+            if depth == 1:
+                _add_xml_child(columns, element)
+                root.clear()
+
+    for start in range(0, len(xml_string), XML_CHUNK_SIZE):
+        parser.feed(xml_string[start : start + XML_CHUNK_SIZE])
+        read_events()
+    parser.close()
+    read_events()
+
+    data = {}
+    for table, table_columns in columns.items():
+        if not any(table_columns.values()):
+            data[table] = pd.DataFrame([])
+        else:
+            data[table] = pd.DataFrame(
+                {
+                    column: np.array(values, dtype=object)
+                    for column, values in table_columns.items()
+                }
+            )
+
+    names_and_lengths = ", ".join(f"{t}: {len(data[t])} rows" for t in data)
+    logger.info(f"Tables created from XML -- {names_and_lengths}")
+    return data
+
+
+def read_xml_from_tree(xml_string) -> Dict[str, DataFrame]:
+    """
+    Reads a 903 XML file by parsing it into a tree and making a row at a time, as read_xml_from_text
+    used to. Gives the same tables as read_xml_from_text, only more slowly and in more memory, and is
+    kept to test and benchmark it against.
+    """
     header_df = []
     episodes_df = []
     uasc_df = []
@@ -710,15 +1106,10 @@ def combined_ch_scp_check(excel_to_check):
     """
     Checks whether the file uploaded to the front end in the Children's home box is a CH list or a combined SPC/CH list.
     Only runs in instances where the number fo files uploaded in the SCP/CH boxes is one.
+    The file can be given as its contents, as passed in by the frontend, or as a Workbook of them.
     """
-    if isinstance(excel_to_check, bytes):
-        CH_bytes = excel_to_check
-    elif isinstance(excel_to_check, dict):
-        if isinstance(excel_to_check["file_content"], bytes):
-            CH_bytes = excel_to_check["file_content"]
-        elif not isinstance(excel_to_check["file_content"], bytes):
-            CH_bytes = excel_to_check["file_content"].tobytes()
-    else:
+    workbook = Workbook.of(excel_to_check)
+    if not isinstance(workbook.upload, (bytes, dict)):
         logger.info(
             f"Something is wrong with your 'Children's Home' or 'Social Care Providers' lists, check they're uploaded in the right boxes \
                     \n and that the column names are correct. {sc.t}"
@@ -728,17 +1119,17 @@ def combined_ch_scp_check(excel_to_check):
             "but it doesn't appear to be a combined list."
             "Please upload lists from Ofsted into their respective boxes above."
         )
-    input_file = pd.read_excel(CH_bytes, engine="openpyxl", sheet_name=None)
+    sheet_names = workbook.sheet_names
 
-    if (set(input_file.keys()) == set(["Providers", "SA providers"])) | (
-        set(input_file.keys()) == set(["Providers", "SA Providers"])
+    if (set(sheet_names) == set(["Providers", "SA providers"])) | (
+        set(sheet_names) == set(["Providers", "SA Providers"])
     ):
         logger.info(
             f"'Childrens home' and 'Social Care Providers' lists detected across two sheets of Excel workbook. {sc.t}"
         )
         return True
-    elif len(input_file.keys()) == 1:
-        df = next(iter(input_file.values()))
+    elif len(sheet_names) == 1:
+        df = workbook.sheet(0, SCPCH_CHECK_COLUMNS)
         df.columns = df.columns.str.lower()
         if "provider type" not in df.columns:
             logger.info(
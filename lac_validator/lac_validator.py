@@ -1,12 +1,18 @@
 import logging
-from typing import Any, Optional
+from dataclasses import replace
+from typing import Optional
 
 import pandas as pd
 from pandas import DataFrame
 
-from lac_validator.datastore import copy_datastore, create_datastore
-from lac_validator.ingress import read_from_text
-from lac_validator.rule_engine import RuleDefinition
+from lac_validator.cache import ProviderInfoCache, ResultCache
+from lac_validator.datastore import DataStore, SharedWriteGuard, create_datastore
+from lac_validator.executor import RuleRun, run_rule, run_rules_in_pool
+from lac_validator.ingress import categorical_to_object, read_from_text
+from lac_validator.profiling import Profile, memory_tracing
+from lac_validator.results import ErrorLocations, ValidationState
+from lac_validator.rule_engine import RuleDefinition, schedule_rules, table_names
+from lac_validator.sharding import run_rules_sharded
 from lac_validator.types import UploadedFile
 
 logger = logging.getLogger(__name__)
@@ -24,24 +30,77 @@ class LacValidator:
         files: list[UploadedFile],
         registry: dict[str, RuleDefinition],
         selected_rules: Optional[list[str]] = None,
+        workers: Optional[int] = None,
+        check_shared_writes: bool = False,
+        trace_memory: bool = False,
+        cache: Optional[ResultCache] = None,
+        previous: Optional[ValidationState] = None,
+        partitions: Optional[int] = None,
+        categorical_codes: bool = False,
+        provider_info_cache: Optional[ProviderInfoCache] = None,
     ):
+        """
+        :param dict metadata: collection year and local authority as strings.
+        :param list files: files uploaded by the user.
+        :param dict registry: record of all existing rules in rule pack.
+        :param list selected_rules: array of rule codes as strings.
+        :param int workers: number of processes to run rules across. Rules run one after another if not set.
+        :param bool check_shared_writes: whether to check that rules do not change data shared with other rules.
+            Rules that do are listed in shared_writes.
+        :param bool trace_memory: whether to record the peak memory of each step in profile, as well as
+            its wall and CPU time. This slows validation down.
+        :param ResultCache cache: if given, rules already run on the same data are not run again.
+            Their codes are listed in cache_hits.
+        :param ValidationState previous: the state of a validation of an earlier upload, see state. Rules
+            that only use tables that are unchanged since then reuse its results instead of being run again,
+            and are listed in reused.
+        :param int partitions: if given, children are split into this many partitions and rules are run on
+            each partition in turn, which keeps the memory used by large submissions down.
+        :param bool categorical_codes: whether to hold coded fields such as PLACE and REC as categorical
+            columns while rules run, which takes less memory. ds_results holds them as object columns either way.
+        :param ProviderInfoCache provider_info_cache: if given, provider info tables made from Ofsted lists
+            that have been uploaded before are taken from it instead of reading the lists again.
+        """
         self.dfs: dict[str, DataFrame] = {}
         self.dones: list[str] = []
         self.skips: list[str] = []
         self.fails: list[str] = []
+        # tables changed by rules that wrote into data shared with other rules, by rule code.
+        self.shared_writes: dict[str, list[str]] = {}
+        # rows flagged by each rule, which are added to ds_results as ERR_ columns.
+        self.errors = ErrorLocations()
+        # time and memory taken by reading the files, creating the datastore and each rule.
+        self.profile = Profile()
 
-        logger.info("Reading uploaded files...")
-        dfs, metadata_extras = read_from_text(raw_files=files)
-        self.dfs = dfs
+        self.registry = registry
+        self.workers = workers
+        self.check_shared_writes = check_shared_writes
+        self.trace_memory = trace_memory
+        self.cache = cache
+        # rules whose results were taken from the cache instead of being run.
+        self.cache_hits: list[str] = []
+        self.previous = previous
+        # rules whose results were reused from the previous validation.
+        self.reused: list[str] = []
+        self.partitions = partitions
+        self.categorical_codes = categorical_codes
 
-        metadata.update(metadata_extras)
-        logger.info(f'Metadata receieved: {",".join(metadata.keys())}')
+        with memory_tracing(trace_memory):
+            logger.info("Reading uploaded files...")
+            dfs, metadata_extras = read_from_text(
+                raw_files=files,
+                profile=self.profile,
+                categorical_codes=categorical_codes,
+                provider_info_cache=provider_info_cache,
+            )
+            self.dfs = dfs
 
-        self.registry = registry
-        self.metadata = metadata
+            metadata.update(metadata_extras)
+            logger.info(f'Metadata receieved: {",".join(metadata.keys())}')
+            self.metadata = metadata
 
-        # validate
-        self.validate(selected_rules)
+            # validate
+            self.validate(selected_rules)
 
     def get_rules_to_run(
         self,
@@ -63,28 +122,142 @@ class LacValidator:
         else:
             return registry
 
+    def changed_tables(self, data_store: DataStore) -> set[str]:
+        """
+        :param DataStore data_store: datastore as returned by create_datastore.
+        :return set changed: names of the tables, or 'metadata', whose content differs from the previous
+            validation, including tables uploaded or removed since.
+        """
+        previous = self.previous.content_hashes
+        return {
+            key
+            for key in set(previous) | set(data_store)
+            if key not in previous
+            or key not in data_store
+            or previous[key] != data_store.content_hash(key)
+        }
+
+    def run_rules(
+        self, rules: list[RuleDefinition], data_store: DataStore
+    ) -> dict[str, RuleRun]:
+        """
+        Runs rules on the datastore. Rules whose tables are unchanged since the previous validation,
+        if there is one, are not run again and neither are rules already run on the same data if
+        there is a cache.
+
+        :param list rules: rules to be run.
+        :param DataStore data_store: datastore as returned by create_datastore.
+        :return dict runs: the outcome of each rule, by rule code.
+        """
+        runs_by_code = {}
+        if self.previous is not None:
+            changed = self.changed_tables(data_store)
+            logger.info(
+                f"Changed since the previous validation: {', '.join(sorted(changed))}"
+            )
+            for rule in rules:
+                previous_run = self.previous.runs.get(rule.code)
+                if (
+                    previous_run is not None
+                    and previous_run.result is not None
+                    and self.previous.rules.get(rule.code) == rule
+                    and "metadata" not in changed
+                    and not changed
+                    & (
+                        table_names(rule)
+                        | previous_run.tables_used
+                        | previous_run.tables_checked
+                    )
+                ):
+                    # the time taken and any shared writes were reported by the previous validation.
+                    runs_by_code[rule.code] = replace(
+                        previous_run, profile=None, shared_writes=[]
+                    )
+            self.reused = list(runs_by_code)
+            rules = [rule for rule in rules if rule.code not in runs_by_code]
+            logger.info(f"{len(self.reused)} rule results reused")
+
+        if self.cache is not None:
+            for rule in rules:
+                run = self.cache.get(rule, data_store)
+                if run is not None:
+                    runs_by_code[rule.code] = run
+                    self.cache_hits.append(rule.code)
+            rules = [rule for rule in rules if rule.code not in runs_by_code]
+            logger.info(f"{len(self.cache_hits)} rule results taken from the cache")
+
+        if self.partitions:
+            runs = run_rules_sharded(
+                rules,
+                data_store,
+                self.partitions,
+                self.workers,
+                self.check_shared_writes,
+                self.trace_memory,
+            )
+        elif self.workers:
+            runs = run_rules_in_pool(
+                rules,
+                data_store,
+                self.workers,
+                self.check_shared_writes,
+                self.trace_memory,
+            )
+        else:
+            guard = SharedWriteGuard(data_store) if self.check_shared_writes else None
+            runs = (run_rule(rule, data_store, guard) for rule in rules)
+
+        for rule, run in zip(rules, runs):
+            runs_by_code[rule.code] = run
+            if self.cache is not None and run.result is not None:
+                self.cache.put(rule, data_store, run)
+        if self.cache is not None:
+            self.cache.evict()
+        return runs_by_code
+
+    def state(self) -> ValidationState:
+        """
+        :return: what a later validation needs from this one to reuse its rule results, given as its
+            previous validation. Unlike the validator, it holds none of the uploaded tables.
+        :rtype: ValidationState
+        """
+        return ValidationState(
+            content_hashes={
+                key: self.data_store.content_hash(key) for key in self.data_store
+            },
+            runs=dict(self.runs),
+            rules={code: self.registry[code] for code in self.runs},
+        )
+
     def validate(self, selected_rules: Optional[list[str]] = None):
         logger.info("Creating Data store...")
-        data_store = create_datastore(self.dfs, self.metadata)
+        data_store = create_datastore(self.dfs, self.metadata, self.profile)
 
         rules_to_run = self.get_rules_to_run(self.registry, selected_rules)
 
-        # this corresponds to raw_data in CINvalidationSession
-        self.ds_results = copy_datastore(data_store)
+        # rules whose tables were not uploaded are skipped without being called.
+        schedule = schedule_rules(rules_to_run, data_store)
+        skipped = {rule.code for rule in schedule.skipped}
+        runnable = schedule.runnable
 
-        for rule_code, rule in rules_to_run.items():
-            logger.info(f"Validating rule {rule_code}...")
+        runs_by_code = self.run_rules(runnable, data_store)
+        # kept so that this validation can be the previous one of the next, see state.
+        self.data_store = data_store
+        self.runs = runs_by_code
+        self.previous = None
 
-            # get a clean copy of the files to be validated
-            ds_copy = copy_datastore(data_store)
+        for rule in rules_to_run.values():
+            if rule.code in skipped:
+                result = {}
+            else:
+                run = runs_by_code[rule.code]
+                result = run.result
+                self.profile.add(run.profile)
+                if run.shared_writes:
+                    self.shared_writes[rule.code] = run.shared_writes
 
-            try:
-                # get the result from when the rule is run on the data.
-                result: dict[str, list[Any]] = rule.func(ds_copy)
-            except Exception as e:
-                # document instances where the rule cannot run on the data
-                logger.exception(f"Rule code {rule_code} failed to run!")
-                self.fails.append(rule_code)
+            if result is None:
+                self.fails.append(rule.code)
                 continue
 
             if result == {}:
@@ -111,7 +284,15 @@ class LacValidator:
                             f"{rule.code} returned {nof_nans} NaNs! "
                             + f"Output: {str(values)}"
                         )
-                    self.ds_results[table].loc[values, f"ERR_{rule.code}"] = True
+                    self.errors.add(rule.code, table, values)
+
+        # this corresponds to raw_data in CINvalidationSession
+        with self.profile.step("results", "flag tables"):
+            self.ds_results = self.errors.flag_tables(data_store)
+            if self.categorical_codes:
+                for table, df in self.ds_results.items():
+                    if table != "metadata":
+                        self.ds_results[table] = categorical_to_object(df)
 
 
 def create_issue_df(report: DataFrame, error_report: DataFrame):
@@ -0,0 +1,324 @@
+import importlib.metadata
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+if TYPE_CHECKING:
+    from qlacref_postcodes import Postcodes
+
+logger = logging.getLogger(__name__)
+
+# Set to the directory of a postcode index built by `python -m lac_validator postcode-index`.
+POSTCODE_INDEX_VARIABLE = "LAC_VALIDATOR_POSTCODE_INDEX"
+
+# Letters the postcode reference data is split by.
+POSTCODE_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+_INFO_FILE = "index.json"
+# The arrays an index is made of, each saved in a .npy file of the same name.
+_ARRAYS = (
+    "pcd_abbr",
+    "pcd",
+    "oseast1m",
+    "osnrth1m",
+    "laua_numbers",
+    "laua_codes",
+    "ltla_codes",
+    "utla_codes",
+    "utla_names",
+)
+_INDEX_FILES = {_INFO_FILE} | {f"{name}.npy" for name in _ARRAYS}
+
+
+def _postcodes_version() -> str:
+    # imported here, as the postcode reference data is only loaded when first used.
+    import qlacref_postcodes
+
+    return qlacref_postcodes.__version__
+
+
+def _authorities_version() -> str:
+    try:
+        return importlib.metadata.version("quality-lac-data-ref-authorities")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _search(keys: np.ndarray, values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :param np.ndarray keys: sorted array of fixed width strings.
+    :param pd.Series values: values to look for in keys.
+
+    :return: the positions in values of the strings found in keys, and where in keys each was found.
+    :rtype: tuple
+    """
+    width = keys.dtype.itemsize
+    if keys.dtype.kind == "U":
+        width //= np.dtype("U1").itemsize
+    lengths = values.str.len()
+    candidates = np.flatnonzero((lengths.gt(0) & lengths.le(width)).to_numpy())
+    queries = values.iloc[candidates]
+    if keys.dtype.kind == "S":
+        # characters that are not ASCII become "?", which no key has.
+        queries = queries.str.encode("ascii", "replace")
+    queries = np.array(queries.tolist(), dtype=keys.dtype)
+
+    positions = np.searchsorted(keys, queries)
+    in_range = positions < len(keys)
+    found = np.zeros(len(queries), dtype=bool)
+    found[in_range] = keys[positions[in_range]] == queries[in_range]
+    return candidates[found], positions[found]
+
+
+def _check_index_directory(directory: Path):
+    """
+    Raises ValueError if directory holds files that are not part of an index, so that publishing
+    an index there would need to overwrite or remove them.
+    """
+    if not directory.is_dir():
+        return
+    others = sorted(
+        path.name for path in directory.iterdir() if path.name not in _INDEX_FILES
+    )
+    if others:
+        raise ValueError(
+            f"{directory} is not a postcode index directory, as it holds {', '.join(others)}. "
+            f"Set {POSTCODE_INDEX_VARIABLE} to an empty or new directory."
+        )
+
+
+class PostcodeIndex:
+    """
+    Every postcode of the postcode reference data, in arrays on disk that are memory-mapped rather
+    than read. Looking postcodes up only reads the parts of the arrays that a binary search of the
+    sorted postcodes touches, so it does not load any of the reference data into memory first.
+
+    Postcodes are kept without spaces, with their coordinates and the position of their local
+    authority (laua) in a short list of local authority codes. The index also holds the upper tier
+    local authority of each lower tier one, so that neither needs the reference data loaded.
+
+    As the arrays are memory-mapped, processes that use the same index share one copy of them in
+    memory, see publish.
+
+    :param directory: directory the index was built in, see build.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        with open(self.directory / _INFO_FILE) as file:
+            info = json.load(file)
+        self.version = info["version"]
+        self.authorities_version = info.get("authorities_version")
+
+        def load(name, mmap_mode="r"):
+            return np.load(self.directory / f"{name}.npy", mmap_mode=mmap_mode)
+
+        self.keys = load("pcd_abbr")
+        self.pcd = load("pcd")
+        self.oseast1m = load("oseast1m")
+        self.osnrth1m = load("osnrth1m")
+        self.laua_numbers = load("laua_numbers")
+        # the last code stands for postcodes with no local authority, which have the number -1.
+        self.laua_codes = np.append(load("laua_codes", None).astype(object), np.nan)
+        self.ltla_codes = load("ltla_codes")
+        self.utla_codes = load("utla_codes")
+        self.utla_names = load("utla_names")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def build(
+        cls, directory: Union[str, Path], source: "Postcodes", authorities: DataFrame
+    ) -> "PostcodeIndex":
+        """
+        Writes an index of every postcode in source, and of the upper tier local authority of each
+        lower tier one in authorities, to directory.
+
+        :param directory: directory to write the index to. It is created if it does not exist.
+        :param Postcodes source: the postcode reference data.
+        :param DataFrame authorities: the local authority reference data, with the columns LTLA21CD,
+            UTLA21CD and UTLA21NM.
+
+        :return: the index.
+        :rtype: PostcodeIndex
+        """
+        source.load_postcodes(POSTCODE_LETTERS)
+        postcodes = source.dataframe
+        if len(postcodes) == 0:
+            raise ValueError("No postcodes found to index")
+
+        keys = postcodes["pcd_abbr"].to_numpy(dtype=str).astype(np.bytes_)
+        order = np.argsort(keys, kind="stable")
+        laua_numbers, laua_codes = pd.factorize(postcodes["laua"], sort=True)
+        authorities = authorities.sort_values("LTLA21CD")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "pcd_abbr": keys[order],
+            "pcd": postcodes["pcd"].to_numpy(dtype=str).astype(np.bytes_)[order],
+            "oseast1m": postcodes["oseast1m"].to_numpy(dtype=np.float64)[order],
+            "osnrth1m": postcodes["osnrth1m"].to_numpy(dtype=np.float64)[order],
+            "laua_numbers": laua_numbers.astype(np.int16)[order],
+            "laua_codes": np.asarray(laua_codes, dtype=str),
+            "ltla_codes": authorities["LTLA21CD"].to_numpy(dtype=str),
+            "utla_codes": authorities["UTLA21CD"].to_numpy(dtype=str),
+            "utla_names": authorities["UTLA21NM"].to_numpy(dtype=str),
+        }
+        for name in _ARRAYS:
+            np.save(directory / f"{name}.npy", arrays[name])
+        # written last, so that an index only counts as built once all its arrays are.
+        with open(directory / _INFO_FILE, "w") as file:
+            json.dump(
+                {
+                    "version": _postcodes_version(),
+                    "authorities_version": _authorities_version(),
+                },
+                file,
+            )
+        logger.info(f"Indexed {len(keys)} postcodes in {directory}")
+        return cls(directory)
+
+    @classmethod
+    def open(cls, directory: Union[str, Path]) -> Optional["PostcodeIndex"]:
+        """
+        :param directory: directory the index was built in.
+
+        :return: the index in directory, or None if it holds no index, or one built from other versions
+            of the reference data.
+        :rtype: PostcodeIndex
+        """
+        try:
+            index = cls(directory)
+        except FileNotFoundError:
+            logger.warning(f"No postcode index found in {directory}")
+            return None
+        versions = (_postcodes_version(), _authorities_version())
+        if (index.version, index.authorities_version) != versions:
+            logger.warning(
+                f"Postcode index in {directory} was built from versions {index.version} and "
+                f"{index.authorities_version} of the postcode and local authority reference data, "
+                f"not {versions[0]} and {versions[1]}. It will not be used."
+            )
+            return None
+        return index
+
+    @classmethod
+    def from_env(cls) -> Optional["PostcodeIndex"]:
+        """
+        :return: the index in the directory set in LAC_VALIDATOR_POSTCODE_INDEX, or None if no directory is
+            set, it holds no index, or the index was built from other versions of the reference data.
+        :rtype: PostcodeIndex
+        """
+        directory = os.getenv(POSTCODE_INDEX_VARIABLE)
+        if not directory:
+            return None
+        return cls.open(directory)
+
+    @classmethod
+    def publish(
+        cls,
+        directory: Union[str, Path],
+        source: Callable[[], "Postcodes"],
+        authorities: Callable[[], DataFrame],
+    ) -> "PostcodeIndex":
+        """
+        Builds the index in directory unless it is already there, so that the processes on a host build
+        it once between them and then share it.
+
+        The index is built next to directory and moved into place once complete, so other processes
+        never open a partly built index. If another process moves its index into place first, that
+        one is used. An index built from other versions of the reference data is replaced.
+
+        Raises ValueError if directory holds anything other than an index, as it is not
+        an index directory.
+
+        :param directory: directory to publish the index in.
+        :param source: returns the postcode reference data. Only called if the index is built.
+        :param authorities: returns the local authority reference data. Only called if the index is built.
+
+        :return: the index.
+        :rtype: PostcodeIndex
+        """
+        directory = Path(directory)
+        _check_index_directory(directory)
+        if (directory / _INFO_FILE).is_file():
+            index = cls.open(directory)
+            if index is not None:
+                return index
+            logger.info(f"Replacing the postcode index in {directory}")
+            # the info file goes first, so that the index no longer counts as built.
+            for name in [_INFO_FILE] + [f"{name}.npy" for name in _ARRAYS]:
+                (directory / name).unlink(missing_ok=True)
+
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=directory.parent) as build_directory:
+            built = Path(build_directory) / "index"
+            cls.build(built, source(), authorities())
+            try:
+                # replaces directory if it is empty.
+                os.rename(built, directory)
+            except OSError:
+                if not (directory / _INFO_FILE).is_file():
+                    _check_index_directory(directory)
+                    raise
+                logger.info(
+                    f"Using the postcode index published in {directory} meanwhile"
+                )
+        return cls(directory)
+
+    def lookup(self, abbreviations: pd.Series) -> DataFrame:
+        """
+        :param pd.Series abbreviations: upper-case postcodes without spaces.
+
+        :return: the postcode (pcd), coordinates (oseast1m and osnrth1m), local authority (laua) and
+            postcode without spaces (pcd_abbr) of each of abbreviations, as merging them with the
+            postcode reference data would give. Values are missing for postcodes that are not found.
+        :rtype: DataFrame
+        """
+        rows, positions = _search(self.keys, abbreviations)
+
+        pcd = np.full(len(abbreviations), np.nan, dtype=object)
+        pcd[rows] = self.pcd[positions].astype(str)
+        pcd_abbr = np.full(len(abbreviations), np.nan, dtype=object)
+        pcd_abbr[rows] = self.keys[positions].astype(str)
+        oseast1m = np.full(len(abbreviations), np.nan)
+        oseast1m[rows] = self.oseast1m[positions]
+        osnrth1m = np.full(len(abbreviations), np.nan)
+        osnrth1m[rows] = self.osnrth1m[positions]
+        laua = np.full(len(abbreviations), np.nan, dtype=object)
+        laua[rows] = self.laua_codes[self.laua_numbers[positions]]
+
+        return DataFrame(
+            {
+                "pcd": pcd,
+                "oseast1m": oseast1m,
+                "osnrth1m": osnrth1m,
+                "laua": laua,
+                "pcd_abbr": pcd_abbr,
+            }
+        )
+
+    def upper_tier(self, laua: pd.Series) -> DataFrame:
+        """
+        :param pd.Series laua: lower tier local authority codes.
+
+        :return: the code (UTLA21CD) and name (UTLA21NM) of the upper tier local authority of each
+            of laua, as merging them with the local authority reference data would give. Values are
+            missing for codes that are not found.
+        :rtype: DataFrame
+        """
+        rows, positions = _search(self.ltla_codes, laua)
+        utla_codes = np.full(len(laua), np.nan, dtype=object)
+        utla_codes[rows] = self.utla_codes[positions]
+        utla_names = np.full(len(laua), np.nan, dtype=object)
+        utla_names[rows] = self.utla_names[positions]
+        return DataFrame({"UTLA21CD": utla_codes, "UTLA21NM": utla_names})
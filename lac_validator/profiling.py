@@ -0,0 +1,122 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+
+import pandas as pd
+
+
+@dataclass
+class StepProfile:
+    """
+    The resources used by one step of a validation.
+
+    :param str section: the part of the validation the step belongs to, e.g. 'ingress', 'datastore' or 'rules'.
+    :param str name: the name of the step, e.g. the rule code.
+    :param float wall_time: time taken by the step, in seconds.
+    :param float cpu_time: CPU time used by the process running the step, in seconds.
+    :param int peak_memory: the most memory allocated by the step at any one time, in bytes. None if
+        memory was not being traced.
+    """
+
+    section: str
+    name: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int] = None
+
+
+class Measurement:
+    """
+    Measures the block it is used as a context manager for. The result is in step once the block exits.
+    """
+
+    def __init__(self, section: str, name: str):
+        self.section = section
+        self.name = name
+        self.step: Optional[StepProfile] = None
+
+    def __enter__(self):
+        self._tracing = tracemalloc.is_tracing()
+        if self._tracing:
+            self._memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._wall_time = time.perf_counter()
+        self._cpu_time = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.step = StepProfile(
+            section=self.section,
+            name=self.name,
+            wall_time=time.perf_counter() - self._wall_time,
+            cpu_time=time.process_time() - self._cpu_time,
+            peak_memory=(
+                tracemalloc.get_traced_memory()[1] - self._memory
+                if self._tracing
+                else None
+            ),
+        )
+        return False
+
+
+@contextmanager
+def memory_tracing(enabled: bool = True):
+    """
+    Traces memory allocations inside the block, so that steps measured in it record their peak memory.
+    Tracing slows down everything run inside the block.
+    """
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+class Profile:
+    """
+    The resources used by each step of a validation, in the order the steps were run.
+    Steps are measured one after another, so they should not be nested.
+    """
+
+    def __init__(self):
+        self.steps: list[StepProfile] = []
+
+    @contextmanager
+    def step(self, section: str, name: str) -> Iterator[None]:
+        measurement = Measurement(section, name)
+        try:
+            with measurement:
+                yield
+        finally:
+            self.add(measurement.step)
+
+    def add(self, step: Optional[StepProfile]):
+        if step is not None:
+            self.steps.append(step)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        :return: one row per step, with the columns of StepProfile.
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame(
+            [asdict(step) for step in self.steps],
+            columns=["section", "name", "wall_time", "cpu_time", "peak_memory"],
+        )
+
+    def summary(self, top: int = 20) -> pd.DataFrame:
+        """
+        :param int top: number of rules to include.
+
+        :return: every step other than running rules, followed by the slowest rules.
+        :rtype: pd.DataFrame
+        """
+        df = self.to_frame()
+        is_rule = df["section"] == "rules"
+        slowest_rules = df[is_rule].sort_values("wall_time", ascending=False).head(top)
+        return pd.concat([df[~is_rule], slowest_rules], ignore_index=True)
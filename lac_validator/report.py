@@ -1,6 +1,7 @@
 import logging
 from io import BytesIO
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
@@ -12,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 class Report:
     def __init__(self, data_store, ruleset_registry):
+        self.__report = None
         self.__child_report = None
         self.__child_summary = None
         self.__error_report = None
@@ -33,6 +35,13 @@ class Report:
         )
 
         dataframes = []
+        # the data columns of each table, and the rows of the report each table starts at, so that the
+        # context of a row is only made once it is known to have errors, see _context.
+        self._data = {}
+        self._starts = []
+        # the error columns of each table, so that only the errors a table can have are looked for in it.
+        self._table_error_cols = {}
+        start = 0
         for table, value in data_store.items():
             if table == "metadata":
                 # report should only contain child-level data.
@@ -47,15 +56,83 @@ class Report:
             df_error = value[["CHILD"] + cols_error].copy()
             df_error["Table"] = table
             df_error["RowID"] = df_error.index
-            df_error["Context"] = value[cols_data].apply(lambda row: {**row}, axis=1)
 
             dataframes.append(df_error)
+            self._data[table] = value[cols_data]
+            self._table_error_cols[table] = cols_error
+            self._starts.append(start)
+            start += len(value)
 
         report = pd.concat(dataframes, ignore_index=True)
-        self.child_cols = ["Table", "RowID", "CHILD", "Context"]
+        self.child_cols = ["Table", "RowID", "CHILD"]
         self.error_cols = [c for c in report.columns if c not in self.child_cols]
         report["Total Errors"] = report[self.error_cols].sum(axis=1)
-        self.report = report[self.child_cols + self.error_cols + ["Total Errors"]]
+        # the report without the Context column, which is all that is needed to list the errors.
+        self.error_flags = report[self.child_cols + self.error_cols + ["Total Errors"]]
+
+    @property
+    def report(self):
+        """
+        The report contains a row for every row of every table, with the data of the row in Context and
+        a column of the errors found by each rule. The Context of every row is only made when first asked
+        for, so error_flags is quicker where it is not needed.
+        """
+        if self.__report is None:
+            report = self.error_flags.copy(deep=False)
+            report.insert(
+                len(self.child_cols), "Context", self._context(np.arange(len(report)))
+            )
+            self.__report = report
+        return self.__report
+
+    def _context(self, rows: np.ndarray) -> np.ndarray:
+        """
+        :param np.ndarray rows: positions of rows in the report.
+
+        :return: the context of each of rows, a dict of the values in the data columns of the row.
+            Rows that appear more than once share a dict.
+        :rtype: np.ndarray
+        """
+        distinct, inverse = np.unique(rows, return_inverse=True)
+        context = np.empty(len(distinct), dtype=object)
+        ends = self._starts[1:] + [len(self.error_flags)]
+        for data, start, end in zip(self._data.values(), self._starts, ends):
+            first, last = np.searchsorted(distinct, [start, end])
+            if first == last:
+                continue
+            table_rows = data.iloc[distinct[first:last] - start]
+            values = table_rows.values
+            if values.dtype.kind in "mM":
+                # the values of tables of only dates are Timestamps, as when taken row by row.
+                values = table_rows.astype(object).values
+            columns = list(data.columns)
+            context[first:last] = [dict(zip(columns, row)) for row in values]
+        return context[inverse]
+
+    def _flagged(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the errors in the error columns of each table, rather than in every error column of
+        the report, most of which are empty for any one table.
+
+        :return: the position in the report of the row of each error, and the position in error_cols
+            of its column, ordered by column and then by row.
+        :rtype: tuple
+        """
+        positions = {c: i for i, c in enumerate(self.error_cols)}
+        ends = self._starts[1:] + [len(self.error_flags)]
+        rows, columns = [np.array([], dtype=int)], [np.array([], dtype=int)]
+        for cols, start, end in zip(
+            self._table_error_cols.values(), self._starts, ends
+        ):
+            if not cols:
+                continue
+            flags = (self.error_flags.iloc[start:end][cols] == True).to_numpy()
+            table_rows, table_columns = np.nonzero(flags)
+            rows.append(table_rows + start)
+            columns.append(np.array([positions[c] for c in cols])[table_columns])
+        rows, columns = np.concatenate(rows), np.concatenate(columns)
+        order = np.lexsort((rows, columns))
+        return rows[order], columns[order]
 
     @property
     def error_report(self):
@@ -65,7 +142,7 @@ class Report:
         """
         if self.__error_report is None:
             df = pd.DataFrame(
-                self.report[self.error_cols].sum(), columns=["Count"]
+                self.error_flags[self.error_cols].sum(), columns=["Count"]
             ).reset_index()
             df["Code"] = df["index"].str[4:]
             df = df[["Code", "Count"]]
@@ -103,23 +180,16 @@ class Report:
         from the affected row.
         """
         if self.__child_report is None:
-            child_report = self.report.melt(
-                id_vars=self.child_cols,
-                value_vars=self.error_cols,
-                var_name="ErrorColumn",
-                value_name="IsError",
-            )
-            child_report = child_report[child_report.IsError == True].reset_index()
-            child_report["Code"] = child_report.ErrorColumn.str[4:]
-
-            child_error_count = (
-                child_report[["CHILD", "Code"]]
-                .groupby("CHILD")
-                .agg(**{"Child Error Count": ("Code", "count")})
-                .reset_index()
-            )
+            rows, columns = self._flagged()
+            codes = np.array([c[4:] for c in self.error_cols], dtype=object)
 
-            child_report = child_report.merge(child_error_count, on="CHILD", how="left")
+            child_report = (
+                self.error_flags[self.child_cols].iloc[rows].reset_index(drop=True)
+            )
+            child_report["Code"] = codes[columns]
+            child_report["Context"] = self._context(rows)
+            child_error_count = child_report.groupby("CHILD")["Code"].transform("count")
+            child_report["Child Error Count"] = child_error_count
 
             error_report = self.error_report.rename(
                 columns=dict(Count="Error Type Count")
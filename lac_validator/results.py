@@ -0,0 +1,92 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from lac_validator.datastore import copy_datastore
+from lac_validator.executor import RuleRun
+from lac_validator.rule_engine import RuleDefinition
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorLocations:
+    """
+    The rows flagged by each rule, kept as the row labels returned by the rule per table and
+    rule code. This only grows with the number of errors found, whereas a column per rule grows
+    with the number of rules run times the number of rows.
+    """
+
+    def __init__(self):
+        self._locations: dict[str, dict[str, list[Any]]] = {}
+
+    def add(self, code: str, table: str, locations: list[Any]):
+        """
+        :param str code: code of the rule that flagged the rows.
+        :param str table: name of the table the rows are in.
+        :param list locations: index labels of the flagged rows.
+        """
+        self._locations.setdefault(table, {})[code] = locations
+
+    def __iter__(self) -> Iterator[tuple[str, str, list[Any]]]:
+        """
+        :return: the (table, rule code, row labels) of every rule that flagged rows, in the order they were added.
+        """
+        for table, locations in self._locations.items():
+            for code, labels in locations.items():
+                yield table, code, labels
+
+    def flag_tables(self, data_store) -> dict[str, Any]:
+        """
+        Builds the tables of the datastore with an ERR_<code> column for each rule that flagged rows
+        in them, holding True for the flagged rows and NaN elsewhere. Each table is built once,
+        rather than a column at a time.
+
+        :param dict data_store: datastore as returned by create_datastore.
+
+        :return: a copy of the datastore with the error columns added.
+        :rtype: dict
+        """
+        flagged = copy_datastore(data_store)
+        for table, locations in self._locations.items():
+            if table not in flagged:
+                logger.warning(
+                    f"Rules {', '.join(locations)} returned errors in unknown table {table}!"
+                )
+                continue
+
+            df = flagged[table]
+            columns = {}
+            for code, labels in locations.items():
+                positions = df.index.get_indexer_for(labels)
+                if (positions < 0).any():
+                    logger.warning(
+                        f"{code} returned locations not found in {table}: "
+                        + str([l for l, p in zip(labels, positions) if p < 0])
+                    )
+                column = np.full(len(df), np.nan, dtype=object)
+                column[positions[positions >= 0]] = True
+                columns[f"ERR_{code}"] = column
+
+            flagged[table] = pd.concat(
+                [df, pd.DataFrame(columns, index=df.index)], axis=1, copy=False
+            )
+        return flagged
+
+
+@dataclass
+class ValidationState:
+    """
+    What a later validation needs from an earlier one to reuse its rule results, see
+    LacValidator.state. Unlike the validation itself, it holds none of the uploaded tables.
+
+    :param dict content_hashes: hash of the content of each table of the datastore, and of 'metadata'.
+    :param dict runs: the outcome of each rule, by rule code.
+    :param dict rules: the definition of each rule in runs, by rule code.
+    """
+
+    content_hashes: dict[str, str]
+    runs: dict[str, RuleRun]
+    rules: dict[str, RuleDefinition]
@@ -1,7 +1,19 @@
-from .__registry import rule_definition, RuleDefinition, YearConfig
+from .__registry import (
+    rule_definition,
+    load_rule,
+    LazyRuleFunction,
+    RuleDefinition,
+    YearConfig,
+)
+from .__scheduler import schedule_rules, table_names, RuleSchedule
 
 __all__ = [
     "rule_definition",
+    "load_rule",
+    "LazyRuleFunction",
     "RuleDefinition",
     "YearConfig",
+    "schedule_rules",
+    "table_names",
+    "RuleSchedule",
 ]
@@ -1,6 +1,7 @@
+import importlib
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 
 @dataclass(frozen=True, eq=True)
@@ -13,6 +14,10 @@ class RuleDefinition:
     :param Callable func: logic of the validation rule function.
     :param str message: The message to be displayed if rule is flagged.
     :param str affected_fields: The fields/columns affected by a validation rule.
+    :param list tables: The tables the rule needs in order to run. A tuple of tables in the list
+        means that any one of them is enough.
+    :param bool cross_child: Whether the result of the rule for a child depends on the rows of
+        other children, so that it cannot be run on part of the children, see run_rules_sharded.
 
     :returns: RuleDefinition object containing information about validation rules.
     :rtype: dataclass object.
@@ -23,6 +28,7 @@ class RuleDefinition:
     message: Optional[str] = None
     affected_fields: Optional[list[str]] = None
     tables: Optional[list[str]] = (None,)
+    cross_child: bool = False
 
 
 def rule_definition(
@@ -30,6 +36,7 @@ def rule_definition(
     message: Optional[str] = None,
     affected_fields: Optional[list[str]] = None,
     tables: Optional[list[str]] = None,
+    cross_child: bool = False,
 ):
     """
     Creates the rule definition for validation rules using RuleDefinition class as a template.
@@ -37,6 +44,8 @@ def rule_definition(
     :param str code: The rule code for each rule.
     :param str message: The message displayed for each validation rule.
     :param str affected_fields: The fields/columns affected by a validation rule.
+    :param list tables: The tables the rule needs in order to run.
+    :param bool cross_child: Whether the result of the rule for a child depends on other children.
 
     :returns: RuleDefinition object containing information about validation rules.
     :rtype: RuleDefiniton class object.
@@ -53,6 +62,7 @@ def rule_definition(
             message=message,
             affected_fields=affected_fields,
             tables=tables,
+            cross_child=cross_child,
         )
         # when validator funcs are created, give them a unique attribute that they can be
         # recognised by when the file is read later.
@@ -66,3 +76,67 @@ def rule_definition(
 class YearConfig:
     deleted: list[str]
     added_or_modified: dict[str, RuleDefinition]
+
+
+def load_rule(module_name: str, qualname: str, code: str) -> RuleDefinition:
+    """
+    Imports the module of a rule and finds the rule in it.
+
+    :param str module_name: module the rule function is defined in.
+    :param str qualname: qualified name of the rule function.
+    :param str code: the rule code.
+
+    :returns: the rule defined in the module.
+    :rtype: RuleDefinition
+    """
+    module = importlib.import_module(module_name)
+    for element in vars(module).values():
+        rule = getattr(element, "rule", None)
+        if (
+            isinstance(rule, RuleDefinition)
+            and rule.code == code
+            and rule.func.__module__ == module_name
+            and rule.func.__qualname__ == qualname
+        ):
+            return rule
+    raise LookupError(f"Rule {code} not found in {module_name}")
+
+
+class LazyRuleFunction:
+    """
+    Stands in for the function of a rule read from a manifest, importing the module of the rule
+    only when it is first called. It has the module and qualified name of the function it stands in for.
+    """
+
+    def __init__(self, module_name: str, qualname: str, code: str):
+        self.__module__ = module_name
+        self.__qualname__ = qualname
+        self.__name__ = qualname.rsplit(".", 1)[-1]
+        self.code = code
+        self._func: Optional[Callable] = None
+
+    def load(self) -> Callable:
+        """
+        :returns: the rule function, importing its module if that has not been done yet.
+        :rtype: Callable
+        """
+        if self._func is None:
+            self._func = load_rule(self.__module__, self.__qualname__, self.code).func
+        return self._func
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def _key(self) -> tuple[str, str, str]:
+        return self.__module__, self.__qualname__, self.code
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LazyRuleFunction):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"LazyRuleFunction({self.__module__}.{self.__qualname__})"
@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Union
+
+from .__registry import RuleDefinition
+
+# Rules that need the Ofsted URN lookup declare it under this name in their tables.
+PROVIDER_INFO = "Provider Info"
+
+# A table name, or a tuple of alternative tables of which the rule needs at least one.
+TableRequirement = Union[str, tuple[str, ...]]
+
+
+def required_tables(rule: RuleDefinition) -> Optional[frozenset[TableRequirement]]:
+    """
+    :param RuleDefinition rule: rule whose table requirements are wanted.
+
+    :return: the tables the rule needs to run, or None if the rule does not declare them.
+    :rtype: frozenset
+    """
+    if not rule.tables or None in rule.tables:
+        return None
+    return frozenset(rule.tables)
+
+
+def table_names(rule: RuleDefinition) -> set[str]:
+    """
+    :param RuleDefinition rule: rule whose tables are wanted.
+
+    :return: the names of every table the rule declares, including each of a tuple of alternatives.
+    :rtype: set
+    """
+    names = set()
+    for table in rule.tables or []:
+        if isinstance(table, tuple):
+            names.update(table)
+        elif table is not None:
+            names.add(table)
+    return names
+
+
+def table_available(table: TableRequirement, data_store: Mapping) -> bool:
+    """
+    :param table: table name as declared by a rule, e.g. 'Episodes_last' or 'Provider Info'.
+        A tuple of names is available if any one of them is.
+    :param dict data_store: datastore as returned by create_datastore.
+
+    :return: whether the table can be given to rules.
+    :rtype: bool
+    """
+    if isinstance(table, tuple):
+        return any(table_available(t, data_store) for t in table)
+    if table == PROVIDER_INFO:
+        return "provider_info" in data_store.get("metadata", {})
+    return table in data_store
+
+
+@dataclass
+class RuleSchedule:
+    """
+    The order in which rules are run on a datastore.
+
+    :param list batches: runnable rules grouped by the tables they need. Rules that need the same
+        tables are run one after another.
+    :param list skipped: rules that cannot run because a table they need was not uploaded.
+    """
+
+    batches: list[list[RuleDefinition]] = field(default_factory=list)
+    skipped: list[RuleDefinition] = field(default_factory=list)
+
+    @property
+    def runnable(self) -> list[RuleDefinition]:
+        return [rule for batch in self.batches for rule in batch]
+
+
+def schedule_rules(
+    rules: Mapping[str, RuleDefinition], data_store: Mapping
+) -> RuleSchedule:
+    """
+    Decides, from the tables declared by each rule, which rules can run on the datastore
+    without calling them.
+
+    :param dict rules: rules to be run, keyed by rule code.
+    :param dict data_store: datastore as returned by create_datastore.
+
+    :return: runnable rules grouped by the tables they need, and the rules to be skipped.
+    :rtype: RuleSchedule
+    """
+    schedule = RuleSchedule()
+    batches: dict[frozenset[TableRequirement], list[RuleDefinition]] = {}
+    undeclared: list[RuleDefinition] = []
+    for rule in rules.values():
+        tables = required_tables(rule)
+        if tables is None:
+            undeclared.append(rule)
+        elif all(table_available(table, data_store) for table in tables):
+            batches.setdefault(tables, []).append(rule)
+        else:
+            schedule.skipped.append(rule)
+
+    schedule.batches = [
+        batches[tables] for tables in sorted(batches, key=lambda t: sorted(map(str, t)))
+    ]
+    if undeclared:
+        schedule.batches.append(undeclared)
+    return schedule
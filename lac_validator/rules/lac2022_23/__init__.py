@@ -1,8 +1,14 @@
 from pathlib import Path
 
-from lac_validator.rules.ruleset_utils import extract_validator_functions
+from lac_validator.rule_engine import RuleDefinition
+from lac_validator.rules.ruleset_utils import extract_validator_functions, lazy_registry
 
-files = Path(__file__).parent.glob("*.py")
-registry = extract_validator_functions(files)
+
+def load_registry() -> dict[str, RuleDefinition]:
+    files = Path(__file__).parent.glob("*.py")
+    return extract_validator_functions(files)
+
+
+__getattr__ = lazy_registry(__name__, load_registry)
 
 __all__ = ["registry"]
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -44,9 +45,7 @@ def validate(dfs):
         )
         episodes.drop_duplicates(subset=["CHILD", "DECOM"])
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = parse_dates(dfs, "Header", "DOB")
         header = header[header["DOB"].notnull()]
         header["DOB14"] = header["DOB"] + pd.DateOffset(years=14)
         header["DOB16"] = header["DOB"] + pd.DateOffset(years=16)
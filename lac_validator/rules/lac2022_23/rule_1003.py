@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,12 +18,10 @@ def validate(dfs):
         placed_adoption = dfs["PlacedAdoption"]
 
         # to datetime
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # select the earliest episodes with RNE =  S
         eps_rne = episodes[episodes["RNE"] == "S"]
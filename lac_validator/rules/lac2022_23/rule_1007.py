@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,7 +19,7 @@ def validate(dfs):
         oc3 = dfs["OC3"]
         collection_end = dfs["metadata"]["collection_end"]
         # convert dates to datetime format
-        oc3["DOB"] = pd.to_datetime(oc3["DOB"], format="%d/%m/%Y", errors="coerce")
+        oc3["DOB"] = parse_dates(dfs, "OC3", "DOB")
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 import pandas as pd
@@ -23,9 +24,7 @@ def validate(dfs):
         oc3 = dfs["OC3"]
 
         # convert DECOM to datetime, drop missing/invalid sort by CHILD then DECOM,
-        episodes_last["DECOM"] = pd.to_datetime(
-            episodes_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes_last["DECOM"] = parse_dates(dfs, "Episodes_last", "DECOM")
         episodes_last = episodes_last.dropna(subset=["DECOM"]).sort_values(
             ["CHILD", "DECOM"], ascending=True
         )
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -15,7 +16,7 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         oc3 = dfs["OC3"]
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # If final <REC> = 'E3' then <IN_TOUCH>; <ACTIV> and <ACCOM> should not be provided
         epi.sort_values(["CHILD", "DECOM"], inplace=True)
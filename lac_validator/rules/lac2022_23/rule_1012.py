@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import children_not_in
 
 
 @rule_definition(
@@ -13,19 +14,10 @@ def validate(dfs):
     if "Episodes" not in dfs:
         return {}
 
-    epi = dfs["Episodes"]
-
     error_dict = {}
     for table in ["PlacedAdoption", "Missing", "Reviews", "AD1", "PrevPerm", "OC2"]:
         if table in dfs.keys():
-            df = dfs[table]
-            error_dict[table] = (
-                df.reset_index()
-                .merge(epi, how="left", on="CHILD", indicator=True)
-                .query("_merge == 'left_only'")["index"]
-                .unique()
-                .tolist()
-            )
+            error_dict[table] = children_not_in(dfs, table, "Episodes")
     return error_dict
 
 
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 
 
 @rule_definition(
@@ -15,9 +16,7 @@ def validate(dfs):
     else:
         uasc = dfs["UASC"]
         uasc["DUC_dt"] = pd.to_datetime(uasc["DUC"], format="%d/%m/%Y", errors="coerce")
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
+        collection_start = parse_metadata_date(dfs, "collection_start")
         mask = (uasc["DUC_dt"].isna() & uasc["DUC"].notna()) | (
             uasc["DUC_dt"] < collection_start
         )
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,23 +19,17 @@ def validate(dfs):
         collection_end = dfs["metadata"]["collection_end"]
 
         # datetime
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        placed_adoption["DATE_PLACED_CEASED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # Drop nans and continuing episodes
         episodes = episodes.dropna(subset=["DECOM"])
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,13 +20,9 @@ def validate(dfs):
         code_list = ["V3", "V4"]
 
         # datetime
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        placed_adoption["DATE_PLACED_CEASED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,8 +15,8 @@ def validate(dfs):
         return {}
     else:
         df = dfs["Episodes"]
-        df["DECOM"] = pd.to_datetime(df["DECOM"], format="%d/%m/%Y", errors="coerce")
-        df["DEC"] = pd.to_datetime(df["DEC"], format="%d/%m/%Y", errors="coerce")
+        df["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        df["DEC"] = parse_dates(dfs, "Episodes", "DEC")
 
         df["DECOM"] = df["DECOM"].fillna(
             "01/01/1901"
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 from lac_validator.utils import (
     add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER as add_CLA_column,  # Check 'Episodes' present before use!
 )
@@ -19,12 +20,8 @@ def validate(dfs):
         return {}
     oc2 = add_CLA_column(dfs, "OC2")
 
-    start = pd.to_datetime(
-        dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-    )
-    endo = pd.to_datetime(
-        dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-    )
+    start = parse_metadata_date(dfs, "collection_start")
+    endo = parse_metadata_date(dfs, "collection_end")
     oc2["DOB"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
 
     ERRRR = (
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 from lac_validator.utils import (
     add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER as add_CLA_column,  # Check 'Episodes' present before use!
 )
@@ -17,12 +18,8 @@ def validate(dfs):
         return {}
     oc2 = add_CLA_column(dfs, "OC2")
 
-    start = pd.to_datetime(
-        dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-    )
-    end = pd.to_datetime(
-        dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-    )
+    start = parse_metadata_date(dfs, "collection_start")
+    end = parse_metadata_date(dfs, "collection_end")
     oc2["DOB"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
     oc2["dob_4"] = oc2["DOB"] + pd.DateOffset(years=4)
     oc2["dob_17"] = oc2["DOB"] + pd.DateOffset(years=17)
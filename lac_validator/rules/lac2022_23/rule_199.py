@@ -9,6 +9,8 @@ from lac_validator.rule_engine import rule_definition
     "[NOTE: This only tests the current and previous year data loaded into the tool]",
     affected_fields=["CHILD"],
     tables=["Episodes"],
+    # sorts episodes with an unstable sort before counting them per child.
+    cross_child=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs:
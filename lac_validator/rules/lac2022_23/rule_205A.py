@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 from lac_validator.types import MissingMetadataError
 
 
@@ -9,7 +10,7 @@ from lac_validator.types import MissingMetadataError
     message="Child identified as UASC last year is no longer UASC this year, but date UASC ceased in both "
     "years does not support this.",
     affected_fields=["CHILD", "UASC"],
-    tables=["UASC", "UASC_last", "Header", "Header_last"],
+    tables=["UASC", "UASC_last"],
 )
 def validate(dfs):
     try:
@@ -58,12 +59,8 @@ def validate(dfs):
     if "UASC" not in header.columns or "UASC" not in header_last.columns:
         return {}
 
-    collection_start = pd.to_datetime(
-        dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-    )
-    collection_end = pd.to_datetime(
-        dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-    )
+    collection_start = parse_metadata_date(dfs, "collection_start")
+    collection_end = parse_metadata_date(dfs, "collection_end")
     collection_start_last = collection_start + pd.offsets.DateOffset(years=-1)
     collection_end_last = collection_end + pd.offsets.DateOffset(years=-1)
 
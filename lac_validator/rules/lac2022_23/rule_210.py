@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,9 +18,7 @@ def validate(dfs):
         episodes = dfs["Episodes"]
         collection_end = dfs["metadata"]["collection_end"]
         # convert to datetime
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
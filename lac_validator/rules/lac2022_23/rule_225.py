@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,7 +15,7 @@ def validate(dfs):
         return {}
     else:
         epi = dfs["Episodes"]
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
         epi.sort_values(["CHILD", "DECOM"], inplace=True)
         epi.reset_index(inplace=True)
         epi.reset_index(inplace=True)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,9 +18,7 @@ def validate(dfs):
         provider_info = dfs["metadata"]["provider_info"]
 
         # convert date fields from strings to datetime format. NB. REG_END is in datetime format already.
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # merge
         episodes["index_eps"] = episodes.index
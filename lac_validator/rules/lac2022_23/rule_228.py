@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,9 +20,7 @@ def validate(dfs):
         collection_end = dfs["metadata"]["collection_end"]
 
         # convert date fields from strings to datetime format. NB. REG_END is in datetime format already.
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -17,16 +18,10 @@ def validate(dfs):
     else:
         header = dfs["Header"]
         oc3 = dfs["OC3"]
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        collection_start = parse_metadata_date(dfs, "collection_start")
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = parse_dates(dfs, "Header", "DOB")
         header["DOB17"] = header["DOB"] + pd.DateOffset(years=17)
 
         oc3_merged = (
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,8 +15,8 @@ def validate(dfs):
         return {}
     else:
         uasc = dfs["UASC"]
-        uasc["DOB"] = pd.to_datetime(uasc["DOB"], format="%d/%m/%Y", errors="coerce")
-        uasc["DUC"] = pd.to_datetime(uasc["DUC"], format="%d/%m/%Y", errors="coerce")
+        uasc["DOB"] = parse_dates(dfs, "UASC", "DOB")
+        uasc["DUC"] = parse_dates(dfs, "UASC", "DUC")
         mask = uasc["DUC"].notna() & (
             uasc["DUC"] > uasc["DOB"] + pd.offsets.DateOffset(years=18)
         )
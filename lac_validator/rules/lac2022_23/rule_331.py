@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -20,10 +21,8 @@ def validate(dfs):
         adt["AD1_index"] = adt.index
         eps["Episodes_index"] = eps.index
 
-        adt["DATE_MATCH"] = pd.to_datetime(
-            adt["DATE_MATCH"], format="%d/%m/%Y", errors="coerce"
-        )
-        eps["DECOM"] = pd.to_datetime(eps["DECOM"], format="%d/%m/%Y", errors="coerce")
+        adt["DATE_MATCH"] = parse_dates(dfs, "AD1", "DATE_MATCH")
+        eps["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # Only keep the episodes where <Adopted> = 'Y'
         adoption_eps = eps[eps["REC"].isin(["E11", "E12"])]
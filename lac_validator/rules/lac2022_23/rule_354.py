@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -14,10 +15,8 @@ def validate(dfs):
         return {}
     else:
         epi = dfs["Episodes"]
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        collection_end = parse_metadata_date(dfs, "collection_end")
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
         error_mask = epi["DECOM"] > collection_end
         error_list = epi.index[error_mask].to_list()
         return {"Episodes": error_list}
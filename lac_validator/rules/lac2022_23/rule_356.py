@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
 
         error_mask = episodes["DEC"].notna() & (episodes["DEC"] < episodes["DECOM"])
 
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -17,10 +18,8 @@ def validate(dfs):
     if "Episodes" not in dfs:
         return {}
     eps = dfs["Episodes"]
-    collection_start = pd.to_datetime(
-        dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-    )
-    eps["DECOM"] = pd.to_datetime(eps["DECOM"], format="%d/%m/%Y", errors="coerce")
+    collection_start = parse_metadata_date(dfs, "collection_start")
+    eps["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
     eps = eps.loc[eps["DECOM"].notnull()]
 
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -15,10 +16,8 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         hea = dfs["Header"]
-        hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        hea["DOB"] = parse_dates(dfs, "Header", "DOB")
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
         epi.reset_index(inplace=True)
         epi = epi.merge(hea, on="CHILD", how="left", suffixes=["", "_HEA"])
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -16,11 +17,9 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
         epi.sort_values(["CHILD", "DECOM"], inplace=True)
         epi.reset_index(inplace=True)
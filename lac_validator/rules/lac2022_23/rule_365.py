@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -15,10 +16,8 @@ def validate(dfs):
     episodes = dfs["Episodes"]
     collection_end_str = dfs["metadata"]["collection_end"]
 
-    episodes.loc[episodes["DEC"].isna(), "DEC"] = collection_end_str
-    episodes["DECOM"] = pd.to_datetime(
-        episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-    )
+    episodes["DEC"] = episodes["DEC"].fillna(collection_end_str)
+    episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
     episodes["DEC"] = pd.to_datetime(
         episodes["DEC"], format="%d/%m/%Y", errors="coerce"
     )
@@ -97,8 +96,11 @@ def test_validate():
 
     test_meta = {"collection_end": "01/04/2002"}
 
-    test_dfs = {"Episodes": test_eps, "metadata": test_meta}
+    # the rule is given a shallow copy of Episodes, as when run by the validator.
+    test_dfs = {"Episodes": test_eps.copy(deep=False), "metadata": test_meta}
 
     result = validate(test_dfs)
 
     assert result == {"Episodes": [0, 2, 6, 9]}
+    # missing DEC values are filled in the rule's own column, not in the shared data.
+    assert test_eps["DEC"].isna().tolist() == [False] * 9 + [True, False, True]
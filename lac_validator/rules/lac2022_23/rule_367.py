@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 
 
 @rule_definition(
@@ -20,12 +21,8 @@ def validate(dfs):
         subset=["DECOM"]
     )  # missing DECOM should get fixed before looking for this error
 
-    collection_start = pd.to_datetime(
-        dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-    )
-    collection_end = pd.to_datetime(
-        dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-    )
+    collection_start = parse_metadata_date(dfs, "collection_start")
+    collection_end = parse_metadata_date(dfs, "collection_end")
     V3_eps["DECOM_dt"] = pd.to_datetime(
         V3_eps["DECOM"], format="%d/%m/%Y", errors="coerce"
     )
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         reviews = dfs["Reviews"]
-        reviews["DOB"] = pd.to_datetime(
-            reviews["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        reviews["REVIEW"] = pd.to_datetime(
-            reviews["REVIEW"], format="%d/%m/%Y", errors="coerce"
-        )
+        reviews["DOB"] = parse_dates(dfs, "Reviews", "DOB")
+        reviews["REVIEW"] = parse_dates(dfs, "Reviews", "REVIEW")
 
         mask = reviews["REVIEW_CODE"].eq("PN0") & (
             reviews["REVIEW"] > reviews["DOB"] + pd.offsets.DateOffset(years=4)
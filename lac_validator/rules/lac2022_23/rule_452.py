@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import child_codes, first_per_child, parse_dates
 from lac_validator.fixtures import current_episodes, previous_episodes
 
 import pandas as pd
@@ -21,15 +22,14 @@ def validate(dfs):
         episodes = dfs["Episodes"]
         episodes_last = dfs["Episodes_last"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes_last["DECOM"] = pd.to_datetime(
-            episodes_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        episodes_last["DECOM"] = parse_dates(dfs, "Episodes_last", "DECOM")
+        codes, codes_last = child_codes(dfs, "Episodes", "Episodes_last")
 
-        episodes_min = episodes.groupby("CHILD")["DECOM"].idxmin()
-        episodes_last_max = episodes_last.groupby("CHILD")["DECOM"].idxmax()
+        episodes_min = first_per_child(codes, episodes["DECOM"])
+        episodes_last_max = first_per_child(
+            codes_last, episodes_last["DECOM"], last=True
+        )
 
         episodes = episodes[episodes.index.isin(episodes_min)]
         episodes_last = episodes_last[episodes_last.index.isin(episodes_last_max)]
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,9 +19,7 @@ def validate(dfs):
         epi = epi.reset_index()
 
         epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi_last["DECOM"] = parse_dates(dfs, "Episodes_last", "DECOM")
 
         epi_last_no_dec = epi_last[epi_last["DEC"].isna()]
 
@@ -2,6 +2,7 @@ import pandas as pd
 
 from lac_validator.fixtures import current_episodes, previous_episodes
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import first_episodes_after_last
 
 
 @rule_definition(
@@ -14,29 +15,7 @@ def validate(dfs):
     if "Episodes" not in dfs or "Episodes_last" not in dfs:
         return {}
     else:
-        epi = dfs["Episodes"]
-        epi_last = dfs["Episodes_last"]
-        field = "PL_DISTANCE"
-
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        epi_last["DEC"] = pd.to_datetime(
-            epi_last["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-
-        epi.reset_index(inplace=True)
-
-        first_ep_inds = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
-        min_decom = epi.loc[first_ep_inds, :]
-
-        last_ep_inds = epi_last.groupby(["CHILD"])["DECOM"].idxmax(skipna=True)
-        max_last_decom = epi_last.loc[last_ep_inds, :]
-
-        merged_co = min_decom.merge(
-            max_last_decom, how="inner", on=["CHILD"], suffixes=["", "_PRE"]
-        )
+        merged_co = first_episodes_after_last(dfs)
 
         err_mask = (
             abs(
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,12 +20,8 @@ def validate(dfs):
         # if PLACE is equal to A3, A4, A5 or A6 then placed-for-adoption = Y
 
         # to datetime
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        ad1["DATE_INT"] = pd.to_datetime(
-            ad1["DATE_INT"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        ad1["DATE_INT"] = parse_dates(dfs, "AD1", "DATE_INT")
 
         # prepare to merge
         episodes.reset_index(inplace=True)
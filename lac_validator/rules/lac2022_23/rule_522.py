@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -15,13 +16,11 @@ def validate(dfs):
     else:
         placed_adoption = dfs["PlacedAdoption"]
         # Convert to datetimes
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        placed_adoption["DATE_PLACED_CEASED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         # Boolean mask
         mask = placed_adoption["DATE_PLACED_CEASED"] < placed_adoption["DATE_PLACED"]
@@ -1,23 +1,22 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
     code="542",
     message="A child aged under 10 at 31 March should not have conviction information completed.",
     affected_fields=["CONVICTED"],
-    tables=["OC2s"],
+    tables=["OC2"],
 )
 def validate(dfs):
     if "OC2" not in dfs:
         return {}
     else:
         oc2 = dfs["OC2"]
-        oc2["DOB"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        oc2["DOB"] = parse_dates(dfs, "OC2", "DOB")
+        collection_end = parse_metadata_date(dfs, "collection_end")
         error_mask = (
             oc2["DOB"] + pd.offsets.DateOffset(years=10) > collection_end
         ) & oc2["CONVICTED"].notna()
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,11 +18,9 @@ def validate(dfs):
         placed_adoption = dfs["PlacedAdoption"]
 
         # convert dates from string format to datetime format.
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        placed_adoption["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
 
         # Keep original index values as a column
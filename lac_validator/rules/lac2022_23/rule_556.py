@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -16,11 +17,9 @@ def validate(dfs):
         episodes = dfs["Episodes"]
         placedAdoptions = dfs["PlacedAdoption"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        placedAdoptions["DATE_PLACED"] = pd.to_datetime(
-            placedAdoptions["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        placedAdoptions["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
 
         episodes = episodes.reset_index()
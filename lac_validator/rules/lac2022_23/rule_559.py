@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,11 +19,9 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
 
         # convert dates to appropriate format
-        pa_last["DATE_PLACED"] = pd.to_datetime(
-            pa_last["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
-        )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        pa_last["DATE_PLACED"] = parse_dates(dfs, "PlacedAdoption_last", "DATE_PLACED")
+        placed_adoption["DATE_PLACED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
@@ -1,6 +1,12 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import (
+    child_codes,
+    first_per_child,
+    parse_dates,
+    parse_metadata_date,
+)
 
 
 @rule_definition(
@@ -15,22 +21,22 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         epi_last = dfs["Episodes_last"]
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        epi_last["DECOM"] = parse_dates(dfs, "Episodes_last", "DECOM")
+        collection_start = parse_metadata_date(dfs, "collection_start")
+
+        codes, codes_last = child_codes(dfs, "Episodes", "Episodes_last")
 
         epi.reset_index(inplace=True)
-        epi = epi[epi["DECOM"] < collection_start]
+        codes = codes.reset_index(drop=True)
+        before_start = epi["DECOM"] < collection_start
+        epi = epi[before_start]
 
-        grp_decom_by_child = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
+        grp_decom_by_child = first_per_child(codes[before_start], epi["DECOM"])
         min_decom = epi.loc[epi.index.isin(grp_decom_by_child), :]
 
-        grp_last_decom_by_child = epi_last.groupby(["CHILD"])["DECOM"].idxmax(
-            skipna=True
+        grp_last_decom_by_child = first_per_child(
+            codes_last, epi_last["DECOM"], last=True
         )
         max_last_decom = epi_last.loc[epi_last.index.isin(grp_last_decom_by_child), :]
 
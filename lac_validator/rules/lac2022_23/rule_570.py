@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -14,13 +15,9 @@ def validate(dfs):
         return {}
     else:
         mis = dfs["Missing"]
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
         error_mask = mis["MIS_START"] > collection_end
 
         return {"Missing": mis.index[error_mask].to_list()}
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_metadata_date
 
 
 @rule_definition(
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         missing = dfs["Missing"]
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        collection_start = parse_metadata_date(dfs, "collection_start")
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
         missing["fMIS_END"] = pd.to_datetime(
             missing["MIS_END"], format="%d/%m/%Y", errors="coerce"
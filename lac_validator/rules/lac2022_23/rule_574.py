@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         mis = dfs["Missing"]
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        mis["MIS_END"] = pd.to_datetime(
-            mis["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
+        mis["MIS_END"] = parse_dates(dfs, "Missing", "MIS_END")
 
         mis["MIS_END_FILL"] = mis["MIS_END"].fillna(mis["MIS_START"])
         mis.sort_values(["CHILD", "MIS_END_FILL", "MIS_START"], inplace=True)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -20,8 +21,8 @@ def validate(dfs):
 
         mis.reset_index(inplace=True)
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
         mis["MIS_START"] = pd.to_datetime(
             mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
         )
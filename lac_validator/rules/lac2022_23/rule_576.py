@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -9,7 +10,7 @@ from lac_validator.rule_engine import rule_definition
     + "last year’s return and there is no corresponding period recorded at the start of "
     + "this year.",
     affected_fields=["CHILD"],
-    tables=["MIssing", "Missing_last"],
+    tables=["Missing", "Missing_last"],
 )
 def validate(dfs):
     if "Missing" not in dfs or "Missing_last" not in dfs:
@@ -17,12 +18,8 @@ def validate(dfs):
     else:
         mis = dfs["Missing"]
         mis_l = dfs["Missing_last"]
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        mis_l["MIS_START"] = pd.to_datetime(
-            mis_l["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
+        mis_l["MIS_START"] = parse_dates(dfs, "Missing_last", "MIS_START")
 
         mis.reset_index(inplace=True)
         mis["MIS_START"].fillna(
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,18 +20,10 @@ def validate(dfs):
         episodes["original_index"] = episodes.index
 
         # put dates in appropriate format.
-        missing["MIS_END"] = pd.to_datetime(
-            missing["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
-        missing["MIS_START"] = pd.to_datetime(
-            missing["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        missing["MIS_END"] = parse_dates(dfs, "Missing", "MIS_END")
+        missing["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # filter data based on provided conditions.
         missing = missing[missing["MIS_START"].notna()].copy()
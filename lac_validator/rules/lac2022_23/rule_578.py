@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,15 +20,9 @@ def validate(dfs):
         episodes["original_index"] = episodes.index
 
         # convert dates
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        missing["MIS_START"] = pd.to_datetime(
-            missing["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        missing["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
 
         # create period of care blocks
         episodes = episodes.sort_values(["CHILD", "DECOM"])
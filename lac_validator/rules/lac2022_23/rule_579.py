@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,11 +15,9 @@ def validate(dfs):
         return {}
     else:
         adopt_placed = dfs["PlacedAdoption"]
-        adopt_placed["DATE_PLACED"] = pd.to_datetime(
-            adopt_placed["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
-        )
-        adopt_placed["DATE_PLACED_CEASED"] = pd.to_datetime(
-            adopt_placed["DATE_PLACED_CEASED"], format="%d/%m/%Y", errors="coerce"
+        adopt_placed["DATE_PLACED"] = parse_dates(dfs, "PlacedAdoption", "DATE_PLACED")
+        adopt_placed["DATE_PLACED_CEASED"] = parse_dates(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
 
         adopt_placed.sort_values(["CHILD", "DATE_PLACED"], inplace=True)
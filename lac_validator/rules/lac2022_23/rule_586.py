@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -14,10 +15,8 @@ def validate(dfs):
         return {}
     else:
         df = dfs["Missing"]
-        df["DOB"] = pd.to_datetime(df["DOB"], format="%d/%m/%Y", errors="coerce")
-        df["MIS_START"] = pd.to_datetime(
-            df["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        df["DOB"] = parse_dates(dfs, "Missing", "DOB")
+        df["MIS_START"] = parse_dates(dfs, "Missing", "MIS_START")
 
         error_mask = df["MIS_START"].notna() & (df["MIS_START"] <= df["DOB"])
         return {"Missing": df.index[error_mask].to_list()}
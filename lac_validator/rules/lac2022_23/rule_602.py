@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -15,13 +16,9 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         ad1 = dfs["AD1"]
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        collection_start = parse_metadata_date(dfs, "collection_start")
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
         mask1 = (epi["DEC"] <= collection_end) & (epi["DEC"] >= collection_start)
         mask2 = epi["REC"].isin(["E11", "E12"])
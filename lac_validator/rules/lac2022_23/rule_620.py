@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -14,10 +15,8 @@ def validate(dfs):
         return {}
     else:
         hea = dfs["Header"]
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
-        hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
+        collection_start = parse_metadata_date(dfs, "collection_start")
+        hea["DOB"] = parse_dates(dfs, "Header", "DOB")
 
         hea_mother = hea[hea["MOTHER"].astype(str) == "1"]
         error_cohort = (
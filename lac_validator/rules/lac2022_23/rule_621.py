@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -15,12 +16,8 @@ def validate(dfs):
     else:
         header = dfs["Header"]
 
-        header["MC_DOB"] = pd.to_datetime(
-            header["MC_DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["MC_DOB"] = parse_dates(dfs, "Header", "MC_DOB")
+        header["DOB"] = parse_dates(dfs, "Header", "DOB")
         mask = (header["MC_DOB"] > header["DOB"]) | header["MC_DOB"].isna()
 
         validation_error_mask = ~mask
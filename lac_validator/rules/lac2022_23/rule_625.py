@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -21,12 +22,8 @@ def validate(dfs):
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
-        header["MC_DOB"] = pd.to_datetime(
-            header["MC_DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["MC_DOB"] = parse_dates(dfs, "Header", "MC_DOB")
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
         # prepare to merge
         header.reset_index(inplace=True)
         episodes.reset_index(inplace=True)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -16,10 +17,8 @@ def validate(dfs):
         epi = dfs["Episodes"]
         pre = dfs["PrevPerm"]
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        collection_start = pd.to_datetime(
-            dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+        collection_start = parse_metadata_date(dfs, "collection_start")
 
         epi = epi.reset_index()
 
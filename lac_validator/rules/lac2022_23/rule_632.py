@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -21,9 +22,7 @@ def validate(dfs):
         prevperm = dfs["PrevPerm"]
 
         # convert dates from strings to appropriate format.
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
         prevperm["DATE_PERM_dt"] = prevperm["DATE_PERM"].apply(
             lac_validator.rules.rule_utils.valid_date
         )
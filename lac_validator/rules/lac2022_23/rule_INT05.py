@@ -1,5 +1,6 @@
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import children_not_in
 
 
 @rule_definition(
@@ -12,22 +13,7 @@ def validate(dfs):
     if "Header" not in dfs or "OC2" not in dfs:
         return {}
     else:
-        header = dfs["Header"]
-        file = dfs["OC2"]
-
-        file["index_file"] = file.index
-
-        merged = header.merge(
-            file[["CHILD", "index_file"]],
-            on="CHILD",
-            indicator=True,
-            how="right",
-            suffixes=["_header", "_file"],
-        )
-
-        mask = merged["_merge"] == "right_only"
-        eps_error_locations = merged.loc[mask, "index_file"]
-        return {"OC2": eps_error_locations.unique().tolist()}
+        return {"OC2": children_not_in(dfs, "OC2", "Header")}
 
 
 def test_validate():
@@ -2,6 +2,7 @@ import pandas as pd
 
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,10 +18,8 @@ def validate(dfs):
         header = dfs["Header"]
         file = dfs["PlacedAdoption"]
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        file["DOB"] = pd.to_datetime(file["DOB"], format="%d/%m/%Y", errors="coerce")
+        header["DOB"] = parse_dates(dfs, "Header", "DOB")
+        file["DOB"] = parse_dates(dfs, "PlacedAdoption", "DOB")
 
         file["index_file"] = file.index
 
@@ -1,5 +1,6 @@
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import duplicated_children
 
 
 @rule_definition(
@@ -12,15 +13,7 @@ def validate(dfs):
     if "AD1" not in dfs:
         return {}
     else:
-        file = dfs["AD1"]
-
-        file["index_file"] = file.index
-
-        file["CHILD_COUNT"] = file.groupby("CHILD")["CHILD"].transform("count")
-
-        mask = file["CHILD_COUNT"] > 1
-        eps_error_locations = file.loc[mask, "index_file"]
-        return {"AD1": eps_error_locations.unique().tolist()}
+        return {"AD1": duplicated_children(dfs, "AD1")}
 
 
 def test_validate():
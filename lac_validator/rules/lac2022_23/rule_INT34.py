@@ -1,5 +1,6 @@
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import duplicated_children
 
 
 @rule_definition(
@@ -12,15 +13,7 @@ def validate(dfs):
     if "OC3" not in dfs:
         return {}
     else:
-        file = dfs["OC3"]
-
-        file["index_file"] = file.index
-
-        file["CHILD_COUNT"] = file.groupby("CHILD")["CHILD"].transform("count")
-
-        mask = file["CHILD_COUNT"] > 1
-        eps_error_locations = file.loc[mask, "index_file"]
-        return {"OC3": eps_error_locations.unique().tolist()}
+        return {"OC3": duplicated_children(dfs, "OC3")}
 
 
 def test_validate():
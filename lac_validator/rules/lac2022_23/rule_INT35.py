@@ -1,5 +1,6 @@
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import duplicated_children
 
 
 @rule_definition(
@@ -12,15 +13,7 @@ def validate(dfs):
     if "PrevPerm" not in dfs:
         return {}
     else:
-        file = dfs["PrevPerm"]
-
-        file["index_file"] = file.index
-
-        file["CHILD_COUNT"] = file.groupby("CHILD")["CHILD"].transform("count")
-
-        mask = file["CHILD_COUNT"] > 1
-        eps_error_locations = file.loc[mask, "index_file"]
-        return {"PrevPerm": eps_error_locations.unique().tolist()}
+        return {"PrevPerm": duplicated_children(dfs, "PrevPerm")}
 
 
 def test_validate():
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -27,9 +28,7 @@ def validate(dfs):
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
 
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
 
         OC3 = OC3.reset_index()
 
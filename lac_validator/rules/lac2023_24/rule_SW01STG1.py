@@ -38,7 +38,7 @@ def validate(dfs):
         errors = merged_df[condition]
         error_rows = errors["index"].tolist()
 
-        return {"SWEpisodes": error_rows}
+        return {"Episodes": error_rows}
 
 
 def test_validate():
@@ -72,4 +72,12 @@ def test_validate():
 
     result = validate(fake_dfs)
 
-    assert result == {"SWEpisodes": [0, 1, 2, 6]}
+    assert result == {"Episodes": [0, 1, 2, 6]}
+
+    # errors are reported against the rows of Episodes, whatever the index of SWEpisodes.
+    fake_epi.index = range(10, 17)
+    fake_dfs = {"SWEpisodes": fake_swe, "Episodes": fake_epi}
+
+    result = validate(fake_dfs)
+
+    assert result == {"Episodes": [10, 11, 12, 16]}
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -17,9 +18,7 @@ def validate(dfs):
         collection_end = dfs["metadata"]["collection_end"]
         collection_end = pd.to_datetime(collection_end, format="%d/%m/%Y")
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        df["SW_DECOM"] = parse_dates(dfs, "SWEpisodes", "SW_DECOM")
         df = df[df["SW_DECOM"].notna()].copy()
 
         error_rows = df[~(df["SW_DECOM"] <= collection_end)].index
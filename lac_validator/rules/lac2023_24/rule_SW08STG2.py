@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -15,10 +16,8 @@ def validate(dfs):
     else:
         df = dfs["SWEpisodes"]
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        df["SW_DEC"] = pd.to_datetime(df["SW_DEC"], format="%d/%m/%Y", errors="coerce")
+        df["SW_DECOM"] = parse_dates(dfs, "SWEpisodes", "SW_DECOM")
+        df["SW_DEC"] = parse_dates(dfs, "SWEpisodes", "SW_DEC")
 
         df["SW_DECOM"] = df["SW_DECOM"].fillna(
             "01/01/1901"
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 from lac_validator.utils import add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER
 
 
@@ -17,12 +18,10 @@ def validate(dfs):
         SWE = dfs["SWEpisodes"]
         epi = dfs["Episodes"]
 
-        SWE["SW_DECOM"] = pd.to_datetime(
-            SWE["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE["SW_DECOM"] = parse_dates(dfs, "SWEpisodes", "SW_DECOM")
 
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         epi = epi.reset_index()
 
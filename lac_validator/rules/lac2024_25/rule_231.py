@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates, parse_metadata_date
 
 
 @rule_definition(
@@ -16,11 +17,9 @@ def validate(dfs):
     else:
         df = dfs["Header"]
 
-        collection_end = pd.to_datetime(
-            dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
-        )
+        collection_end = parse_metadata_date(dfs, "collection_end")
 
-        df["DOB"] = pd.to_datetime(df["DOB"], format="%d/%m/%Y", errors="coerce")
+        df["DOB"] = parse_dates(dfs, "Header", "DOB")
 
         under_11_uasc = df[
             ((df["DOB"] > collection_end - pd.DateOffset(years=11)))
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,9 +19,7 @@ def validate(dfs):
         # If <SW_DECOM> > = 1 April 2023 then at least one instance of each of the following items should be provided:
         # <SW_ID>, <SW_DECOM>, <SW_REASON>
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        df["SW_DECOM"] = parse_dates(dfs, "SWEpisodes", "SW_DECOM")
 
         no_items = df["SW_ID"].isna() | df["SW_REASON"].isna()
         after_1_apr_23 = df["SW_DECOM"] >= pd.to_datetime("01/04/2023", dayfirst=True)
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -21,7 +22,7 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
         collection_start = pd.to_datetime(collection_start, format="%d/%m/%Y")
 
-        df["SW_DEC"] = pd.to_datetime(df["SW_DEC"], format="%d/%m/%Y", errors="coerce")
+        df["SW_DEC"] = parse_dates(dfs, "SWEpisodes", "SW_DEC")
         df = df[df["SW_DEC"].notna()].copy()
 
         error_rows = df[
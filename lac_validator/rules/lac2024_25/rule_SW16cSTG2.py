@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -19,15 +20,11 @@ def validate(dfs):
         # If present, where there is a previous collection year’s final social worker episode, and <SW_DEC> not provided,
         # then first social worker episode of this year’s collection <SW_REASON> be the same as the previous episode
 
-        SWE_prev["SW_DECOM"] = pd.to_datetime(
-            SWE_prev["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE_prev["SW_DECOM"] = parse_dates(dfs, "SWEpisodes_last", "SW_DECOM")
         prev_ordered = SWE_prev.sort_values(by=["SW_DECOM"], ascending=False)
         prev_ordered = prev_ordered.drop_duplicates(["CHILD"], keep="first")
 
-        SWE["SW_DECOM"] = pd.to_datetime(
-            SWE["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE["SW_DECOM"] = parse_dates(dfs, "SWEpisodes", "SW_DECOM")
         current_ordered = SWE.sort_values(by=["SW_DECOM"], ascending=True)
         current_ordered = current_ordered.drop_duplicates(["CHILD"], keep="first")
         current_ordered["index"] = current_ordered.index
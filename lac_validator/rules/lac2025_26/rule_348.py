@@ -7,7 +7,7 @@ from lac_validator.rule_engine import rule_definition
     code="348",
     message="Care leaver has previously been reported as having died. ",
     affected_fields=["IN_TOUCH"],
-    tables=["OC3"],
+    tables=["OC3", "OC3_last"],
 )
 def validate(dfs):
     if "OC3" not in dfs or "OC3_last" not in dfs:
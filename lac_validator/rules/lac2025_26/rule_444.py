@@ -8,6 +8,8 @@ from lac_validator.rule_engine import rule_definition
     message="Duplicate UPN has been reported",
     affected_fields=["UPN"],
     tables=["Header"],
+    # looks for UPNs shared by different children.
+    cross_child=True,
 )
 def validate(dfs):
     # If <UPN> is provided and <UPN> is not in ‘UN1’, ‘UN2’, ‘UN3’, ‘UN4’,’UN5’ then <UPN> must be unique within the LA return in that year.
@@ -8,7 +8,7 @@ from lac_validator.rules.rule_utils import field_different_from_previous
     code="503D",
     message="The placement type in the first episode does not match open episode at end of last year",
     affected_fields=["PLACE"],
-    tables=["Episodes"],
+    tables=["Episodes", "Episodes_last"],
 )
 def validate(dfs):
     # Where previous collection year’s final episode <DEC> not provided then first
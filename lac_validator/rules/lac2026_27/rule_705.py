@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
@@ -18,12 +19,8 @@ def validate(dfs):
         return {}
 
     dolo = dfs["DoLo"]
-    dolo["DOLO_START"] = pd.to_datetime(
-        dolo["DOLO_START"], format="%d/%m/%Y", errors="coerce"
-    )
-    dolo["DOLO_END"] = pd.to_datetime(
-        dolo["DOLO_END"], format="%d/%m/%Y", errors="coerce"
-    )
+    dolo["DOLO_START"] = parse_dates(dfs, "DoLo", "DOLO_START")
+    dolo["DOLO_END"] = parse_dates(dfs, "DoLo", "DOLO_END")
 
     dolo["DOLO_END_FILL"] = dolo["DOLO_END"].fillna(dolo["DOLO_START"])
     dolo.sort_values(["CHILD", "DOLO_END_FILL", "DOLO_START"], inplace=True)
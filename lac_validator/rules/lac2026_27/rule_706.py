@@ -7,7 +7,7 @@ from lac_validator.rule_engine import rule_definition
     code="706",
     message="There is an open DoLO in last year’s return and there is no corresponding DoLO recorded at the start of this year..",
     affected_fields=["DOLO_START"],
-    tables=["DoLo", "DOLO_last"],
+    tables=["DoLo", "DoLo_last"],
 )
 def validate(dfs):
     if "DoLo" not in dfs:
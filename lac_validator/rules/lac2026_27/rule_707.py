@@ -1,13 +1,14 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import parse_dates
 
 
 @rule_definition(
     code="707",
     message="Child ceased to be looked after but there is a DoLO without an end date.",
     affected_fields=["DOLO_END"],
-    tables=["DoLo", "EPISODES"],
+    tables=["DoLo", "Episodes"],
 )
 def validate(dfs):
     # Uses the logic from 577 which is the same rule but for missing
@@ -20,18 +21,10 @@ def validate(dfs):
         episodes["original_index"] = episodes.index
 
         # put dates in appropriate format.
-        dolo["DOLO_END"] = pd.to_datetime(
-            dolo["DOLO_END"], format="%d/%m/%Y", errors="coerce"
-        )
-        dolo["DOLO_START"] = pd.to_datetime(
-            dolo["DOLO_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        dolo["DOLO_END"] = parse_dates(dfs, "DoLo", "DOLO_END")
+        dolo["DOLO_START"] = parse_dates(dfs, "DoLo", "DOLO_START")
+        episodes["DEC"] = parse_dates(dfs, "Episodes", "DEC")
+        episodes["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
 
         # filter data based on provided conditions.
         dolo = dolo[dolo["DOLO_START"].notna()].copy()
@@ -1,13 +1,210 @@
+import numpy as np
 import pandas as pd
 
+from lac_validator.child_index import ChildIndex
+from lac_validator.datastore import DATE_FORMAT, DataStore, DataStoreView
+
+
+def parse_dates(dfs, table, column):
+    """
+    Parses a dd/mm/YYYY date column, using the datastore's cache of parsed dates when
+    there is one so that the column is parsed once per validation.
+
+    :param dict dfs: datastore passed to the rule.
+    :param str table: table name, e.g. 'Episodes' or 'Episodes_last'.
+    :param str column: name of the date column.
+
+    :return: the column parsed to datetimes, indexed like the table.
+    :rtype: pd.Series
+    """
+    if isinstance(dfs, (DataStore, DataStoreView)):
+        return dfs.dates(table, column)
+    return pd.to_datetime(dfs[table][column], format=DATE_FORMAT, errors="coerce")
+
+
+def parse_metadata_date(dfs, key):
+    """
+    :param dict dfs: datastore passed to the rule.
+    :param str key: metadata date key, e.g. 'collection_start' or 'collection_end'.
+
+    :return: the metadata date parsed to a datetime.
+    :rtype: pd.Timestamp
+    """
+    if isinstance(dfs, (DataStore, DataStoreView)):
+        return dfs.metadata_date(key)
+    return pd.to_datetime(dfs["metadata"][key], format=DATE_FORMAT, errors="coerce")
+
+
+def derived_table(dfs, name, tables, build):
+    """
+    Builds a table from other tables of the datastore, using the datastore's cache of derived
+    tables when there is one so that it is built once per validation rather than by every rule.
+
+    :param dict dfs: datastore passed to the rule.
+    :param str name: name the table is cached under.
+    :param list tables: the tables it is built from.
+    :param Callable build: builds the table from a datastore.
+
+    :return: the table built.
+    :rtype: pd.DataFrame
+    """
+    if isinstance(dfs, (DataStore, DataStoreView)):
+        return dfs.derived(name, tables, build)
+    return build(dfs)
+
+
+def _child_index(dfs, tables):
+    if isinstance(dfs, (DataStore, DataStoreView)):
+        return dfs.child_index(tables)
+    return None
+
+
+def children_not_in(dfs, table, other):
+    """
+    Finds the rows of a table whose child has no rows in another table, using the datastore's
+    index of which children are in each table when there is one rather than merging the tables.
+
+    :param dict dfs: datastore passed to the rule.
+    :param str table: table whose rows are checked, e.g. 'AD1'.
+    :param str other: table the children should be in, e.g. 'Header'.
+
+    :return: row labels of table, in order.
+    :rtype: list
+    """
+    df = dfs[table]
+    index = _child_index(dfs, [table, other])
+    if index is not None:
+        mask = index.not_in(table, other)
+    else:
+        mask = ~df["CHILD"].isin(dfs[other]["CHILD"])
+    return df.index[mask].unique().tolist()
+
+
+def duplicated_children(dfs, table):
+    """
+    Finds the rows of a table whose child has more than one row in it.
+
+    :param dict dfs: datastore passed to the rule.
+    :param str table: table whose rows are checked, e.g. 'AD1'.
+
+    :return: row labels of table, in order.
+    :rtype: list
+    """
+    df = dfs[table]
+    index = _child_index(dfs, [table])
+    if index is not None:
+        mask = index.duplicated(table)
+    else:
+        mask = df["CHILD"].notna() & df["CHILD"].duplicated(keep=False)
+    return df.index[mask].unique().tolist()
+
+
+def child_codes(dfs, *tables):
+    """
+    Integer codes for the child of each row, shared by the given tables, for grouping or joining
+    rows by child without hashing CHILD strings again. Codes follow the sorted order of CHILD.
+
+    :param dict dfs: datastore passed to the rule.
+    :param str tables: names of the tables, e.g. 'Episodes' and 'Episodes_last'.
+
+    :return: the codes of each table, indexed like it, with -1 for rows with no CHILD.
+    :rtype: list
+    """
+    index = _child_index(dfs, list(tables))
+    if index is None:
+        index = ChildIndex({table: dfs[table] for table in tables})
+    return [
+        pd.Series(index.codes(table), index=dfs[table].index, name="CHILD")
+        for table in tables
+    ]
+
+
+def first_per_child(codes, values, last=False):
+    """
+    Finds each child's row with the smallest value, or the largest if last is True, taking the
+    first such row when there is a tie. This gives the same rows as
+    groupby("CHILD")[column].idxmin(skipna=True) or idxmax, without a groupby.
+
+    :param pd.Series codes: child codes of the rows, as returned by child_codes.
+    :param pd.Series values: values to compare, e.g. parsed dates, indexed like codes.
+    :param bool last: whether to find the largest value instead of the smallest.
+
+    :return: row labels, one per child, in order of CHILD.
+    :rtype: pd.Index
+    """
+    child = codes.to_numpy()
+    missing = values.isna().to_numpy()
+    if values.dtype.kind == "M":
+        # dates are compared as integers, as NaT has been left out.
+        key = values.to_numpy().view("i8")
+    else:
+        key = values.to_numpy(dtype=float, na_value=np.nan)
+    if last:
+        key = -key
+
+    has_child = child >= 0
+    rows = np.flatnonzero(has_child & ~missing)
+    order = np.lexsort((rows, key[rows], child[rows]))
+    rows = rows[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = child[rows][1:] != child[rows][:-1]
+    rows = rows[first]
+
+    if len(rows) != len(np.unique(child[has_child])):
+        # a child with no values, for which groupby raises.
+        raise ValueError(
+            f"attempt to get {'argmax' if last else 'argmin'} of an empty sequence"
+        )
+    return codes.index[rows]
+
+
+def _first_episodes_after_last(dfs):
+    epi = dfs["Episodes"].copy(deep=False)
+    epi_last = dfs["Episodes_last"].copy(deep=False)
+
+    epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+    epi_last["DECOM"] = parse_dates(dfs, "Episodes_last", "DECOM")
+    epi_last["DEC"] = parse_dates(dfs, "Episodes_last", "DEC")
+
+    codes, codes_last = child_codes(dfs, "Episodes", "Episodes_last")
+
+    first_ep_inds = first_per_child(codes, epi["DECOM"])
+    min_decom = epi.loc[first_ep_inds, :].reset_index()
+
+    last_ep_inds = first_per_child(codes_last, epi_last["DECOM"], last=True)
+    max_last_decom = epi_last.loc[last_ep_inds, :]
+
+    return min_decom.merge(
+        max_last_decom, how="inner", on=["CHILD"], suffixes=["", "_PRE"]
+    )
+
+
+def first_episodes_after_last(dfs):
+    """
+    Each child's first episode this year alongside their latest episode last year, for the children
+    in both years' Episodes. Last year's columns have the suffix _PRE, DECOM and DEC_PRE are parsed
+    to dates, and the 'index' column holds the row label of the episode in Episodes.
+
+    :param dict dfs: datastore passed to the rule, with Episodes and Episodes_last.
+
+    :return: one row per child.
+    :rtype: pd.DataFrame
+    """
+    return derived_table(
+        dfs,
+        "first_episodes_after_last",
+        ["Episodes", "Episodes_last"],
+        _first_episodes_after_last,
+    )
+
 
 def decom_before_dob(dfs, p_code, y_gap):
     epi = dfs["Episodes"]
     hea = dfs["Header"]
 
-    hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
-    epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-    epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+    hea["DOB"] = parse_dates(dfs, "Header", "DOB")
+    epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+    epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
 
     epi.reset_index(inplace=True)
     epi_p2 = epi[epi["PLACE"] == p_code]
@@ -23,9 +220,9 @@ def dec_after_decom(dfs, p_code, y_gap):
     epi = dfs["Episodes"]
     hea = dfs["Header"]
 
-    hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
-    epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-    epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+    hea["DOB"] = parse_dates(dfs, "Header", "DOB")
+    epi["DECOM"] = parse_dates(dfs, "Episodes", "DECOM")
+    epi["DEC"] = parse_dates(dfs, "Episodes", "DEC")
 
     epi.reset_index(inplace=True)
     epi_p2 = epi[epi["PLACE"] == p_code]
@@ -43,28 +240,7 @@ def field_different_from_previous(dfs, field):
     else:
         collection_year = dfs["metadata"]["collectionYear"]
 
-        epi = dfs["Episodes"]
-        epi_last = dfs["Episodes_last"]
-
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        epi_last["DEC"] = pd.to_datetime(
-            epi_last["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-
-        epi.reset_index(inplace=True)
-
-        first_ep_inds = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
-        min_decom = epi.loc[first_ep_inds, :]
-
-        last_ep_inds = epi_last.groupby(["CHILD"])["DECOM"].idxmax(skipna=True)
-        max_last_decom = epi_last.loc[last_ep_inds, :]
-
-        merged_co = min_decom.merge(
-            max_last_decom, how="inner", on=["CHILD"], suffixes=["", "_PRE"]
-        )
+        merged_co = first_episodes_after_last(dfs)
 
         this_one = field
         pre_one = this_one + "_PRE"
@@ -1,7 +1,19 @@
+import hashlib
 import importlib
-from typing import Iterable
+import json
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Optional
 
-from lac_validator.rule_engine import RuleDefinition, YearConfig
+from lac_validator.rule_engine import LazyRuleFunction, RuleDefinition, YearConfig
+
+logger = logging.getLogger(__name__)
+
+RULES_DIR = Path(__file__).parent
+# Lists the rules of a ruleset so that they can be looked up without importing them, see write_manifest.
+MANIFEST_FILE = "manifest.json"
 
 
 def extract_validator_functions(
@@ -51,14 +63,158 @@ def update_validator_functions(
     return updated_validator_funcs
 
 
-def get_year_ruleset(collection_year: str) -> dict[str, RuleDefinition]:
+def lazy_registry(
+    package_name: str, load_registry: Callable[[], dict[str, RuleDefinition]]
+) -> Callable[[str], dict[str, RuleDefinition]]:
     """
-    Gets the registry of validation rules for the year specified in the metadata.
+    Makes the module __getattr__ of a ruleset package, which builds its registry when it is first
+    used rather than when the package is imported. Importing a single rule then does not import
+    every other rule.
+
+    :param str package_name: name of the ruleset package.
+    :param Callable load_registry: builds the registry of the ruleset.
+
+    :return: the __getattr__ function of the package.
+    :rtype: Callable
     """
-    # for example, convert "2023" to "lac2022_23"
-    ruleset = f"lac{int(collection_year)-1}_{collection_year[2:4]}"
 
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    registry = getattr(module, "registry")
+    def __getattr__(name: str) -> dict[str, RuleDefinition]:
+        if name != "registry":
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        registry = load_registry()
+        setattr(sys.modules[package_name], "registry", registry)
+        return registry
+
+    return __getattr__
+
+
+def ruleset_name(collection_year: str) -> str:
+    """
+    :param str collection_year: year the collection ends in, e.g. "2023".
+
+    :return: name of the ruleset package, e.g. "lac2022_23".
+    :rtype: str
+    """
+    return f"lac{int(collection_year)-1}_{collection_year[2:4]}"
+
+
+def _sources_hash(ruleset: str) -> str:
+    """
+    Identifies the source of every rule a ruleset can include, that is the rule files of the
+    ruleset and of every earlier year.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(RULES_DIR.glob("lac*/*.py")):
+        if path.parent.name <= ruleset:
+            digest.update(f"{path.parent.name}/{path.name}".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def manifest_text(ruleset: str) -> str:
+    """
+    Imports every rule of a ruleset and lists them as they are written to its manifest.
 
+    :param str ruleset: name of the ruleset package, e.g. "lac2022_23".
+
+    :return: the contents of the manifest.
+    :rtype: str
+    """
+    registry = getattr(
+        importlib.import_module(f"lac_validator.rules.{ruleset}"), "registry"
+    )
+    rules = []
+    for rule in registry.values():
+        rules.append(
+            {
+                "code": rule.code,
+                "module": rule.func.__module__,
+                "function": rule.func.__qualname__,
+                "message": rule.message,
+                "affected_fields": rule.affected_fields,
+                # tuples of alternative tables are written as lists.
+                "tables": None if rule.tables is None else list(rule.tables),
+                "cross_child": rule.cross_child,
+            }
+        )
+    manifest = {"sources": _sources_hash(ruleset), "rules": rules}
+    return json.dumps(manifest, indent=1) + "\n"
+
+
+def write_manifest(ruleset: str) -> Path:
+    """
+    Lists the rules of a ruleset in its manifest, see manifest_text, so that later the rules can be
+    listed without being imported. Needs running again whenever the rules change.
+
+    :param str ruleset: name of the ruleset package, e.g. "lac2022_23".
+
+    :return: path of the manifest written.
+    :rtype: Path
+    """
+    path = RULES_DIR / ruleset / MANIFEST_FILE
+    path.write_text(manifest_text(ruleset))
+    return path
+
+
+def read_manifest(ruleset: str) -> Optional[dict[str, RuleDefinition]]:
+    """
+    Reads the rules of a ruleset from its manifest. The rule functions are only imported when
+    they are first called.
+
+    :param str ruleset: name of the ruleset package, e.g. "lac2022_23".
+
+    :return: registry of the rules in the ruleset, or None if there is no manifest or the rules
+        have changed since it was written.
+    :rtype: dict
+    """
+    path = RULES_DIR / ruleset / MANIFEST_FILE
+    if not path.exists():
+        return None
+    manifest = json.loads(path.read_text())
+    if manifest["sources"] != _sources_hash(ruleset):
+        logger.warning(f"Rules have changed since {path} was written, ignoring it")
+        return None
+
+    registry: dict[str, RuleDefinition] = {}
+    for entry in manifest["rules"]:
+        tables = entry["tables"]
+        registry[entry["code"]] = RuleDefinition(
+            code=entry["code"],
+            func=LazyRuleFunction(entry["module"], entry["function"], entry["code"]),
+            message=entry["message"],
+            affected_fields=entry["affected_fields"],
+            tables=(
+                None
+                if tables is None
+                else [
+                    tuple(table) if isinstance(table, list) else table
+                    for table in tables
+                ]
+            ),
+            cross_child=entry["cross_child"],
+        )
     return registry
+
+
+@lru_cache(maxsize=None)
+def get_ruleset(ruleset: str) -> dict[str, RuleDefinition]:
+    """
+    Gets the registry of a ruleset. The rules are read from its manifest if it is up to date, so
+    that they are only imported when they are run. The registry is only read once per ruleset, and
+    the same registry is returned to every caller, so it must not be changed.
+
+    :param str ruleset: name of the ruleset package, e.g. "lac2022_23".
+    """
+    registry = read_manifest(ruleset)
+    if registry is None:
+        module = importlib.import_module(f"lac_validator.rules.{ruleset}")
+        registry = getattr(module, "registry")
+    return registry
+
+
+def get_year_ruleset(collection_year: str) -> dict[str, RuleDefinition]:
+    """
+    Gets the registry of validation rules for the year specified in the metadata.
+    """
+    # for example, convert "2023" to "lac2022_23"
+    return get_ruleset(ruleset_name(collection_year))
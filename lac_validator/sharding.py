@@ -0,0 +1,194 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from lac_validator.datastore import DataStore, SharedWriteGuard
+from lac_validator.executor import RuleRun, run_rule, run_tasks_in_pool
+from lac_validator.profiling import StepProfile
+from lac_validator.rule_engine import RuleDefinition
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Partition:
+    """
+    The rows of every table for some of the children.
+
+    :param DataStore data_store: datastore holding the rows of the children in the partition, with
+        each table indexed from 0.
+    :param dict labels: the index labels the rows of each table have in the whole datastore, by table name.
+    """
+
+    data_store: DataStore
+    labels: dict[str, pd.Index] = field(default_factory=dict)
+
+    def to_original(self, result: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """
+        :param dict result: error locations returned by a rule run on the partition.
+
+        :return: the same error locations, as labels of the whole datastore. Locations that are not
+            in the partition, such as NaN, become NaN, which is logged and dropped later on.
+        :rtype: dict
+        """
+        original = {}
+        for table, locations in result.items():
+            if table not in self.labels:
+                # rules returning errors in unknown tables are logged later on.
+                original[table] = locations
+                continue
+            # looked up as when the rule is run on the whole datastore, so that float labels are
+            # found and labels that are not there are dropped, see ErrorLocations.flag_tables.
+            positions = self.data_store[table].index.get_indexer_for(locations)
+            found = positions >= 0
+            mapped = np.full(len(positions), np.nan, dtype=object)
+            mapped[found] = self.labels[table].take(positions[found])
+            original[table] = list(mapped)
+        return original
+
+
+def partition_datastore(data_store: DataStore, partitions: int) -> list[Partition]:
+    """
+    Splits the tables of the datastore by a hash of CHILD, so that all the rows of a child are
+    in the same partition. The metadata is shared by all of them.
+
+    :param DataStore data_store: datastore as returned by create_datastore.
+    :param int partitions: number of partitions.
+
+    :return: the partitions.
+    :rtype: list
+    """
+    parts = [
+        Partition(DataStore({"metadata": data_store["metadata"]}))
+        for _ in range(partitions)
+    ]
+    for table, df in data_store.items():
+        if table == "metadata":
+            continue
+        children = df["CHILD"].astype(str).to_numpy(dtype=object)
+        partition_of_row = pd.util.hash_array(children) % partitions
+        for number, part in enumerate(parts):
+            rows = np.flatnonzero(partition_of_row == number)
+            part.labels[table] = df.index[rows]
+            part.data_store[table] = df.iloc[rows].reset_index(drop=True)
+
+    # the tables were added after the datastore was made, so give it a fresh cache.
+    return [Partition(DataStore(part.data_store), part.labels) for part in parts]
+
+
+def _read_no_rows(run: RuleRun, data_store: DataStore) -> bool:
+    return all(
+        len(data_store[table]) == 0 for table in run.tables_used if table != "metadata"
+    )
+
+
+def merge_runs(runs: list[RuleRun]) -> RuleRun:
+    """
+    Combines the runs of a rule on each partition, with locations already mapped back to the whole
+    datastore. The rule failed if it failed on any partition, and was skipped if it was skipped on all.
+    Its time is the total over the partitions, and its peak memory the largest.
+
+    :param list runs: the runs of a rule on each partition.
+
+    :return: the run of the rule on the whole datastore.
+    :rtype: RuleRun
+    """
+    merged = RuleRun({})
+    profiles = [run.profile for run in runs if run.profile is not None]
+    if profiles:
+        peaks = [p.peak_memory for p in profiles if p.peak_memory is not None]
+        merged.profile = StepProfile(
+            section=profiles[0].section,
+            name=profiles[0].name,
+            wall_time=sum(p.wall_time for p in profiles),
+            cpu_time=sum(p.cpu_time for p in profiles),
+            peak_memory=max(peaks) if peaks else None,
+        )
+    for run in runs:
+        merged.tables_used |= run.tables_used
+        merged.tables_checked |= run.tables_checked
+        merged.shared_writes += [
+            t for t in run.shared_writes if t not in merged.shared_writes
+        ]
+        if run.result is None:
+            merged.result = None
+        elif merged.result is not None:
+            for table, locations in run.result.items():
+                merged.result.setdefault(table, []).extend(locations)
+    return merged
+
+
+def run_rules_sharded(
+    rules: Iterable[RuleDefinition],
+    data_store: DataStore,
+    partitions: int,
+    workers: Optional[int] = None,
+    check_shared_writes: bool = False,
+    trace_memory: bool = False,
+) -> list[RuleRun]:
+    """
+    Runs rules on each partition of the datastore, so that the merges and other intermediate
+    tables made by rules are only ever as big as a partition. Rules defined as cross_child are run
+    on the whole datastore.
+
+    Rules can fail on a partition that has no rows in the tables they read. Such failures count as
+    finding no errors, unless the rule failed on every partition.
+
+    :param list rules: rules to be run.
+    :param DataStore data_store: datastore as returned by create_datastore.
+    :param int partitions: number of partitions to split the children into.
+    :param int workers: number of processes to run the rules across, one pool being used for every
+        partition. Rules run one after another if not set.
+    :param bool check_shared_writes: whether to check that rules do not change shared data.
+    :param bool trace_memory: whether workers trace the memory used by rules.
+
+    :return: the result of each rule, in the same order as rules.
+    :rtype: list
+    """
+    rules = list(rules)
+    parts = partition_datastore(data_store, partitions)
+    # the whole datastore comes first, followed by each partition.
+    data_stores = [data_store] + [part.data_store for part in parts]
+    tasks = [(rule, 0) for rule in rules if rule.cross_child]
+    for number in range(1, partitions + 1):
+        tasks += [(rule, number) for rule in rules if not rule.cross_child]
+
+    if workers:
+        runs = run_tasks_in_pool(
+            tasks, data_stores, workers, check_shared_writes, trace_memory
+        )
+    else:
+        guards = [
+            SharedWriteGuard(store) if check_shared_writes else None
+            for store in data_stores
+        ]
+        runs = []
+        for position, (rule, number) in enumerate(tasks):
+            if number and (position == 0 or tasks[position - 1][1] != number):
+                logger.info(f"Validating partition {number} of {partitions}")
+            runs.append(run_rule(rule, data_stores[number], guards[number]))
+
+    runs_by_code: dict[str, list[RuleRun]] = {rule.code: [] for rule in rules}
+    empty_failures: dict[str, list[RuleRun]] = {rule.code: [] for rule in rules}
+    for (rule, number), run in zip(tasks, runs):
+        if number:
+            if run.result is not None:
+                run.result = parts[number - 1].to_original(run.result)
+            elif _read_no_rows(run, data_stores[number]):
+                empty_failures[rule.code].append(run)
+        runs_by_code[rule.code].append(run)
+
+    merged = []
+    for rule in rules:
+        runs = runs_by_code[rule.code]
+        if rule.cross_child:
+            merged.append(runs[0])
+            continue
+        if len(empty_failures[rule.code]) < len(runs):
+            for run in empty_failures[rule.code]:
+                run.result = {}
+        merged.append(merge_runs(runs))
+    return merged
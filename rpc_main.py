@@ -1,13 +1,16 @@
 import datetime
 import json
 import logging
+from collections import OrderedDict
 from typing import Optional
 
 from prpc_python import RpcApp
 
-from lac_validator import lac_validator
+from lac_validator import datastore, lac_validator
+from lac_validator.cache import ProviderInfoCache, ResultCache
 from lac_validator.ingress import read_from_text
 from lac_validator.report import Report
+from lac_validator.results import ValidationState
 from lac_validator.rules.ruleset_utils import get_year_ruleset
 from lac_validator.utils import process_uploaded_files
 
@@ -22,6 +25,43 @@ logger.addHandler(handler)
 
 app = RpcApp("validate_lac")
 
+# states of validations run with incremental=True, whose rule results the next validation with the
+# same key can reuse, see _validation_key. Only the most recently used are kept.
+MAX_PREVIOUS_VALIDATIONS = 8
+_previous_validations: "OrderedDict[tuple, ValidationState]" = OrderedDict()
+
+
+def _validation_key(file_metadata: Optional[dict], session_id: Optional[str]) -> tuple:
+    if session_id is not None:
+        return ("session", session_id)
+    return (
+        "authority",
+        file_metadata["localAuthority"],
+        file_metadata["collectionYear"],
+    )
+
+
+@app.call
+def warm_up(postcode_letters: str = ""):
+    """
+    Loads the reference data used by validations, which is otherwise loaded by the first validation.
+    :param str postcode_letters: letters whose postcodes are loaded too, if there is no postcode index.
+    """
+    datastore.warm_up(postcode_letters)
+
+
+@app.call
+def release_validation(
+    file_metadata: Optional[dict] = None, session_id: Optional[str] = None
+):
+    """
+    Forgets the validation kept for the next incremental validation to follow on from.
+
+    :param file_metadata: collection year and local authority, as given to lac_validate.
+    :param session_id: session id, as given to lac_validate.
+    """
+    _previous_validations.pop(_validation_key(file_metadata, session_id), None)
+
 
 @app.call
 def get_rules(collection_year: str) -> str:
@@ -67,14 +107,22 @@ def lac_validate(
     lac_data: dict,
     file_metadata: dict,
     selected_rules: Optional[list[str]] = None,
+    profile: bool = False,
+    incremental: bool = False,
+    session_id: Optional[str] = None,
 ):
     """
     :param lac_data: keys are table names and values are LAC csv files.
     :param file_metadata: contains collection year and local authority as strings.
     :param selected_rules: array of rules the user has chosen. consists of rule codes as strings.
+    :param profile: whether to return the time and memory taken by each step of the validation.
+    :param incremental: whether to only rerun rules on tables that changed since the last incremental validation
+        with the same session_id, or of the same local authority and collection year if there is none.
+    :param session_id: identifies the validations that an incremental one follows on from.
 
     :return issue_report: issue locations in the data.
     :return rule_defs: codes and descriptions of the rules that triggers issues in the data.
+    :return profile: time and memory taken by reading the files, creating the datastore and each rule, if requested.
     """
     # p4a_path = "tests\\fake_data\\placed_for_adoption_errors.csv"
     # ad1_path = "tests\\fake_data\\ad1.csv"
@@ -83,16 +131,26 @@ def lac_validate(
 
     files_list = process_uploaded_files(lac_data)
     ruleset_registry = get_year_ruleset(file_metadata["collectionYear"])
+    key = _validation_key(file_metadata, session_id)
 
     v = lac_validator.LacValidator(
         metadata=file_metadata,
         files=files_list,
         registry=ruleset_registry,
         selected_rules=selected_rules,
+        trace_memory=profile,
+        cache=ResultCache.from_env(),
+        provider_info_cache=ProviderInfoCache.from_env(),
+        previous=_previous_validations.get(key) if incremental else None,
     )
+    if incremental:
+        _previous_validations[key] = v.state()
+        _previous_validations.move_to_end(key)
+        while len(_previous_validations) > MAX_PREVIOUS_VALIDATIONS:
+            _previous_validations.popitem(last=False)
     results = v.ds_results
     r = Report(results, ruleset_registry)
-    full_issue_df = lac_validator.create_issue_df(r.report, r.error_report)
+    full_issue_df = lac_validator.create_issue_df(r.error_flags, r.error_report)
 
     # what the frontend will display
     issue_report = full_issue_df.to_json(orient="records")
@@ -113,4 +171,6 @@ def lac_validate(
         "data_tables": [lac_data_tables],
         "user_report": user_reports,
     }
+    if profile:
+        validation_results["profile"] = [v.profile.to_frame().to_json(orient="records")]
     return validation_results
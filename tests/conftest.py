@@ -35,7 +35,7 @@ def dummy_metadata():
 
 
 @pytest.fixture(scope="session")
-def dummy_input_data(dummy_input_files, dummy_metadata):
+def dummy_uploads(dummy_input_files):
     fake_data_dir = os.path.join(os.path.dirname(__file__), "fake_data")
 
     dummy_uploads = []
@@ -51,7 +51,11 @@ def dummy_input_data(dummy_input_files, dummy_metadata):
         dummy_uploads.append(
             {"name": filename, "file_content": bytez, "description": "Prev year"}
         )
+    return dummy_uploads
 
+
+@pytest.fixture(scope="session")
+def dummy_input_data(dummy_uploads, dummy_metadata):
     dummy_dfs, extra_metadata = read_from_text(dummy_uploads)
     dummy_metadata.update(extra_metadata)
     return create_datastore(dummy_dfs, dummy_metadata)
@@ -0,0 +1,109 @@
+import importlib.metadata
+import os
+
+import pandas as pd
+
+from lac_validator import cache as cache_module
+from lac_validator.cache import ProviderInfoCache, ResultCache
+from lac_validator.datastore import DataStore
+from lac_validator.executor import RuleRun, run_rule
+from lac_validator.rule_engine import RuleDefinition
+
+
+def uasc_rule(dfs):
+    # reads UASC without declaring it, as some rules do.
+    header = dfs["Header"]
+    if "UASC" in dfs and len(dfs["UASC"]) > 0:
+        return {"Header": header.index.tolist()}
+    return {"Header": []}
+
+
+rule = RuleDefinition(code="101", func=uasc_rule, tables=["Header"])
+
+
+def make_datastore(children, uasc):
+    return DataStore(
+        {
+            "Header": pd.DataFrame({"CHILD": children}),
+            "UASC": pd.DataFrame({"CHILD": uasc}),
+            "metadata": {"collectionYear": "2024"},
+        }
+    )
+
+
+def test_result_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    data_store = make_datastore(["1", "2"], ["1"])
+    assert cache.get(rule, data_store) is None
+
+    run = run_rule(rule, data_store)
+    cache.put(rule, data_store, run)
+
+    cached = cache.get(rule, make_datastore(["1", "2"], ["1"]))
+    assert cached.result == {"Header": [0, 1]}
+    assert cached.tables_used == {"Header", "UASC", "metadata"}
+    # the declared table changed
+    assert cache.get(rule, make_datastore(["1", "3"], ["1"])) is None
+    # a table the rule read without declaring it changed
+    assert cache.get(rule, make_datastore(["1", "2"], [])) is None
+
+
+def test_result_cache_keyed_by_code(monkeypatch, tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    data_store = make_datastore(["1", "2"], ["1"])
+    cache.put(rule, data_store, run_rule(rule, data_store))
+    assert cache.get(rule, data_store) is not None
+    # entries are pickled, so only the owner can write them.
+    assert (cache.directory.stat().st_mode & 0o777) == 0o700
+
+    # results of another version of pandas are not used.
+    version = importlib.metadata.version
+
+    def other_pandas(package):
+        return "0.0.1" if package == "pandas" else version(package)
+
+    monkeypatch.setattr(importlib.metadata, "version", other_pandas)
+    cache_module._code_hash.cache_clear()
+    try:
+        assert cache.get(rule, data_store) is None
+    finally:
+        monkeypatch.undo()
+        cache_module._code_hash.cache_clear()
+    assert cache.get(rule, data_store) is not None
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path)
+    data_stores = [make_datastore([str(i)], []) for i in range(3)]
+    for i, data_store in enumerate(data_stores):
+        cache.put(rule, data_store, RuleRun({"Header": [i]}, tables_used={"Header"}))
+        path = cache._path(cache._key(rule, data_store))
+        os.utime(path, (i, i))
+    size = os.path.getsize(path)
+
+    cache.get(rule, data_stores[0])
+    cache.max_size = 2 * size
+    cache.evict()
+
+    assert cache.get(rule, data_stores[0]).result == {"Header": [0]}
+    assert cache.get(rule, data_stores[1]) is None
+    assert cache.get(rule, data_stores[2]).result == {"Header": [2]}
+
+
+def test_provider_info_cache(tmp_path):
+    cache = ProviderInfoCache(tmp_path)
+    ch = {"name": "ch.xlsx", "file_content": b"ch", "description": "CH lookup"}
+    scp = {"name": "scp.xlsx", "file_content": b"scp", "description": "SCP lookup"}
+    provider_info = pd.DataFrame(
+        {"URN": ["1", "2"], "REG_END": pd.to_datetime(["2023-01-01", None])}
+    )
+    assert cache.get([ch, scp]) is None
+
+    cache.put([ch, scp], provider_info)
+    uploaded_again = [dict(ch, file_content=memoryview(b"ch")), scp]
+    cached = cache.get(uploaded_again)
+    assert cached.equals(provider_info)
+    assert (cached.dtypes == provider_info.dtypes).all()
+    # a changed list, or lists uploaded to the other boxes
+    assert cache.get([dict(ch, file_content=b"ch2"), scp]) is None
+    assert cache.get([dict(ch, description="SCP lookup"), scp]) is None
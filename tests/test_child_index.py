@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lac_validator.child_index import ChildIndex
+from lac_validator.datastore import DataStore, DataStoreView
+from lac_validator.rules.rule_utils import (
+    child_codes,
+    children_not_in,
+    duplicated_children,
+    first_per_child,
+)
+
+
+def test_child_index():
+    data_store = {
+        "Header": pd.DataFrame({"CHILD": ["1", "2", "3", np.nan]}),
+        "AD1": pd.DataFrame({"CHILD": ["1", "4", np.nan, "4"]}, index=[3, 5, 7, 9]),
+        "Header_last": pd.DataFrame({"CHILD": ["5"]}),
+        "metadata": {},
+    }
+
+    index = ChildIndex(data_store)
+
+    assert "Header_last" in index
+    assert "metadata" not in index
+    # missing children match each other, as they do in a merge on CHILD.
+    assert index.not_in("AD1", "Header").tolist() == [False, True, False, True]
+    assert index.not_in("Header", "Header_last").all()
+    assert index.duplicated("AD1").tolist() == [False, True, False, True]
+    assert not index.duplicated("Header").any()
+
+
+def test_children_not_in_matches_merge():
+    tables = {
+        "Episodes": pd.DataFrame({"CHILD": ["1", "1", "2", None]}),
+        "Reviews": pd.DataFrame(
+            {"CHILD": ["3", "1", "3", None, "2"]}, index=[10, 11, 12, 13, 14]
+        ),
+        "metadata": {},
+    }
+    merged = (
+        tables["Reviews"]
+        .reset_index()
+        .merge(tables["Episodes"], how="left", on="CHILD", indicator=True)
+    )
+    expected = merged[merged["_merge"] == "left_only"]["index"].unique().tolist()
+
+    view = DataStoreView(DataStore(tables))
+    assert children_not_in(view, "Reviews", "Episodes") == expected == [10, 12]
+    assert view.tables_used == {"Reviews", "Episodes"}
+    assert children_not_in(tables, "Reviews", "Episodes") == expected
+    assert duplicated_children(view, "Reviews") == [10, 12]
+    assert duplicated_children(tables, "Reviews") == [10, 12]
+
+    # a rule that changes the children in its view has them looked up in its view.
+    view["Reviews"]["CHILD"] = "1"
+    assert children_not_in(view, "Reviews", "Episodes") == []
+
+
+def test_child_codes():
+    tables = {
+        "Episodes": pd.DataFrame({"CHILD": ["b", "a", None]}, index=[4, 5, 6]),
+        "Episodes_last": pd.DataFrame({"CHILD": ["c", "b"]}),
+        "metadata": {},
+    }
+
+    view = DataStoreView(DataStore(tables))
+    codes, codes_last = child_codes(view, "Episodes", "Episodes_last")
+    assert codes.to_dict() == {4: 1, 5: 0, 6: -1}
+    assert codes_last.tolist() == [2, 1]
+    codes, codes_last = child_codes(tables, "Episodes", "Episodes_last")
+    assert codes.tolist() == [1, 0, -1]
+
+
+def test_first_per_child_matches_groupby():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "CHILD": rng.choice(["1", "2", "3", "4", None], 200),
+            "DECOM": pd.to_datetime(
+                rng.choice(["01/04/2020", "02/04/2020", "03/04/2020", None], 200),
+                format="%d/%m/%Y",
+            ),
+        },
+        index=rng.permutation(200),
+    )
+    (codes,) = child_codes({"Episodes": df}, "Episodes")
+
+    for last in [False, True]:
+        grouped = df.groupby("CHILD")["DECOM"]
+        expected = grouped.idxmax() if last else grouped.idxmin()
+        assert first_per_child(codes, df["DECOM"], last).tolist() == expected.tolist()
+
+    df.loc[df["CHILD"] == "2", "DECOM"] = pd.NaT
+    with pytest.raises(ValueError):
+        first_per_child(codes, df["DECOM"])
@@ -1,9 +1,18 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from lac_validator import datastore
 from lac_validator.datastore import (
+    DataStore,
+    DataStoreView,
+    SharedWriteGuard,
     _add_postcode_derived_fields,
+    copy_datastore,
     create_datastore,
     merge_postcodes,
     postcodes,
@@ -23,6 +32,41 @@ def test_postcode_key():
     assert postcodes.dataframe.shape[0] > 100
 
 
+IMPORT_CHECK = """
+from lac_validator import datastore, lac_validator
+import lac_validator.__main__
+
+assert datastore.get_la_df.cache_info().currsize == 0
+datastore.warm_up()
+assert datastore.get_la_df.cache_info().currsize == 1
+assert len(datastore.la_df) > 0
+"""
+
+
+def test_import_does_not_load_reference_data():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CHECK],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    # modules in the order they were imported, up to the reference data loaded by warm_up.
+    imported = [
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+    first_reference = imported.index("qlacref_authorities")
+    assert "lac_validator.__main__" in imported[:first_reference]
+    assert not [
+        name
+        for name in imported[:first_reference]
+        if name.startswith(("qlacref", "brotli", "msgpack"))
+    ]
+
+
 def test_create_datastore(dummy_empty_input):
     metadata = {"collectionYear": "2019/20", "localAuthority": "test_LA"}
     ds = create_datastore(dummy_empty_input, metadata)
@@ -30,6 +74,123 @@ def test_create_datastore(dummy_empty_input):
     assert ds["metadata"] == metadata
 
 
+def test_datastore_dates_are_parsed_once():
+    ds = DataStore(
+        {
+            "Episodes": pd.DataFrame({"DECOM": ["01/04/2020", "31/13/2020", None]}),
+            "metadata": {"collection_end": "31/03/2021"},
+        }
+    )
+
+    dates = ds.dates("Episodes", "DECOM")
+    assert dates.tolist() == [pd.Timestamp("2020-04-01"), pd.NaT, pd.NaT]
+    assert ds.metadata_date("collection_end") == pd.Timestamp("2021-03-31")
+
+    # changes to the returned series or to copies of the tables don't reach the cache
+    dates[0] = pd.NaT
+    ds_copy = copy_datastore(ds)
+    ds_copy["Episodes"]["DECOM"] = "01/01/2000"
+    assert isinstance(ds_copy, DataStore)
+    assert ds_copy.dates("Episodes", "DECOM")[0] == pd.Timestamp("2020-04-01")
+    assert ds_copy._cache is ds._cache
+
+
+def test_datastore_view_copies_tables_on_use():
+    ds = DataStore(
+        {
+            "Header": pd.DataFrame({"CHILD": ["1", "2"]}),
+            "Episodes": pd.DataFrame({"CHILD": ["1"], "RNE": ["S"]}),
+            "metadata": {},
+        }
+    )
+    view = DataStoreView(ds)
+
+    assert "Episodes" in view
+    assert view.tables_used == set()
+
+    view["Episodes"]["RNE"] = "P"
+    view["Episodes"]["DECOM"] = "01/04/2020"
+    del view["Header"]
+
+    assert view.tables_used == {"Episodes"}
+    assert "Header" not in view
+    assert list(view) == ["Episodes", "metadata"]
+    assert view["Episodes"].columns.tolist() == ["CHILD", "RNE", "DECOM"]
+    assert ds["Episodes"].columns.tolist() == ["CHILD", "RNE"]
+    assert ds["Episodes"]["RNE"][0] == "S"
+    assert "Header" in ds
+
+
+def test_datastore_view_uses_cache_until_tables_change():
+    ds = DataStore(
+        {
+            "Episodes": pd.DataFrame(
+                {"CHILD": ["1", "1", "2"], "DECOM": ["01/04/2020", "01/05/2020", None]}
+            ),
+            "metadata": {},
+        }
+    )
+    builds = []
+
+    def first_decom(dfs):
+        builds.append(dfs)
+        return dfs["Episodes"].groupby("CHILD")["DECOM"].first().reset_index()
+
+    view = DataStoreView(ds)
+    assert view.dates("Episodes", "DECOM")[1] == pd.Timestamp("2020-05-01")
+    assert view.tables_used == {"Episodes"}
+    first = view.derived("first_decom", ["Episodes"], first_decom)
+    first["DECOM"] = None
+    assert (
+        DataStoreView(ds)
+        .derived("first_decom", ["Episodes"], first_decom)
+        .equals(pd.DataFrame({"CHILD": ["1", "2"], "DECOM": ["01/04/2020", None]}))
+    )
+    assert len(builds) == 1
+
+    # a rule that changes its view gets values worked out from its own tables.
+    changed = DataStoreView(ds)
+    changed["Episodes"]["DECOM"] = "01/01/2000"
+    assert changed.dates("Episodes", "DECOM")[1] == pd.Timestamp("2000-01-01")
+    assert changed.derived("first_decom", ["Episodes"], first_decom)["DECOM"][0] == (
+        "01/01/2000"
+    )
+    assert builds[-1] is changed
+    assert ds.dates("Episodes", "DECOM")[0] == pd.Timestamp("2020-04-01")
+
+
+def test_datastore_view_isolates_writes_in_place():
+    ds = DataStore(
+        {
+            "Header": pd.DataFrame(
+                {"CHILD": ["1", "2"], "SEX": ["1", "2"], "UPN": ["A", None]}
+            ),
+            "metadata": {},
+        }
+    )
+    guard = SharedWriteGuard(ds)
+    writes = [
+        lambda df: df.__setitem__("SEX", "3"),
+        lambda df: df.loc.__setitem__((0, "SEX"), "3"),
+        lambda df: df.iloc.__setitem__((1, 1), "3"),
+        lambda df: df.fillna({"UPN": "B"}, inplace=True),
+        lambda df: df["UPN"].fillna("B", inplace=True),
+        lambda df: df.replace({"1": "3"}, inplace=True),
+        lambda df: df["SEX"].values.__setitem__(0, "3"),
+    ]
+    for write in writes:
+        view = DataStoreView(ds)
+        write(view["Header"])
+        assert guard.check(view.tables_used) == []
+
+    assert ds["Header"]["SEX"].tolist() == ["1", "2"]
+    assert ds["Header"]["UPN"].tolist() == ["A", None]
+
+    # only writes that bypass the view reach the datastore.
+    ds["Header"].loc[0, "SEX"] = "3"
+    assert guard.check(["Header", "metadata"]) == ["Header"]
+
+
 def test_add_postcodes():
     df = pd.DataFrame([["ZE1 0AA", "ZE3 9JX"]], columns=["HOME_POST", "PL_POST"])
     df = _add_postcode_derived_fields(df, "")
@@ -50,6 +211,30 @@ def test_add_postcodes_columns():
     ]
 
 
+def test_postcodes_looked_up_once(mocker):
+    episodes = pd.DataFrame(
+        {
+            "HOME_POST": ["ZE1 0AA", "ze1 0aa", None],
+            "PL_POST": ["ZE3 9JX", "ZE3 9JX", "ZE1 0AA"],
+        }
+    )
+    merge = mocker.spy(datastore, "merge_postcodes")
+    ds = create_datastore(
+        {"Episodes": episodes, "Episodes_last": episodes.iloc[::-1]},
+        {"collectionYear": "2023/24", "localAuthority": "S12000027"},
+    )
+
+    # each distinct postcode of both tables, and a missing postcode.
+    (postcodes_df, _), _ = merge.call_args
+    assert postcodes_df["POSTCODE"].tolist()[:-1] == ["ZE1 0AA", "ZE3 9JX"]
+    merge.assert_called_once()
+
+    expected = _add_postcode_derived_fields(episodes, "S12000027")
+    assert ds["Episodes"].equals(expected)
+    assert ds["Episodes"]["PL_LA"].tolist() == ["SCO"] * 3
+    assert ds["Episodes_last"].equals(expected.iloc[::-1])
+
+
 @pytest.mark.parametrize(
     "postcode, expected",
     [
@@ -2,13 +2,22 @@ import os
 
 import pytest
 
+from lac_validator import ingress
+from lac_validator.cache import ProviderInfoCache
+from lac_validator.config import code_lists
 from lac_validator.ingress import (
+    categorical_to_object,
+    codes_to_categorical,
+    read_csv,
+    read_csv_with_converters,
     read_csvs_from_text,
     read_from_text,
     read_xml_from_text,
+    read_xml_from_tree,
     construct_provider_info_table,
     combined_ch_scp_check,
     scpch_provider_info_table,
+    Workbook,
 )
 from lac_validator.types import UploadError, UploadedFile
 
@@ -64,8 +73,10 @@ class Test_read_from_text:
         ch = files[1]
 
         read_from_text(files)
-        combined_scpch_check.assert_called_once_with(ch)
-        scpch_provider_info_table.assert_called_once_with(scpch=ch)
+        # the check and the provider info table share one workbook.
+        (workbook,) = combined_scpch_check.call_args.args
+        assert isinstance(workbook, Workbook) and workbook.upload is ch
+        scpch_provider_info_table.assert_called_once_with(scpch=workbook)
 
         # Test ingress for one SCP upload to check if it's the combined form
         files: list[UploadedFile] = [
@@ -117,6 +128,67 @@ def test_read_csv_from_text(dummy_input_files):
         }, f"Got non-object columns in {name}: \n{val.dtypes}!"
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"CHILD,SEX\n1,nan\n02,\n,n/a\n", id="missing values"),
+        pytest.param(b'CHild,SEX\r\n" a,b ","x\r\ny"\r\n', id="quoted values"),
+        pytest.param("\ufeffCHILD,ETHNIC\n\u00dfa,\u00e9\n".encode(), id="unicode"),
+        pytest.param(b"CHILD,SEX\n1\n\n2,1\n", id="short rows"),
+        pytest.param(b"CHILD,SEX\na,1,x\n", id="long rows"),
+        pytest.param(b"CHILD,SEX\n", id="no rows"),
+    ],
+)
+def test_read_csv_matches_converters(content):
+    df = read_csv(content)
+    assert df.equals(read_csv_with_converters(content))
+    assert list(df.columns) == list(read_csv_with_converters(content).columns)
+
+
+def test_read_csv_matches_converters_on_fake_data(dummy_input_files):
+    csv_path_dir = os.path.join(os.path.dirname(__file__), "fake_data")
+    for file_name in dummy_input_files:
+        with open(os.path.join(csv_path_dir, file_name), "rb") as f:
+            content = f.read()
+        assert read_csv(content).equals(read_csv_with_converters(content)), file_name
+
+
+def test_codes_to_categorical():
+    csv_path_dir = os.path.join(os.path.dirname(__file__), "fake_data")
+    uploaded_files = []
+    for file_name, description in [
+        ("episodes.csv", "This year"),
+        ("episodes.csv", "Prev year"),
+        ("header.csv", "This year"),
+    ]:
+        with open(os.path.join(csv_path_dir, file_name), "rb") as f:
+            uploaded_files.append(
+                {"file_content": f.read(), "description": description}
+            )
+
+    dfs = read_csvs_from_text(uploaded_files)
+    original = {name: df.copy() for name, df in dfs.items()}
+    out = codes_to_categorical(dfs)
+
+    dtypes = set()
+    for name, df in out.items():
+        for column in df.columns:
+            if column in code_lists:
+                assert str(df[column].dtype) == "category", f"{name} {column}"
+                dtypes.add(df[column].dtype)
+            else:
+                assert df[column].dtype == object, f"{name} {column}"
+        assert categorical_to_object(df).equals(original[name]), name
+    # every coded column has the same categories, so they can be compared.
+    assert len(dtypes) == 1
+    assert (out["Episodes"]["PLACE"] == out["Episodes_last"]["PLACE"]).all()
+    coded = [column for column in out["Episodes"].columns if column in code_lists]
+    assert (
+        out["Episodes"][coded].memory_usage(deep=True).sum()
+        < original["Episodes"][coded].memory_usage(deep=True).sum() / 5
+    )
+
+
 def test_read_xml_from_text():
     xml_path = os.path.join(os.path.dirname(__file__), "fake_data", "fake_903.xml")
     with open(xml_path) as f:
@@ -131,6 +203,47 @@ def test_read_xml_from_text():
         }, f"Got non-objects columns in {name}: \n{val.dtypes}!"
 
 
+@pytest.mark.parametrize(
+    "xml",
+    [
+        pytest.param(
+            "<R><V>1</V><CHILD><HEADER><CHILDID>a1</CHILDID><UASC>x</UASC></HEADER></CHILD></R>",
+            id="elements outside children",
+        ),
+        pytest.param(
+            "<R>\n <CHILD>\n  <HEADER><CHILDID> a </CHILDID><SEX/></HEADER>\n"
+            "  <EPISODE><PL>u1</PL></EPISODE><EPISODE><DECOM>d</DECOM></EPISODE>\n </CHILD>\n</R>\n",
+            id="values from other episodes",
+        ),
+        pytest.param("<R/>", id="no children"),
+        pytest.param(
+            '<?xml version="1.0" encoding="utf-8"?><R><CHILD><HEADER><CHILDID>\u00df</CHILDID>'
+            "</HEADER></CHILD></R>".encode(),
+            id="bytes",
+        ),
+    ],
+)
+def test_read_xml_matches_tree(xml):
+    out = read_xml_from_text(xml)
+    expected = read_xml_from_tree(xml)
+    assert list(out) == list(expected)
+    for name, df in expected.items():
+        assert df.equals(out[name]), name
+        assert list(df.columns) == list(out[name].columns), name
+
+
+def test_read_xml_matches_tree_on_fake_data(monkeypatch):
+    xml_path = os.path.join(os.path.dirname(__file__), "fake_data", "fake_903.xml")
+    with open(xml_path, "rb") as f:
+        data = f.read()
+
+    # children are split across the chunks fed to the parser.
+    monkeypatch.setattr(ingress, "XML_CHUNK_SIZE", 1000)
+    out = read_xml_from_text(data)
+    for name, df in read_xml_from_tree(data).items():
+        assert df.equals(out[name]), name
+
+
 def test_construct_provider_info_table(dummy_chscp):
     """Tests childrens home and social care providers form ingress as both forms
     and as filepaths to the location of the files."""
@@ -173,6 +286,46 @@ def test_construct_provider_info_table(dummy_chscp):
     assert file_output_columns == expected_columns
 
 
+@pytest.fixture
+def concurrent_ingress(monkeypatch):
+    """Parses uploads concurrently however many CPUs there are."""
+    monkeypatch.setattr(ingress, "CONCURRENT", True)
+    monkeypatch.setattr(ingress.os, "cpu_count", lambda: 4)
+
+
+def test_concurrent_read_matches_serial(
+    concurrent_ingress, monkeypatch, dummy_uploads, dummy_chscp
+):
+    uploads = dummy_uploads + [
+        {"name": "ch.xlsx", "file_content": dummy_chscp[0], "description": "CH lookup"},
+        {
+            "name": "scp.xlsx",
+            "file_content": dummy_chscp[1],
+            "description": "SCP lookup",
+        },
+    ]
+    dfs, metadata = read_from_text(uploads)
+    monkeypatch.setattr(ingress, "CONCURRENT", False)
+    serial_dfs, serial_metadata = read_from_text(uploads)
+
+    assert list(dfs) == list(serial_dfs)
+    for name, df in serial_dfs.items():
+        assert df.equals(dfs[name]), name
+    assert metadata["provider_info"].equals(serial_metadata["provider_info"])
+
+
+def test_concurrent_read_errors(concurrent_ingress, dummy_uploads, dummy_chscp):
+    bad_file = {"name": "bad.csv", "file_content": b"A,B\n1,2\n", "description": ""}
+    with pytest.raises(UploadError, match="known column names"):
+        read_csvs_from_text(dummy_uploads + [bad_file])
+
+    # raised in the worker process reading the CH list, given the SCP list which has none of its sheets.
+    with pytest.raises(UploadError, match="expected sheet names"):
+        construct_provider_info_table(
+            {"file_content": dummy_chscp[1]}, {"file_content": dummy_chscp[1]}
+        )
+
+
 def test_combined_ch_scp_check(dummy_chscp):
     ch = {}
     scp = {}
@@ -208,6 +361,63 @@ def test_combined_ch_scp_check(dummy_chscp):
     print("pass 3")
 
 
+def test_workbook_reads_only_columns_asked_for(dummy_chscp):
+    workbook = Workbook({"file_content": memoryview(dummy_chscp[6])})
+    assert workbook.sheet_names == ["Providers"]
+
+    df = workbook.sheet(0, ["URN", "Provider Type", "not a column"])
+    assert df.columns.str.lower().to_list() == ["urn", "provider type"]
+    assert df.equals(workbook.sheet("Providers")[df.columns])
+
+    # later reads of the sheet are not changed by changes to earlier ones.
+    df.columns = ["a", "b"]
+    assert workbook.sheet(0, ["urn", "provider type"]).columns.to_list() != ["a", "b"]
+
+
+@pytest.mark.parametrize("combined", [6, 7, 8])
+def test_combined_upload_opens_workbook_once(
+    mocker, dummy_uploads, dummy_chscp, combined
+):
+    expected = scpch_provider_info_table({"file_content": dummy_chscp[combined]})
+    sheet_count = len(Workbook(dummy_chscp[combined]).sheet_names)
+
+    opens = mocker.spy(ingress.pd.ExcelFile, "__init__")
+    parses = mocker.spy(ingress.pd.ExcelFile, "parse")
+    uploads = dummy_uploads + [
+        {
+            "name": "scpch.xlsx",
+            "file_content": dummy_chscp[combined],
+            "description": "CH lookup",
+        }
+    ]
+    _, metadata = read_from_text(uploads)
+
+    assert metadata["provider_info"].equals(expected)
+    assert opens.call_count == 1
+    # the check of a one sheet list parses the same columns that the table is then made from.
+    assert parses.call_count == sheet_count
+
+
+def test_read_from_text_caches_provider_info(
+    mocker, tmp_path, dummy_uploads, dummy_chscp
+):
+    cache = ProviderInfoCache(tmp_path)
+    uploads = dummy_uploads + [
+        {"name": "ch.xlsx", "file_content": dummy_chscp[0], "description": "CH lookup"},
+        {
+            "name": "scp.xlsx",
+            "file_content": dummy_chscp[1],
+            "description": "SCP lookup",
+        },
+    ]
+    _, metadata = read_from_text(uploads, provider_info_cache=cache)
+
+    construct_info = mocker.patch("lac_validator.ingress.construct_provider_info_table")
+    _, cached_metadata = read_from_text(uploads, provider_info_cache=cache)
+    construct_info.assert_not_called()
+    assert cached_metadata["provider_info"].equals(metadata["provider_info"])
+
+
 def test_scpch_provider_info_table(dummy_chscp):
     expected_columns = [
         "URN",
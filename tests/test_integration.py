@@ -99,3 +99,35 @@ def test_has_correct_table_names(dummy_input_data):
         assert all(
             r in dummy_input_data_copy for r in result
         ), f"Validator for {rule.code} returns a wrong table name!"
+
+
+def test_declared_tables_are_required(dummy_input_data):
+    """
+    Rules are skipped without being run if one of their declared tables is missing,
+    so every rule must return {} when any of them is left out.
+    """
+    for rule_code, rule in registry.items():
+        for declared in rule.tables:
+            dummy_data_copy = copy_datastore(dummy_input_data)
+            # a tuple of alternative tables is only missing if all of them are.
+            alternatives = declared if isinstance(declared, tuple) else (declared,)
+            for table in alternatives:
+                if table == "Provider Info":
+                    dummy_data_copy["metadata"] = {
+                        k: v
+                        for k, v in dummy_data_copy["metadata"].items()
+                        if k != "provider_info"
+                    }
+                else:
+                    assert (
+                        table in dummy_data_copy
+                    ), f"Rule {rule_code} declares unknown table {table}!"
+                    del dummy_data_copy[table]
+
+            try:
+                result = rule.func(dummy_data_copy)
+            except MissingMetadataError:
+                result = {}
+            assert (
+                result == {}
+            ), f"Rule {rule_code} runs without its declared table {declared}!"
@@ -0,0 +1,147 @@
+import pandas as pd
+import pytest
+
+from lac_validator.cache import ResultCache
+from lac_validator.lac_validator import LacValidator
+from lac_validator.rules.ruleset_utils import get_year_ruleset
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return get_year_ruleset("2024")
+
+
+@pytest.fixture(scope="module")
+def selected_rules(registry):
+    # a spread of rules, including some that read tables written by others.
+    return list(registry)[:40] + ["365", "607", "387", "503A", "EPI", "SW01STG1"]
+
+
+def run_validator(dummy_uploads, registry, selected_rules, **kwargs):
+    return LacValidator(
+        metadata={"collectionYear": "2024", "localAuthority": "E09000027"},
+        files=dummy_uploads,
+        registry=registry,
+        selected_rules=selected_rules,
+        **kwargs,
+    )
+
+
+def test_parallel_validate_matches_serial(dummy_uploads, registry, selected_rules):
+    serial = run_validator(dummy_uploads, registry, selected_rules)
+    parallel = run_validator(dummy_uploads, registry, selected_rules, workers=2)
+
+    assert parallel.dones == serial.dones
+    assert parallel.skips == serial.skips
+    assert parallel.fails == serial.fails
+    assert parallel.ds_results.keys() == serial.ds_results.keys()
+    for table, df in serial.ds_results.items():
+        if table == "metadata":
+            continue
+        assert df.equals(parallel.ds_results[table]), table
+        assert list(df.columns) == list(parallel.ds_results[table].columns), table
+
+
+def test_rules_do_not_change_shared_data(dummy_uploads, registry):
+    validator = run_validator(
+        dummy_uploads, registry, selected_rules=None, check_shared_writes=True
+    )
+
+    assert validator.shared_writes == {}
+
+
+def test_profile(dummy_uploads, registry, selected_rules):
+    validator = run_validator(
+        dummy_uploads, registry, selected_rules, workers=2, trace_memory=True
+    )
+
+    df = validator.profile.to_frame()
+    assert {"ingress", "datastore", "rules", "results"} == set(df["section"])
+    rules = df[df["section"] == "rules"]
+    assert set(validator.dones) <= set(rules["name"]) <= set(selected_rules)
+    assert rules["peak_memory"].notna().all()
+
+
+def test_cached_validate_matches_uncached(
+    dummy_uploads, registry, selected_rules, tmp_path
+):
+    cache = ResultCache(tmp_path)
+    uncached = run_validator(dummy_uploads, registry, selected_rules)
+    run_validator(dummy_uploads, registry, selected_rules, cache=cache)
+    cached = run_validator(dummy_uploads, registry, selected_rules, cache=cache)
+
+    # rules skipped for missing tables are not run, so are not cached either.
+    assert set(cached.dones) <= set(cached.cache_hits)
+    assert set(cached.cache_hits) <= set(cached.dones) | set(cached.skips)
+    assert cached.dones == uncached.dones
+    assert cached.skips == uncached.skips
+    for table, df in uncached.ds_results.items():
+        if table != "metadata":
+            assert df.equals(cached.ds_results[table]), table
+
+
+def test_incremental_validate_matches_full(dummy_uploads, registry, selected_rules):
+    edited_uploads = [
+        {
+            **upload,
+            "file_content": upload["file_content"].replace(b"PN1", b"PN2"),
+        }
+        if upload["name"] == "reviews.csv" and upload["description"] == "This year"
+        else upload
+        for upload in dummy_uploads
+    ]
+    previous = run_validator(dummy_uploads, registry, selected_rules)
+    incremental = run_validator(
+        edited_uploads, registry, selected_rules, previous=previous.state()
+    )
+    full = run_validator(edited_uploads, registry, selected_rules)
+
+    state = previous.state()
+    assert not any(isinstance(run.result, pd.DataFrame) for run in state.runs.values())
+    assert set(state.content_hashes) == set(previous.data_store)
+
+    assert incremental.reused
+    assert not any("Reviews" in registry[code].tables for code in incremental.reused)
+    assert incremental.dones == full.dones
+    assert incremental.skips == full.skips
+    for table, df in full.ds_results.items():
+        if table != "metadata":
+            assert df.equals(incremental.ds_results[table]), table
+
+
+def test_sharded_validate_matches_serial(dummy_uploads):
+    # every rule, so that rules comparing children that are not defined as cross_child show up.
+    # most partitions have no rows of SWEpisodes.
+    registry = get_year_ruleset("2027")
+    kwargs = dict(
+        metadata={"collectionYear": "2027", "localAuthority": "E09000027"},
+        files=dummy_uploads,
+        registry=registry,
+        selected_rules=list(registry),
+    )
+    serial = LacValidator(**kwargs)
+    sharded = LacValidator(partitions=7, **kwargs)
+
+    assert sharded.dones == serial.dones
+    assert sharded.skips == serial.skips
+    assert sharded.fails == serial.fails
+    for table, df in serial.ds_results.items():
+        if table != "metadata":
+            assert df.equals(sharded.ds_results[table]), table
+
+
+def test_categorical_validate_matches_object(dummy_uploads, registry, selected_rules):
+    # 434 and 436 fill in missing codes.
+    selected_rules = selected_rules + ["434", "436"]
+    plain = run_validator(dummy_uploads, registry, selected_rules)
+    categorical = run_validator(
+        dummy_uploads, registry, selected_rules, categorical_codes=True
+    )
+
+    assert str(categorical.dfs["Episodes"]["PLACE"].dtype) == "category"
+    assert categorical.dones == plain.dones
+    assert categorical.skips == plain.skips
+    assert categorical.fails == plain.fails
+    for table, df in plain.ds_results.items():
+        if table != "metadata":
+            assert df.equals(categorical.ds_results[table]), table
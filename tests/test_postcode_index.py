@@ -0,0 +1,146 @@
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import qlacref_postcodes
+from qlacref_postcodes import Postcodes
+
+from lac_validator import datastore
+from lac_validator.datastore import get_la_df, merge_postcodes, upper_tier_authorities
+from lac_validator.postcode_index import POSTCODE_INDEX_VARIABLE, PostcodeIndex
+
+
+def z_postcodes(data_dir):
+    """The postcode reference data, with only the postcodes starting with Z."""
+    source_dir = Path(qlacref_postcodes.__file__).parent
+    shutil.copy(source_dir / "postcodes_Z.msgpack.br", data_dir)
+    return Postcodes(data_dir)
+
+
+@pytest.fixture(scope="module")
+def z_index(tmp_path_factory):
+    """An index of the postcodes starting with Z."""
+    source = z_postcodes(tmp_path_factory.mktemp("postcodes"))
+    return PostcodeIndex.build(tmp_path_factory.mktemp("index"), source, get_la_df())
+
+
+def test_lookup_matches_merge(monkeypatch, z_index):
+    postcodes = ["ZE1 0AA", "ze3 9jx", " ZE10AA", "ZE1 0AA ", "", None, np.nan]
+    postcodes += ["ZE1 0AAA", "ZÉ1 0AA", "ZZ99 9ZZ", "ZE2 9AU"]
+    df = pd.DataFrame({"HOME_POST": postcodes}, index=range(10, 10 + len(postcodes)))
+
+    monkeypatch.setattr(datastore, "get_postcode_index", lambda: None)
+    expected_df = df.copy()
+    expected = merge_postcodes(expected_df, "HOME_POST")
+    assert expected["laua"].notna().sum() > 3
+
+    monkeypatch.setattr(datastore, "get_postcode_index", lambda: z_index)
+    looked_up = merge_postcodes(df, "HOME_POST")
+    assert looked_up.equals(expected)
+    assert (looked_up.dtypes == expected.dtypes).all()
+    assert df.equals(expected_df)
+
+
+def test_index_from_env(monkeypatch, tmp_path, z_index):
+    monkeypatch.delenv(POSTCODE_INDEX_VARIABLE, raising=False)
+    assert PostcodeIndex.from_env() is None
+
+    monkeypatch.setenv(POSTCODE_INDEX_VARIABLE, str(tmp_path))
+    assert PostcodeIndex.from_env() is None
+
+    monkeypatch.setenv(POSTCODE_INDEX_VARIABLE, str(z_index.directory))
+    assert len(PostcodeIndex.from_env()) == len(z_index)
+
+    # an index built from another version of the reference data.
+    shutil.copytree(z_index.directory, tmp_path / "old")
+    (tmp_path / "old" / "index.json").write_text(json.dumps({"version": "2000.1"}))
+    monkeypatch.setenv(POSTCODE_INDEX_VARIABLE, str(tmp_path / "old"))
+    assert PostcodeIndex.from_env() is None
+
+
+def test_upper_tier_matches_merge(monkeypatch, z_index):
+    la_df = get_la_df()
+    laua = la_df["LTLA21CD"].tolist()[::-1] + ["E99999999", "", None, np.nan, 1]
+    laua = pd.Series(laua, index=range(5, 5 + len(laua)))
+
+    monkeypatch.setattr(datastore, "get_postcode_index", lambda: None)
+    expected = upper_tier_authorities(laua)
+    assert expected["UTLA21CD"].notna().sum() == len(la_df)
+
+    monkeypatch.setattr(datastore, "get_postcode_index", lambda: z_index)
+    assert upper_tier_authorities(laua).equals(expected)
+
+
+def test_publish_builds_once(tmp_path, z_index):
+    built = []
+
+    def source():
+        built.append(True)
+        return z_postcodes(tmp_path / "postcodes")
+
+    (tmp_path / "postcodes").mkdir()
+    directory = tmp_path / "shared" / "index"
+    first = PostcodeIndex.publish(directory, source, get_la_df)
+    second = PostcodeIndex.publish(directory, source, get_la_df)
+    assert len(built) == 1
+    assert len(first) == len(second) == len(z_index)
+    assert list((tmp_path / "shared").iterdir()) == [directory]
+
+    # an index built from another version of the reference data is replaced.
+    (directory / "index.json").write_text(json.dumps({"version": "2000.1"}))
+    assert len(PostcodeIndex.publish(directory, source, get_la_df)) == len(z_index)
+    assert len(built) == 2
+    assert PostcodeIndex.open(directory) is not None
+
+
+def test_warm_up_publishes_index(monkeypatch, tmp_path, z_index):
+    directory = tmp_path / "index"
+    monkeypatch.setenv(POSTCODE_INDEX_VARIABLE, str(directory))
+    monkeypatch.setattr(datastore, "_new_postcodes", lambda: z_postcodes(tmp_path))
+    datastore.get_postcode_index.cache_clear()
+    try:
+        datastore.warm_up()
+        assert len(datastore.get_postcode_index()) == len(z_index)
+    finally:
+        datastore.get_postcode_index.cache_clear()
+
+
+def test_publish_keeps_other_files(tmp_path, z_index):
+    (tmp_path / "postcodes").mkdir()
+
+    def source():
+        return z_postcodes(tmp_path / "postcodes")
+
+    directory = tmp_path / "index"
+    directory.mkdir()
+    (directory / "README").write_text("not an index")
+    with pytest.raises(ValueError, match="not a postcode index directory"):
+        PostcodeIndex.publish(directory, source, get_la_df)
+    assert [path.name for path in directory.iterdir()] == ["README"]
+
+    # a stale index is replaced by removing only its files, so an empty directory is fine.
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    assert len(PostcodeIndex.publish(empty, source, get_la_df)) == len(z_index)
+    (empty / "index.json").write_text(json.dumps({"version": "2000.1"}))
+    (empty / "README").write_text("not an index")
+    with pytest.raises(ValueError, match="README"):
+        PostcodeIndex.publish(empty, source, get_la_df)
+    assert (empty / "pcd_abbr.npy").is_file()
+
+
+def test_publish_rename_fails_without_index(tmp_path):
+    # another process writes a file into the directory while the index is built.
+    (tmp_path / "postcodes").mkdir()
+    directory = tmp_path / "index"
+
+    def source():
+        directory.mkdir()
+        (directory / "README").write_text("not an index")
+        return z_postcodes(tmp_path / "postcodes")
+
+    with pytest.raises(ValueError, match="not a postcode index directory"):
+        PostcodeIndex.publish(directory, source, get_la_df)
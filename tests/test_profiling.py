@@ -0,0 +1,22 @@
+from lac_validator.profiling import Profile, memory_tracing
+
+
+def test_profile_steps():
+    profile = Profile()
+    with profile.step("ingress", "csv files"):
+        sum(range(1000))
+    with memory_tracing():
+        with profile.step("rules", "101"):
+            data = [0] * 100_000
+        with profile.step("rules", "102"):
+            pass
+
+    df = profile.to_frame()
+    assert df["name"].tolist() == ["csv files", "101", "102"]
+    assert (df["wall_time"] >= 0).all()
+    assert profile.steps[0].peak_memory is None
+    assert df["peak_memory"][1] >= 700_000
+    assert df["peak_memory"][1] > df["peak_memory"][2]
+
+    summary = profile.summary(top=1)
+    assert summary["name"].tolist() == ["csv files", "101"]
@@ -1,10 +1,13 @@
 import json
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from lac_validator.report import _create_child_summary
+from lac_validator.report import Report, _create_child_summary
+from lac_validator.results import ErrorLocations
+from lac_validator.rule_engine import RuleDefinition
 
 
 @pytest.fixture(scope="session")
@@ -27,3 +30,153 @@ def test_child_summary(single_test_fixture):
     child_report = pd.DataFrame([single_test_fixture["input"]])
     df = _create_child_summary(child_report)
     assert df.to_dict(orient="records") == [single_test_fixture["output"]]
+
+
+@pytest.fixture
+def report():
+    episodes = pd.DataFrame(
+        {
+            "CHILD": ["1", "1", "2", "3"],
+            "DECOM": ["01/04/2020", "01/05/2020", "01/06/2020", "01/07/2020"],
+            "RNE": ["S", "P", None, "S"],
+            "__temp": ["a", "b", "c", "d"],
+        },
+        index=[10, 11, 12, 13],
+    )
+    header = pd.DataFrame({"CHILD": ["1", "2", "3"], "SEX": ["1", "2", "1"]})
+    errors = ErrorLocations()
+    errors.add("101", "Episodes", [11, 13])
+    errors.add("101", "Header", [0])
+    errors.add("102", "Episodes", [11])
+    errors.add("102", "Header", [2])
+    registry = {
+        code: RuleDefinition(
+            code=code, func=None, message=f"Error {code}", affected_fields=["RNE"]
+        )
+        for code in ["101", "102", "103"]
+    }
+    data_store = {"Episodes": episodes, "Header": header, "metadata": {}}
+    return Report(errors.flag_tables(data_store), registry)
+
+
+def test_child_report(report):
+    child_report = report.child_report
+    assert list(
+        zip(child_report["Table"], child_report["RowID"], child_report["Code"])
+    ) == [
+        ("Episodes", 11, "101"),
+        ("Episodes", 13, "101"),
+        ("Header", 0, "101"),
+        ("Episodes", 11, "102"),
+        ("Header", 2, "102"),
+    ]
+    assert child_report["Context"].tolist() == [
+        {"DECOM": "01/05/2020", "RNE": "P"},
+        {"DECOM": "01/07/2020", "RNE": "S"},
+        {"SEX": "1"},
+        {"DECOM": "01/05/2020", "RNE": "P"},
+        {"SEX": "1"},
+    ]
+    assert child_report["Child Error Count"].tolist() == [3, 2, 3, 3, 2]
+    assert child_report["Error Type Count"].tolist() == [3, 3, 3, 2, 2]
+    assert "Context" not in report.error_flags
+    assert report.error_flags["Total Errors"].tolist() == [0, 2, 0, 1, 1, 0, 1]
+    assert list(report.report.columns[:4]) == ["Table", "RowID", "CHILD", "Context"]
+    assert report.report["Context"].tolist() == [
+        {"DECOM": "01/04/2020", "RNE": "S"},
+        {"DECOM": "01/05/2020", "RNE": "P"},
+        {"DECOM": "01/06/2020", "RNE": None},
+        {"DECOM": "01/07/2020", "RNE": "S"},
+        {"SEX": "1"},
+        {"SEX": "2"},
+        {"SEX": "1"},
+    ]
+    assert report.report["Total Errors"].tolist() == [0, 2, 0, 1, 1, 0, 1]
+
+    child_summary = report.child_summary
+    assert child_summary["Affected Values"].tolist() == [
+        "RNE: P",
+        "RNE: P",
+        "",
+        "RNE: S",
+        "",
+    ]
+    assert child_summary["Locator Hints"].tolist() == [
+        "DECOM: 01/05/2020",
+        "DECOM: 01/05/2020",
+        "",
+        "DECOM: 01/07/2020",
+        "",
+    ]
+
+
+def test_report_without_errors():
+    empty = Report({"Episodes": pd.DataFrame({"CHILD": ["1"], "RNE": ["S"]})}, {})
+    assert len(empty.child_report) == 0
+
+
+def test_child_report_matches_baseline():
+    # a child missing from some rows, errors added out of order, and a table without errors.
+    episodes = pd.DataFrame(
+        {
+            "CHILD": ["1", "1", np.nan, "3"],
+            "DECOM": ["01/04/2020", "01/05/2020", "01/06/2020", "01/07/2020"],
+        },
+        index=[10, 11, 12, 13],
+    )
+    header = pd.DataFrame({"CHILD": ["1", "2", "3"], "SEX": ["1", "2", "1"]})
+    missing = pd.DataFrame(
+        {"CHILD": ["2", np.nan], "MIS_START": ["01/01/2020", "02/01/2020"]}
+    )
+    reviews = pd.DataFrame({"CHILD": ["1"], "REVIEW": ["01/02/2020"]})
+    errors = ErrorLocations()
+    errors.add("102", "Missing", [0, 1])
+    errors.add("101", "Episodes", [13, 12, 10])
+    errors.add("101", "Header", [2])
+    errors.add("103", "Header", [1, 0])
+    errors.add("102", "Episodes", [12])
+    registry = {
+        code: RuleDefinition(
+            code=code, func=None, message=f"Error {code}", affected_fields=["SEX"]
+        )
+        for code in ["101", "102", "103", "104"]
+    }
+    data_store = {
+        "Episodes": episodes,
+        "Header": header,
+        "Missing": missing,
+        "Reviews": reviews,
+        "metadata": {},
+    }
+
+    child_report = Report(errors.flag_tables(data_store), registry).child_report
+
+    # as made by melting every error column of the report, before only errors were looked at.
+    codes = ["101"] * 4 + ["102"] * 3 + ["103"] * 2
+    expected = pd.DataFrame(
+        {
+            "CHILD": ["1", np.nan, "3", "3", np.nan, "2", np.nan, "1", "2"],
+            "Table": ["Episodes"] * 3
+            + ["Header", "Episodes"]
+            + ["Missing"] * 2
+            + ["Header"] * 2,
+            "RowID": [10, 12, 13, 2, 12, 0, 1, 0, 1],
+            "Context": [
+                {"DECOM": "01/04/2020"},
+                {"DECOM": "01/06/2020"},
+                {"DECOM": "01/07/2020"},
+                {"SEX": "1"},
+                {"DECOM": "01/06/2020"},
+                {"MIS_START": "01/01/2020"},
+                {"MIS_START": "02/01/2020"},
+                {"SEX": "1"},
+                {"SEX": "2"},
+            ],
+            "Code": codes,
+            "Description": [f"Error {code}" for code in codes],
+            "Fields": [["SEX"]] * 9,
+            "Child Error Count": [2, np.nan, 2, 2, np.nan, 2, np.nan, 2, 2],
+            "Error Type Count": pd.Series([4] * 4 + [3] * 3 + [2] * 2, dtype=object),
+        }
+    )
+    pd.testing.assert_frame_equal(child_report, expected)
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from lac_validator.results import ErrorLocations
+
+
+def test_flag_tables():
+    data_store = {
+        "Header": pd.DataFrame({"CHILD": ["1", "2", "3"]}),
+        "Episodes": pd.DataFrame({"CHILD": ["1", "1"]}),
+        "metadata": {},
+    }
+    errors = ErrorLocations()
+    errors.add("101", "Header", [0, 2])
+    errors.add("102", "Header", [])
+    errors.add("103", "Header", [1, 1])
+
+    flagged = errors.flag_tables(data_store)
+
+    assert list(errors) == [
+        ("Header", "101", [0, 2]),
+        ("Header", "102", []),
+        ("Header", "103", [1, 1]),
+    ]
+    assert flagged["Header"].columns.tolist() == [
+        "CHILD",
+        "ERR_101",
+        "ERR_102",
+        "ERR_103",
+    ]
+    assert flagged["Header"]["ERR_101"].tolist()[0] is True
+    assert np.isnan(flagged["Header"]["ERR_101"][1])
+    assert flagged["Header"]["ERR_102"].isna().all()
+    assert flagged["Header"]["ERR_103"].dtype == object
+    assert flagged["Header"]["ERR_103"].eq(True).tolist() == [False, True, False]
+    assert flagged["Episodes"].columns.tolist() == ["CHILD"]
+    assert data_store["Header"].columns.tolist() == ["CHILD"]
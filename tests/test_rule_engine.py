@@ -0,0 +1,73 @@
+import pandas as pd
+
+from lac_validator.rule_engine import RuleDefinition, schedule_rules
+
+
+def make_rule(code, tables, calls=None):
+    def func(dfs):
+        if calls is not None:
+            calls.append(code)
+        return {}
+
+    return RuleDefinition(code=code, func=func, tables=tables)
+
+
+def test_schedule_rules_skips_missing_tables():
+    calls = []
+    rules = {
+        "101": make_rule("101", ["Episodes"], calls),
+        "102": make_rule("102", ["Episodes", "Episodes_last"], calls),
+        "103": make_rule("103", ["Header"], calls),
+        "104": make_rule("104", ["Episodes", "Provider Info"], calls),
+    }
+    data_store = {"Episodes": pd.DataFrame(), "metadata": {}}
+
+    schedule = schedule_rules(rules, data_store)
+
+    assert [rule.code for rule in schedule.runnable] == ["101"]
+    assert [rule.code for rule in schedule.skipped] == ["102", "103", "104"]
+    assert calls == []
+
+
+def test_schedule_rules_provider_info():
+    rules = {"104": make_rule("104", ["Episodes", "Provider Info"])}
+    data_store = {
+        "Episodes": pd.DataFrame(),
+        "metadata": {"provider_info": pd.DataFrame()},
+    }
+
+    schedule = schedule_rules(rules, data_store)
+
+    assert [rule.code for rule in schedule.runnable] == ["104"]
+
+
+def test_schedule_rules_batches_by_tables():
+    rules = {
+        "101": make_rule("101", ["Episodes"]),
+        "102": make_rule("102", ["Header", "Episodes"]),
+        "103": make_rule("103", ["Header"]),
+        "104": make_rule("104", ["Episodes"]),
+        "105": make_rule("105", ["Episodes", "Header"]),
+        "106": RuleDefinition(code="106", func=lambda dfs: {}),
+    }
+    data_store = {"Episodes": pd.DataFrame(), "Header": pd.DataFrame()}
+
+    schedule = schedule_rules(rules, data_store)
+
+    batches = [[rule.code for rule in batch] for batch in schedule.batches]
+    # rules without declared tables are always run, after the others.
+    assert batches == [["101", "104"], ["102", "105"], ["103"], ["106"]]
+
+
+def test_schedule_rules_alternative_tables():
+    rules = {
+        "205D": make_rule("205D", [("Header", "UASC"), ("Header_last", "UASC_last")])
+    }
+
+    schedule = schedule_rules(
+        rules, {"UASC": pd.DataFrame(), "Header_last": pd.DataFrame()}
+    )
+    assert [rule.code for rule in schedule.runnable] == ["205D"]
+
+    schedule = schedule_rules(rules, {"UASC": pd.DataFrame()})
+    assert [rule.code for rule in schedule.skipped] == ["205D"]
@@ -0,0 +1,68 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from lac_validator.rule_engine import LazyRuleFunction
+from lac_validator.rules.ruleset_utils import (
+    MANIFEST_FILE,
+    RULES_DIR,
+    get_year_ruleset,
+    manifest_text,
+    read_manifest,
+)
+
+RULESETS = sorted(path.parent.name for path in RULES_DIR.glob("lac*/__init__.py"))
+
+
+@pytest.mark.parametrize("ruleset", RULESETS)
+def test_manifest_is_up_to_date(ruleset):
+    manifest_registry = read_manifest(ruleset)
+    assert (
+        manifest_registry is not None
+    ), f"Manifest of {ruleset} is missing or out of date, run python -m lac_validator manifest"
+
+    registry = importlib.import_module(f"lac_validator.rules.{ruleset}").registry
+    assert list(manifest_registry) == list(registry)
+    for code, rule in registry.items():
+        listed = manifest_registry[code]
+        assert listed.func.__module__ == rule.func.__module__
+        assert listed.func.__qualname__ == rule.func.__qualname__
+        assert listed.message == rule.message
+        assert listed.affected_fields == rule.affected_fields
+        assert listed.tables == rule.tables
+        assert listed.cross_child == rule.cross_child
+    # catches changes to how manifests are written, as well as to the rules.
+    assert (RULES_DIR / ruleset / MANIFEST_FILE).read_text() == manifest_text(
+        ruleset
+    ), f"Manifest of {ruleset} is out of date, run python -m lac_validator manifest"
+
+
+def test_registry_is_read_once_per_year():
+    assert get_year_ruleset("2024") is get_year_ruleset("2024")
+    assert get_year_ruleset("2024") is not get_year_ruleset("2025")
+
+
+def test_rules_are_imported_when_run():
+    script = (
+        "import sys\n"
+        "from lac_validator.rules.ruleset_utils import get_year_ruleset\n"
+        "registry = get_year_ruleset('2024')\n"
+        "imported = lambda: [m for m in sys.modules if '.rules.lac' in m and '.rule_' in m]\n"
+        "assert imported() == [], imported()\n"
+        "assert registry['101'].func({}) == {}\n"
+        "assert imported() == ['lac_validator.rules.lac2022_23.rule_101'], imported()\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_lazy_rule_function():
+    rule = get_year_ruleset("2024")["101"]
+
+    assert isinstance(rule.func, LazyRuleFunction)
+    assert rule.func == LazyRuleFunction(
+        rule.func.__module__, rule.func.__qualname__, "101"
+    )
+    assert rule.func.load() is rule.func.load()
+    assert rule.func.load().__module__ == rule.func.__module__
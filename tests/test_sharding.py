@@ -0,0 +1,133 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from lac_validator.datastore import DataStore
+from lac_validator.executor import RuleRun, run_rule
+from lac_validator.profiling import StepProfile
+from lac_validator.results import ErrorLocations
+from lac_validator.rule_engine import RuleDefinition
+from lac_validator.sharding import merge_runs, partition_datastore, run_rules_sharded
+
+
+def test_partition_datastore():
+    data_store = DataStore(
+        {
+            "Header": pd.DataFrame({"CHILD": ["1", "2", "3", "4"]}, index=[5, 6, 7, 8]),
+            "Episodes": pd.DataFrame({"CHILD": ["1", "1", "2", "4", "4", "3"]}),
+            "metadata": {"collection_year": "2024"},
+        }
+    )
+
+    parts = partition_datastore(data_store, 2)
+
+    assert len(parts) == 2
+    for table in ["Header", "Episodes"]:
+        children = [set(part.data_store[table]["CHILD"]) for part in parts]
+        assert children[0].isdisjoint(children[1])
+        labels = np.concatenate([part.labels[table] for part in parts])
+        assert sorted(labels) == sorted(data_store[table].index)
+    for part in parts:
+        assert part.data_store["metadata"] is data_store["metadata"]
+        # every row of a child is in the same partition.
+        assert set(part.data_store["Episodes"]["CHILD"]) <= set(
+            part.data_store["Header"]["CHILD"]
+        )
+        header = part.data_store["Header"]
+        assert header.index.tolist() == list(range(len(header)))
+        original = part.to_original({"Header": list(header.index) + [np.nan]})
+        assert original["Header"][:-1] == list(part.labels["Header"])
+        assert np.isnan(original["Header"][-1])
+
+
+def test_merge_runs():
+    runs = [
+        RuleRun(
+            {"Header": [1]},
+            profile=StepProfile("rules", "101", 1.0, 0.5, 100),
+            tables_used={"Header"},
+        ),
+        RuleRun(
+            {"Header": [3], "Episodes": [0]},
+            profile=StepProfile("rules", "101", 2.0, 1.0, 50),
+            tables_used={"Episodes"},
+        ),
+    ]
+
+    merged = merge_runs(runs)
+
+    assert merged.result == {"Header": [1, 3], "Episodes": [0]}
+    assert merged.profile == StepProfile("rules", "101", 3.0, 1.5, 100)
+    assert merged.tables_used == {"Header", "Episodes"}
+    assert merge_runs([RuleRun({}), RuleRun(None)]).result is None
+
+
+def test_run_rules_sharded_failures_on_empty_partitions():
+    data_store = DataStore(
+        {
+            "Header": pd.DataFrame({"CHILD": ["1", "2", "3", "4"]}),
+            "SWEpisodes": pd.DataFrame({"CHILD": ["1"]}),
+            "metadata": {"collection_year": "2024"},
+        }
+    )
+
+    def first_row(dfs):
+        # fails on a table with no rows, like rules reading its first row do.
+        return {"SWEpisodes": [dfs["SWEpisodes"].index[0]]}
+
+    def first_header_row(dfs):
+        return {"Header": [dfs["Header"].index[0]]}
+
+    rules = [
+        RuleDefinition("1", first_row, tables=["SWEpisodes"]),
+        RuleDefinition("2", first_header_row, tables=["Header"]),
+        RuleDefinition("3", first_header_row, tables=["Header"], cross_child=True),
+    ]
+
+    runs = run_rules_sharded(rules, data_store, 4)
+
+    assert runs[0].result == {"SWEpisodes": [0]}
+    assert sorted(runs[1].result["Header"]) == sorted(
+        label
+        for part in partition_datastore(data_store, 4)
+        for label in part.labels["Header"][:1]
+    )
+    assert runs[2].result == {"Header": [0]}
+
+    empty = DataStore({**data_store, "SWEpisodes": data_store["SWEpisodes"][:0]})
+    assert run_rules_sharded(rules[:1], empty, 4)[0].result is None
+
+
+def test_run_rules_sharded_float_locations():
+    data_store = DataStore(
+        {
+            "Header": pd.DataFrame(
+                {"CHILD": ["1", "2", "3", "4"], "SEX": ["1", "2", "2", "1"]},
+                index=[5, 6, 7, 8],
+            ),
+            "metadata": {"collection_year": "2024"},
+        }
+    )
+
+    def float_locations(dfs):
+        header = dfs["Header"]
+        # float labels, as from an index that has been through a merge, and one that is not there.
+        return {
+            "Header": list(header.index[header["SEX"] == "2"].astype(float)) + [99.0]
+        }
+
+    rule = RuleDefinition("1", float_locations, tables=["Header"])
+
+    serial = run_rule(rule, data_store)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        sharded = run_rules_sharded([rule], data_store, 3)[0]
+
+    def flagged(run):
+        errors = ErrorLocations()
+        errors.add(rule.code, "Header", run.result["Header"])
+        return errors.flag_tables(data_store)["Header"]
+
+    assert flagged(sharded).equals(flagged(serial))
+    assert flagged(sharded)["ERR_1"].notna().tolist() == [False, True, True, False]